@@ -0,0 +1,4 @@
+import sys
+from benchmarks.bench import main
+
+sys.exit(main())
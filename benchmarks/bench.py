@@ -0,0 +1,175 @@
+import json
+import platform
+import re
+import sys
+import time
+
+# (name, setup) where setup() returns the function to time
+CASES = []
+# --quick measures for half the default 0.2 s, in more and shorter
+# samples so the best one is still stable, and widens the tolerance
+QUICK_MIN_TIME = 0.1
+QUICK_SAMPLES = 20
+QUICK_TOLERANCE = 0.2
+
+
+def case(name):
+    def register(setup):
+        CASES.append((name, setup))
+        return setup
+    return register
+
+
+def percentile(values, q):
+    # linear interpolation between closest ranks of sorted values
+    if len(values) == 1:
+        return values[0]
+    k = (len(values) - 1) * q / 100
+    i = int(k)
+    if i + 1 >= len(values):
+        return values[-1]
+    return values[i] + (values[i + 1] - values[i]) * (k - i)
+
+
+def measure(func, min_time=0.2, samples=10):
+    # loops per sample are calibrated so that a sample takes about
+    # min_time / samples, slow functions get fewer samples (at least 3)
+    t = time.perf_counter()
+    func()
+    first = time.perf_counter() - t
+    target = min_time / samples
+    if first >= target:
+        loops = 1
+        samples = max(3, min(samples, int(min_time / first)))
+    else:
+        loops = max(1, int(target / max(first, 1e-7)))
+    times = []
+    for _ in range(samples):
+        t = time.perf_counter()
+        for _ in range(loops):
+            func()
+        times.append((time.perf_counter() - t) / loops)
+    times.sort()
+    p50 = percentile(times, 50)
+    return {
+        'ops_per_sec': 1 / p50 if p50 > 0 else float('inf'),
+        'best_ops_per_sec': 1 / times[0] if times[0] > 0 else float('inf'),
+        'mean': sum(times) / len(times),
+        'min': times[0],
+        'p50': p50,
+        'p90': percentile(times, 90),
+        'p99': percentile(times, 99),
+        'max': times[-1],
+        'loops': loops,
+        'samples': samples,
+    }
+
+
+def run(pattern=None, min_time=0.2, samples=10, cases=None, out=None):
+    results = {}
+    for name, setup in CASES if cases is None else cases:
+        if pattern is not None and not re.search(pattern, name):
+            continue
+        results[name] = measure(setup(), min_time, samples)
+        if out is not None:
+            out.write('{:40} {:14.1f} ops/s  p90 {:.3e} s\n'.format(
+                name, results[name]['ops_per_sec'], results[name]['p90']))
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(results, baseline, tolerance=0.3, key='best_ops_per_sec',
+            pattern=None):
+    # [(name, baseline ops/s, current ops/s), ...] for every case that is
+    # slower than (1 - tolerance) * baseline; a case missing on one side
+    # is reported with None for that side, baseline cases not matching
+    # pattern were not run and are left out; the best sample is the least
+    # noisy figure to compare
+    names = set(results['results'])
+    names.update(name for name in baseline['results']
+                 if pattern is None or re.search(pattern, name))
+    regressions = []
+    for name in sorted(names):
+        stats = results['results'].get(name)
+        base = baseline['results'].get(name)
+        if stats is None or base is None:
+            regressions.append((name, None if base is None else base[key],
+                                None if stats is None else stats[key]))
+        elif stats[key] < base[key] * (1 - tolerance):
+            regressions.append((name, base[key], stats[key]))
+    return regressions
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def dump(results, path):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv=None):
+    import argparse
+    import os
+    import benchmarks.cases  # noqa: F401 registers CASES
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('-k', dest='pattern', default=None,
+                        help='only run cases whose name matches this regex')
+    parser.add_argument('-o', '--output',
+                        default=os.path.join(here, 'results.json'),
+                        help='where to write the JSON results')
+    parser.add_argument('--baseline',
+                        default=os.path.join(here, 'baseline.json'),
+                        help='stored results to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help='allowed slowdown against the baseline')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='store these results as the new baseline')
+    parser.add_argument('--quick', action='store_true',
+                        help='shorter measurements, noisier numbers')
+    parser.add_argument('--list', action='store_true',
+                        help='list the cases and exit')
+    args = parser.parse_args(argv)
+    if args.list:
+        for name, _ in CASES:
+            print(name)
+        return 0
+    if args.quick:
+        results = run(args.pattern, QUICK_MIN_TIME, QUICK_SAMPLES,
+                      out=sys.stdout)
+    else:
+        results = run(args.pattern, out=sys.stdout)
+    dump(results, args.output)
+    if args.update_baseline:
+        if args.pattern is not None and os.path.exists(args.baseline):
+            baseline = load(args.baseline)
+            baseline['results'].update(results['results'])
+            results['results'] = baseline['results']
+        dump(results, args.baseline)
+        print('baseline written to {}'.format(args.baseline))
+        return 0
+    if not os.path.exists(args.baseline):
+        print('no baseline at {}'.format(args.baseline))
+        return 0
+    tolerance = args.tolerance
+    if args.quick:
+        tolerance += QUICK_TOLERANCE
+    regressions = compare(results, load(args.baseline), tolerance,
+                          pattern=args.pattern)
+    for name, base, current in regressions:
+        if base is None:
+            print('MISSING    {:40} not in the baseline'.format(name))
+        elif current is None:
+            print('MISSING    {:40} not measured'.format(name))
+        else:
+            print('REGRESSION {:40} {:14.1f} -> {:14.1f} ops/s ({:+.0%})'
+                  .format(name, base, current, current / base - 1))
+    return 1 if regressions else 0
@@ -0,0 +1,252 @@
+import random
+from benchmarks.bench import case
+from ed25519.ed25519 import B
+from ed25519.ed25519 import DecodePoint
+from ed25519.ed25519 import Sign
+from ed25519.ed25519 import SigningKey
+from ed25519.ed25519 import Verify
+from ed25519.ed25519 import VerifyingKey
+from ed25519.ed25519 import _decode_point
+from ed25519.ed25519 import verify_batch
+from hmac.drbg import HmacDRBG
+from hmac.hmac_sha256 import HMAC
+from hmac.hmac_sha256 import hmac_sha256
+from hmac.kdf import pbkdf2_sha256
+from ipynb import ecdsa
+from ipynb.ecc import ECCPoint
+from ipynb.ecc import G
+from ipynb.ecc import S256FF
+from ipynb.ecc import S256P
+from ipynb.ecc import ripemd160
+from ipynb.ecc import sha256
+from ipynb.ff import FiniteField
+from ipynb.ff import batch_inverse
+from ipynb.polynomial import Polynomial
+from ipynb.sss import recover
+from ipynb.sss import share
+
+# fixed inputs, so every run times the same work
+_random = random.Random(1)
+PRIME = 9999991
+NTT_PRIME = 998244353
+SCALAR = _random.randrange(1, S256P.N)
+SECRET = bytes(range(32))
+MESSAGE = b'benchmark message'
+
+
+@case('ff.FiniteField.add')
+def _():
+    a = FiniteField(1234567, PRIME)
+    b = FiniteField(7654321, PRIME)
+    return lambda: a + b
+
+
+@case('ff.FiniteField.mul')
+def _():
+    a = FiniteField(1234567, PRIME)
+    b = FiniteField(7654321, PRIME)
+    return lambda: a * b
+
+
+@case('ff.FiniteField.pow')
+def _():
+    a = FiniteField(1234567, PRIME)
+    return lambda: a ** 65537
+
+
+@case('ff.FiniteField.truediv')
+def _():
+    a = FiniteField(1234567, PRIME)
+    b = FiniteField(7654321, PRIME)
+    return lambda: a / b
+
+
+@case('ff.batch_inverse[100]')
+def _():
+    elements = [FiniteField(_random.randrange(1, PRIME), PRIME)
+                for _ in range(100)]
+    return lambda: batch_inverse(elements)
+
+
+@case('ecc.S256FF.mul')
+def _():
+    a = S256FF(_random.randrange(S256FF.P))
+    b = S256FF(_random.randrange(S256FF.P))
+    return lambda: a * b
+
+
+@case('ecc.S256FF.inverse')
+def _():
+    a = S256FF(_random.randrange(1, S256FF.P))
+    return lambda: a.inverse()
+
+
+@case('ecc.ECCPoint.rmul')
+def _():
+    P = ECCPoint(S256FF(G.x.num), S256FF(G.y.num), S256FF(0), S256FF(7))
+    return lambda: SCALAR * P
+
+
+@case('ecc.S256P.rmul[G]')
+def _():
+    return lambda: SCALAR * G
+
+
+@case('ecc.S256P.rmul[P]')
+def _():
+    P = (12345 * G).normalize()
+    return lambda: SCALAR * P
+
+
+@case('ecc.S256P.multi_mul[2]')
+def _():
+    P = (12345 * G).normalize()
+    return lambda: S256P.multi_mul([SCALAR, SCALAR // 3], [G, P])
+
+
+@case('ecc.S256P.parse')
+def _():
+    sec = (12345 * G).sec()
+    return lambda: S256P.parse(sec)
+
+
+@case('ecdsa.sign')
+def _():
+    return lambda: ecdsa.sign(SCALAR, 0x1234)
+
+
+@case('ecdsa.verify')
+def _():
+    pubkey = SCALAR * G
+    sig = ecdsa.sign(SCALAR, 0x1234)
+    return lambda: ecdsa.verify(pubkey, 0x1234, sig)
+
+
+@case('ed25519.Sign')
+def _():
+    return lambda: Sign(SECRET, MESSAGE)
+
+
+@case('ed25519.SigningKey.sign')
+def _():
+    key = SigningKey(SECRET)
+    return lambda: key.sign(MESSAGE)
+
+
+@case('ed25519.Verify')
+def _():
+    # a hot key: cached and with its window table
+    key = SigningKey(SECRET)
+    signature = key.sign(MESSAGE)
+    for _ in range(VerifyingKey.TABLE_THRESHOLD):
+        Verify(key.A, signature, MESSAGE)
+    return lambda: Verify(key.A, signature, MESSAGE)
+
+
+@case('ed25519.VerifyingKey.verify[no table]')
+def _():
+    key = SigningKey(SECRET)
+    signature = key.sign(MESSAGE)
+    vk = VerifyingKey(key.public, table=False)
+    return lambda: vk.verify(signature, MESSAGE)
+
+
+@case('ed25519.verify_batch[16]')
+def _():
+    entries = []
+    for i in range(16):
+        key = SigningKey(bytes([i]) * 32)
+        entries.append((key.A, key.sign(MESSAGE), MESSAGE))
+    return lambda: verify_batch(entries)
+
+
+@case('ed25519.DecodePoint')
+def _():
+    # the uncached decoder, the LRU would hide the work
+    encoded = (12345 * B).encode()
+    return lambda: _decode_point.__wrapped__(encoded)
+
+
+@case('ed25519.DecodePoint[cached]')
+def _():
+    encoded = (12345 * B).encode()
+    return lambda: DecodePoint(encoded)
+
+
+def _hash_case(name, cls, size):
+    @case('ecc.{}[{}]'.format(name, size))
+    def _():
+        msg = bytes(_random.getrandbits(8) for _ in range(size))
+        return lambda: cls().Digest(msg)
+
+
+for size in [64, 1024, 16384]:
+    _hash_case('sha256', sha256, size)
+    _hash_case('ripemd160', ripemd160, size)
+
+
+@case('hmac.hmac_sha256[64]')
+def _():
+    return lambda: hmac_sha256(SECRET, MESSAGE * 4)
+
+
+@case('hmac.HMAC.mac[64]')
+def _():
+    mac = HMAC(SECRET)
+    return lambda: mac.mac(MESSAGE * 4)
+
+
+@case('hmac.HMAC.mac[1048576]')
+def _():
+    mac = HMAC(SECRET)
+    data = bytes(1 << 20)
+    return lambda: mac.mac(data)
+
+
+@case('hmac.pbkdf2_sha256[1000]')
+def _():
+    return lambda: pbkdf2_sha256(b'password', b'salt', 1000)
+
+
+@case('hmac.HmacDRBG.generate_scalars[100]')
+def _():
+    drbg = HmacDRBG(SECRET)
+    return lambda: drbg.generate_scalars(100, S256P.N)
+
+
+@case('polynomial.mul[256]')
+def _():
+    a = Polynomial([_random.randrange(NTT_PRIME) for _ in range(256)],
+                   NTT_PRIME)
+    b = Polynomial([_random.randrange(NTT_PRIME) for _ in range(256)],
+                   NTT_PRIME)
+    return lambda: a * b
+
+
+def _sss_case(n):
+    @case('sss.share[{}]'.format(n))
+    def _():
+        return lambda: share(1234567, n, n, PRIME)
+
+    @case('sss.recover[{}]'.format(n))
+    def _():
+        shares = share(1234567, n, n, PRIME)
+        return lambda: recover(shares, PRIME)
+
+
+for n in [3, 10, 50, 200]:
+    _sss_case(n)
+
+try:
+    from ipynb.fieldarray import FieldArray
+except ImportError:
+    FieldArray = None
+
+if FieldArray is not None:
+    @case('fieldarray.mul[100000]')
+    def _():
+        a = FieldArray([_random.randrange(PRIME) for _ in range(100000)],
+                       PRIME)
+        b = FieldArray([_random.randrange(PRIME) for _ in range(100000)],
+                       PRIME)
+        return lambda: a * b
@@ -0,0 +1,31 @@
+from ed25519.ed25519 import Ed25519P
+from ed25519.ed25519 import Ed25519EP
+from ed25519.ed25519 import Ed25519BaseTable
+from ed25519.ed25519 import B
+from ed25519.ed25519 import DecodePoint
+from ed25519.ed25519 import SigningKey
+from ed25519.ed25519 import Sign
+from ed25519.ed25519 import Verify
+from ed25519.ed25519 import VerifyingKey
+from ed25519.ed25519 import verifying_key
+from ed25519.ed25519 import verify_batch
+from ed25519.ed25519 import base_table
+from ed25519.ed25519 import load_base_table
+from ed25519.ed25519 import selftest
+
+__all__ = [
+    'Ed25519P',
+    'Ed25519EP',
+    'Ed25519BaseTable',
+    'B',
+    'DecodePoint',
+    'SigningKey',
+    'Sign',
+    'Verify',
+    'VerifyingKey',
+    'verifying_key',
+    'verify_batch',
+    'base_table',
+    'load_base_table',
+    'selftest',
+]
@@ -0,0 +1,12 @@
+import argparse
+import sys
+from ed25519.ed25519 import selftest
+
+parser = argparse.ArgumentParser(prog='python -m ed25519')
+parser.add_argument('--selftest', action='store_true',
+                    help='run the RFC 8032 test vectors')
+args = parser.parse_args()
+if not args.selftest:
+    parser.print_help()
+    sys.exit(2)
+sys.exit(0 if selftest() else 1)
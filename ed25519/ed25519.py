@@ -1,114 +1,393 @@
+import functools
 import hashlib
+import os
+from ipynb.ff import _batch_inv
+from msm.msm import multi_scalar_mul
 
 
 class Ed25519P():
     p = 2**255 - 19
     L = 2**252 + 27742317777372353535851937790883648493
-    d = (-121665 * pow(121666, p-2, p)) % p
+    # d = -121665/121666
+    d = 0x52036cee2b6ffe738cc740797779e89800700a4d4141d8ab75eb4dca135978a3
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, check=True):
         if x is None or y is None:
             raise ValueError("x or y are None")
         self.x = x % self.p
         self.y = y % self.p
         # : −x^2 + y^2 = 1 + dx^2y^2
-        if (-1 * pow(self.x, 2, self.p) + pow(self.y, 2, self.p)) % self.p != (1 + self.d * pow(self.x, 2, self.p) * pow(self.y, 2, self.p)) % self.p:
+        if check and (-1 * pow(self.x, 2, self.p) + pow(self.y, 2, self.p)) % self.p != (1 + self.d * pow(self.x, 2, self.p) * pow(self.y, 2, self.p)) % self.p:
             raise ValueError("x and y are not on the curve")
 
     def __add__(self, other):
-        x1 = self.x
-        y1 = self.y
-        x2 = other.x
-        y2 = other.y
-        #        x1y2 + x2y1
-        # x3 = ---------------
-        #       1 + dx1x2y1y2
-        x3 = ((x1*y2 + x2*y1) * pow((1 + self.d*x1*x2*y1*y2) %
-                                    self.p, self.p-2, self.p)) % self.p
-        #        y1y2 + x1x2
-        # y3 = ---------------
-        #       1 − dx1x2y1y2
-        y3 = ((y1*y2 + x1*x2) * pow((1 - self.d*x1*x2*y1*y2) %
-                                    self.p, self.p-2, self.p)) % self.p
-        return self.__class__(x3, y3)
+        return (self.extended() + other.extended()).affine()
 
     def __sub__(self, other):
-        return self + other.__class__(self.p - self.x, self.y)
+        return self + other.__class__(self.p - other.x, other.y)
+
+    def __rmul__(self, coefficient):
+        if self == B:
+            return base_table().mul(coefficient).affine()
+        return (coefficient * self.extended()).affine()
+
+    def __eq__(self, other):
+        return (self.x == other.x) and (self.y == other.y)
+
+    def __str__(self):
+        return '({:064x},{:064x})'.format(self.x, self.y)
+
+    def encode(self):
+        return int.to_bytes(self.y | ((self.x & 1) << 255), 32, 'little')
+
+    def extended(self):
+        return Ed25519EP(self.x, self.y, 1, (self.x * self.y) % self.p)
+
+
+class Ed25519EP():
+    # extended twisted Edwards coordinates (X:Y:Z:T)
+    # x = X/Z, y = Y/Z, x*y = T/Z
+    p = Ed25519P.p
+    L = Ed25519P.L
+    d2 = (2 * Ed25519P.d) % p
+
+    def __init__(self, X, Y, Z, T):
+        self.X = X
+        self.Y = Y
+        self.Z = Z
+        self.T = T
+
+    def __add__(self, other):
+        p = self.p
+        # add-2008-hwcd-3
+        A = ((self.Y - self.X) * (other.Y - other.X)) % p
+        B = ((self.Y + self.X) * (other.Y + other.X)) % p
+        C = (self.T * self.d2 * other.T) % p
+        D = (2 * self.Z * other.Z) % p
+        E, F, G, H = B - A, D - C, D + C, B + A
+        return self.__class__((E*F) % p, (G*H) % p, (F*G) % p, (E*H) % p)
+
+    def madd(self, ypx, ymx, xy2d):
+        p = self.p
+        # add-2008-hwcd-3 with an affine (y+x, y-x, 2dxy) second operand
+        A = ((self.Y - self.X) * ymx) % p
+        B = ((self.Y + self.X) * ypx) % p
+        C = (self.T * xy2d) % p
+        D = 2 * self.Z
+        E, F, G, H = B - A, D - C, D + C, B + A
+        return self.__class__((E*F) % p, (G*H) % p, (F*G) % p, (E*H) % p)
+
+    def __neg__(self):
+        return self.__class__((self.p - self.X) % self.p, self.Y,
+                              self.Z, (self.p - self.T) % self.p)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def double(self):
+        p = self.p
+        # dbl-2008-hwcd
+        A = (self.X * self.X) % p
+        B = (self.Y * self.Y) % p
+        C = (2 * self.Z * self.Z) % p
+        H = A + B
+        E = (H - (self.X + self.Y) * (self.X + self.Y)) % p
+        G = A - B
+        F = C + G
+        return self.__class__((E*F) % p, (G*H) % p, (F*G) % p, (E*H) % p)
 
     def __rmul__(self, coefficient):
         coef = coefficient % self.L
-        current = self.__class__(self.x, self.y)
-        result = self.__class__(0, 1)
+        current = self
+        result = self.__class__(0, 1, 1, 0)
         while coef:
             if coef & 1:
                 result += current
-            current += current
+            current = current.double()
             coef >>= 1
         return result
 
     def __eq__(self, other):
-        return (self.x == other.x) and (self.y == other.y)
+        # X1/Z1 == X2/Z2 and Y1/Z1 == Y2/Z2 without inversion
+        return (self.X * other.Z - other.X * self.Z) % self.p == 0 and \
+            (self.Y * other.Z - other.Y * self.Z) % self.p == 0
 
-    def __str__(self):
-        return '({:064x},{:064x})'.format(self.x, self.y)
+    def affine(self):
+        zi = pow(self.Z, self.p-2, self.p)
+        return Ed25519P(self.X * zi, self.Y * zi, check=False)
 
-    def encode(self):
-        return int.to_bytes(self.y | ((self.x & 1) << 255), 32, 'little')
+
+DECODE_CACHE = 1024
+# sqrt(-1) = 2^((p-1)/4)
+SQRT_M1 = pow(2, (Ed25519P.p-1) // 4, Ed25519P.p)
 
 
 def DecodePoint(encode_point):
     if len(encode_point) != 32:
         raise ValueError("invalid length of encode point")
+    return _decode_point(bytes(encode_point))
+
+
+@functools.lru_cache(maxsize=DECODE_CACHE)
+def _decode_point(encode_point):
+    p = Ed25519P.p
     y = int.from_bytes(encode_point, 'little')
     sign = y >> 255
     y &= (1 << 255) - 1
-    # x^2 = (y^2−1)/(dy^2+1)
-    x2 = ((y*y-1)
-          * pow(Ed25519P.d*y*y+1, Ed25519P.p-2, Ed25519P.p)) % Ed25519P.p
-    if x2 == 0:
-        if sign:
-            raise ValueError("invalid sign of encode point")
-    # x = ±√(y^2−1)/(dy^2+1)
-    x = pow(x2, (Ed25519P.p+3) // 8, Ed25519P.p)
-    if (x*x - x2) % Ed25519P.p != 0:
-        x = (x * pow(2, (Ed25519P.p-1) // 4, Ed25519P.p)) % Ed25519P.p
-        if (x*x - x2) % Ed25519P.p != 0:
+    # RFC 8032 5.1.3: only the canonical encoding with y < p
+    if y >= p:
+        raise ValueError("invalid y of encode point")
+    # x^2 = u/v = (y^2−1)/(dy^2+1)
+    u = (y*y - 1) % p
+    v = (Ed25519P.d*y*y + 1) % p
+    # x = ±√(u/v) = u*v^3*(u*v^7)^((p-5)/8), one exponentiation
+    v3 = (v*v*v) % p
+    x = (u * v3 * pow(u * v3 * v3 * v, (p-5) // 8, p)) % p
+    vx2 = (v*x*x) % p
+    if vx2 != u:
+        if vx2 != p - u:
             raise ValueError("invalid square of encode point")
+        x = (x * SQRT_M1) % p
+    if x == 0 and sign:
+        raise ValueError("invalid sign of encode point")
     if (x & 1) != sign:
-        x = Ed25519P.p - x
-    return Ed25519P(x, y)
+        x = p - x
+    # v*x^2 == u already puts (x, y) on the curve
+    return Ed25519P(x, y, check=False)
 
 
-By = (4*pow(5, Ed25519P.p-2, Ed25519P.p)) % Ed25519P.p
-B = DecodePoint(By.to_bytes(32, 'little'))
+# B = (x, 4/5) with x even
+By = 0x6666666666666666666666666666666666666666666666666666666666666658
+B = Ed25519P(
+    0x216936d3cd6e53fec0a4e231fdd6dc5c692cc7609525a7b2c9562d608f25d51a,
+    By)
+
+
+class Ed25519BaseTable():
+    # rows[i][j-1] = j * 16^i * B for i in 0..63, j in 1..8,
+    # kept as (y+x, y-x, 2dxy) for mixed addition
+    ROWS = 64
+    COLS = 8
+    # SHA-256 of to_bytes() of the table of B
+    DIGEST = 'e2f3912c26be8f5e85ce98e74a5adc2e' \
+        '4ebd703eb017773c85a050e68b05ab11'
+
+    def __init__(self, points, keep_points=True):
+        if len(points) != self.ROWS * self.COLS:
+            raise ValueError("invalid number of table points")
+        p = Ed25519P.p
+        d2 = Ed25519EP.d2
+        self.rows = []
+        for i in range(self.ROWS):
+            row = []
+            for x, y in points[i*self.COLS:(i+1)*self.COLS]:
+                row.append(((y + x) % p, (y - x) % p, (d2 * x * y) % p))
+            self.rows.append(row)
+        # the affine points are only needed by to_bytes()
+        self.points = points if keep_points else None
+
+    @classmethod
+    def build(cls, base=None, keep_points=True):
+        if base is None:
+            base = B
+        P = base.extended()
+        extended = []
+        for _ in range(cls.ROWS):
+            Q = P
+            for _ in range(cls.COLS):
+                extended.append(Q)
+                Q = Q + P
+            P = P.double().double().double().double()
+        p = Ed25519P.p
+        zi = _batch_inv([Q.Z for Q in extended], p)
+        points = [((Q.X * z) % p, (Q.Y * z) % p)
+                  for Q, z in zip(extended, zi)]
+        return cls(points, keep_points)
+
+    @classmethod
+    def from_bytes(cls, blob):
+        if len(blob) != cls.ROWS * cls.COLS * 64:
+            raise ValueError("invalid length of base table")
+        # every entry is trusted by mul, so only the canonical table of B
+        # is accepted
+        if hashlib.sha256(blob).hexdigest() != cls.DIGEST:
+            raise ValueError("invalid base table")
+        points = []
+        for i in range(0, len(blob), 64):
+            points.append((int.from_bytes(blob[i:i+32], 'little'),
+                           int.from_bytes(blob[i+32:i+64], 'little')))
+        return cls(points)
+
+    def to_bytes(self):
+        if self.points is None:
+            raise ValueError("base table built without points")
+        blob = bytearray()
+        for x, y in self.points:
+            blob += x.to_bytes(32, 'little') + y.to_bytes(32, 'little')
+        return bytes(blob)
+
+    def mul(self, coefficient):
+        coef = coefficient % Ed25519P.L
+        # radix-16 digits recoded into -8..8
+        e = [(coef >> (4*i)) & 15 for i in range(self.ROWS)]
+        for i in range(self.ROWS - 1):
+            carry = (e[i] + 8) >> 4
+            e[i] -= carry << 4
+            e[i+1] += carry
+        p = Ed25519P.p
+        result = Ed25519EP(0, 1, 1, 0)
+        for i in range(self.ROWS):
+            if e[i] > 0:
+                result = result.madd(*self.rows[i][e[i]-1])
+            elif e[i] < 0:
+                ypx, ymx, xy2d = self.rows[i][-e[i]-1]
+                result = result.madd(ymx, ypx, p - xy2d)
+        return result
+
+
+_base_table = None
+
+
+def base_table():
+    global _base_table
+    if _base_table is None:
+        _base_table = Ed25519BaseTable.build()
+    return _base_table
+
+
+def load_base_table(blob):
+    global _base_table
+    _base_table = Ed25519BaseTable.from_bytes(blob)
+    return _base_table
+
+
+class SigningKey():
+    # the expanded secret: clamped scalar s, prefix and public key A
+    def __init__(self, secret):
+        if len(secret) != 32:
+            raise ValueError("invalid length of secret")
+        h = hashlib.sha512(secret).digest()
+        b = (h[0] & 0xf8).to_bytes(1, byteorder='little') + \
+            h[1:31] + \
+            ((h[31] & 0x7f) | 0x40).to_bytes(1, byteorder='little')
+        self.secret = secret
+        self.s = int.from_bytes(b, 'little')
+        self.prefix = h[32:]
+        self.A = self.s*B
+        self.public = self.A.encode()
+
+    def sign(self, m):
+        r = int.from_bytes(hashlib.sha512(self.prefix + m).digest(), 'little')
+        R = (r*B).encode()
+        k = int.from_bytes(hashlib.sha512(
+            R + self.public + m).digest(), 'little')
+        S = (r + k * self.s) % Ed25519P.L
+        return R + S.to_bytes(32, 'little')
 
 
 def Sign(secret, m):
-    if len(secret) != 32:
-        raise ValueError("invalid length of secret")
-    h = hashlib.sha512(secret).digest()
-    b = (h[0] & 0xf8).to_bytes(1, byteorder='little') + \
-        h[1:31] + \
-        ((h[31] & 0x7f) | 0x40).to_bytes(1, byteorder='little')
-    s = int.from_bytes(b, 'little')
-    A = s*B
-    prefix = h[32:]
-    r = int.from_bytes(hashlib.sha512(prefix + m).digest(), 'little')
-    R = r*B
-    k = int.from_bytes(hashlib.sha512(
-        R.encode() + A.encode() + m).digest(), 'little')
-    S = (r + k * s) % Ed25519P.L
-    return R.encode() + S.to_bytes(32, 'little')
+    return SigningKey(secret).sign(m)
+
+
+class VerifyingKey():
+    # a decoded public key with its encoding and, once it is used
+    # TABLE_THRESHOLD times (or table=True), a window table for H*A
+    TABLE_THRESHOLD = 4
+
+    def __init__(self, public, table=None):
+        if isinstance(public, Ed25519P):
+            self.A = public
+            self.public = public.encode()
+        else:
+            self.A = DecodePoint(public)
+            self.public = bytes(public)
+        self.table = Ed25519BaseTable.build(self.A, False) if table else None
+        self.auto = table is None
+        self.count = 0
+
+    def verify(self, signature, m):
+        if len(signature) != 64:
+            raise ValueError("invalid length of signature")
+        R = DecodePoint(signature[:32])
+        S = int.from_bytes(signature[32:], 'little')
+        H = int.from_bytes(hashlib.sha512(
+            signature[:32] + self.public + m).digest(), 'little') % Ed25519P.L
+        if self.table is None:
+            self.count += 1
+            if self.auto and self.count >= self.TABLE_THRESHOLD:
+                self.table = Ed25519BaseTable.build(self.A, False)
+        # [8][S]B = [8]R + [8][H]A
+        if self.table is None:
+            return 8*base_table().mul(S) == multi_scalar_mul(
+                [8, 8*H], [R.extended(), self.A.extended()])
+        P = base_table().mul(S) - self.table.mul(H) - R.extended()
+        return 8*P == Ed25519EP(0, 1, 1, 0)
+
+
+# a key's window table (rows only) takes about 130 KB, so a full cache
+# of keys with tables holds about 34 MB
+VERIFYING_KEY_CACHE = 256
+
+
+@functools.lru_cache(maxsize=VERIFYING_KEY_CACHE)
+def verifying_key(public):
+    # VerifyingKey by encoded public key, statistics in cache_info()
+    return VerifyingKey(public)
 
 
 def Verify(A, signature, m):
-    if len(signature) != 64:
-        raise ValueError("invalid length of signature")
-    R = DecodePoint(signature[:32])
-    S = int.from_bytes(signature[32:], 'little')
-    H = int.from_bytes(hashlib.sha512(
-        R.encode() + A.encode() + m).digest(), 'little')
-    return 8*S*B == 8*R + 8*H*A
+    if not isinstance(A, VerifyingKey):
+        A = verifying_key(A.encode())
+    return A.verify(signature, m)
+
+
+def _verify_batch(items):
+    # 8 * (sum(z*S)*B - sum(z*R) - sum(z*H*A)) == 0 for random 128-bit z
+    L = Ed25519P.L
+    s = 0
+    scalars = []
+    points = []
+    for R, S, H, A in items:
+        z = int.from_bytes(os.urandom(16), 'little')
+        s += z * S
+        scalars += [z, (z * H) % L]
+        points += [-R.extended(), -A.extended()]
+    P = base_table().mul(s) + multi_scalar_mul(scalars, points)
+    return 8*P == Ed25519EP(0, 1, 1, 0)
+
+
+def verify_batch(entries):
+    # entries: [(A, signature, m), ...] -> [bool, ...]
+    # malformed signatures are reported as False instead of raising
+    results = [False] * len(entries)
+    items = []
+    indexes = []
+    for i, (A, signature, m) in enumerate(entries):
+        if isinstance(A, VerifyingKey):
+            A = A.A
+        if len(signature) != 64:
+            continue
+        try:
+            R = DecodePoint(signature[:32])
+        except ValueError:
+            continue
+        S = int.from_bytes(signature[32:], 'little')
+        H = int.from_bytes(hashlib.sha512(
+            signature[:32] + A.encode() + m).digest(), 'little')
+        items.append((R, S, H, A))
+        indexes.append(i)
+    stack = [(0, len(items))]
+    while stack:
+        lo, hi = stack.pop()
+        if lo == hi:
+            continue
+        if _verify_batch(items[lo:hi]):
+            for i in indexes[lo:hi]:
+                results[i] = True
+        elif hi - lo > 1:
+            mid = (lo + hi) // 2
+            stack += [(lo, mid), (mid, hi)]
+    return results
 
 
 Ed25519_TEST_VECTOR = [
@@ -261,16 +540,18 @@ Ed25519_TEST_VECTOR = [
 ]
 
 
-for test in Ed25519_TEST_VECTOR:
-    NAME = test[0]
-    SECRET_KEY = test[1]
-    PUBLIC_KEY = test[2]
-    MESSAGE = test[3]
-    SIGNATURE = test[4]
-    A = DecodePoint(bytes.fromhex(PUBLIC_KEY))
-    print('{:15}'.format(NAME),
-          Sign(bytes.fromhex(SECRET_KEY),
-               bytes.fromhex(MESSAGE)).hex() == SIGNATURE,
-          A.encode().hex() == PUBLIC_KEY,
-          Verify(A, bytes.fromhex(SIGNATURE),
-                 bytes.fromhex(MESSAGE)))
+def selftest(verbose=True):
+    # RFC 8032 7.1 test vectors: sign, encode and verify
+    ok = True
+    for NAME, SECRET_KEY, PUBLIC_KEY, MESSAGE, SIGNATURE in \
+            Ed25519_TEST_VECTOR:
+        A = DecodePoint(bytes.fromhex(PUBLIC_KEY))
+        result = [Sign(bytes.fromhex(SECRET_KEY),
+                       bytes.fromhex(MESSAGE)).hex() == SIGNATURE,
+                  A.encode().hex() == PUBLIC_KEY,
+                  Verify(A, bytes.fromhex(SIGNATURE),
+                         bytes.fromhex(MESSAGE))]
+        if verbose:
+            print('{:15}'.format(NAME), *result)
+        ok = ok and all(result)
+    return ok
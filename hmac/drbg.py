@@ -0,0 +1,65 @@
+from hmac.hmac_sha256 import HMAC
+
+
+class HmacDRBG():
+    # NIST SP 800-90A 10.1.2 HMAC_DRBG with SHA-256, no prediction
+    # resistance; K is kept as a keyed HMAC context
+    outlen = 32
+    reseed_interval = 1 << 48
+    max_request_bits = 1 << 19
+
+    def __init__(self, entropy, nonce=b'', personalization=b''):
+        self.V = b'\x01' * self.outlen
+        self.K = HMAC(b'\x00' * self.outlen)
+        self.update(entropy + nonce + personalization)
+        self.reseed_counter = 1
+
+    def update(self, provided=b''):
+        # K = HMAC(K, V || 0x00 || provided), V = HMAC(K, V)
+        # and again with 0x01 if provided is not empty
+        self.K = HMAC(self.K.mac(self.V + b'\x00' + provided))
+        self.V = self.K.mac(self.V)
+        if provided:
+            self.K = HMAC(self.K.mac(self.V + b'\x01' + provided))
+            self.V = self.K.mac(self.V)
+
+    def reseed(self, entropy, additional=b''):
+        self.update(entropy + additional)
+        self.reseed_counter = 1
+
+    def generate(self, nbytes, additional=b''):
+        if self.reseed_counter > self.reseed_interval:
+            raise RuntimeError('The generator must be reseeded.')
+        if nbytes * 8 > self.max_request_bits:
+            raise ValueError('The request is too large.')
+        if additional:
+            self.update(additional)
+        mac = self.K.mac
+        V = self.V
+        blocks = []
+        for _ in range(-(-nbytes // self.outlen)):
+            V = mac(V)
+            blocks.append(V)
+        self.V = V
+        self.update(additional)
+        self.reseed_counter += 1
+        return b''.join(blocks)[:nbytes]
+
+    def generate_scalars(self, n, order):
+        # n integers in [1, order) by rejection sampling of the leftmost
+        # bits of rlen-byte candidates (bits2int of RFC 6979 2.3.2)
+        if order < 2:
+            raise ValueError('The order must be at least 2.')
+        qlen = order.bit_length()
+        rlen = (qlen + 7) // 8
+        shift = rlen * 8 - qlen
+        # as many candidates per request as the request limit allows
+        limit = self.max_request_bits // 8 // rlen
+        scalars = []
+        while len(scalars) < n:
+            buf = self.generate(min(n - len(scalars), limit) * rlen)
+            for i in range(0, len(buf), rlen):
+                k = int.from_bytes(buf[i:i+rlen], 'big') >> shift
+                if 1 <= k < order:
+                    scalars.append(k)
+        return scalars
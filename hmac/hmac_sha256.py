@@ -1,22 +1,96 @@
 import hashlib
+import mmap
 
+BLOCK_SIZE = 64
+# read size for file objects
+CHUNK_SIZE = 1 << 20
+# byte -> byte ^ 0x36 / byte ^ 0x5c
+IPAD = bytes(b ^ 0x36 for b in range(256))
+OPAD = bytes(b ^ 0x5c for b in range(256))
 
-def hmac_sha256(key, data):
-    ipad = bytearray([0] * 64)
-    opad = bytearray([0] * 64)
-    k = bytearray([0] * 32)
-    if len(key) <= len(k):
-        for i in range(len(key)):
-            k[i] = key[i]
+
+def _feed(h, data):
+    # buffers are hashed in place, file objects in CHUNK_SIZE reads and
+    # anything else as an iterable of buffers
+    if isinstance(data, bytes):
+        h.update(data)
+        return
+    try:
+        view = memoryview(data)
+    except TypeError:
+        view = None
+    if view is not None:
+        with view:
+            h.update(view)
+    elif hasattr(data, 'readinto'):
+        buf = bytearray(CHUNK_SIZE)
+        view = memoryview(buf)
+        n = data.readinto(buf)
+        while n:
+            h.update(view[:n])
+            n = data.readinto(buf)
+    elif hasattr(data, 'read'):
+        for chunk in iter(lambda: data.read(CHUNK_SIZE), b''):
+            h.update(chunk)
     else:
-        k = hashlib.sha256(key).digest()
-    for i in range(32):
-        ipad[i] = k[i]
-        opad[i] = k[i]
-    for i in range(64):
-        ipad[i] ^= 0x36
-        opad[i] ^= 0x5c
-    # H(K XOR opad, H(K XOR ipad, text))
-    digest = hashlib.sha256(ipad + data).digest()
-    digest = hashlib.sha256(opad + digest).digest()
-    return digest
+        for chunk in data:
+            h.update(chunk)
+
+
+class HMAC():
+    # H(K XOR opad, H(K XOR ipad, text)) with both pads hashed once
+    digest_size = 32
+    block_size = BLOCK_SIZE
+
+    def __init__(self, key, msg=None):
+        # keys longer than the block size are hashed (RFC 2104)
+        if len(key) > BLOCK_SIZE:
+            key = hashlib.sha256(key).digest()
+        key = bytes(key).ljust(BLOCK_SIZE, b'\x00')
+        self.ikey = hashlib.sha256(key.translate(IPAD))
+        self.okey = hashlib.sha256(key.translate(OPAD))
+        self.inner = self.ikey.copy()
+        if msg is not None:
+            self.update(msg)
+
+    def update(self, msg):
+        _feed(self.inner, msg)
+        return self
+
+    def copy(self):
+        other = self.__class__.__new__(self.__class__)
+        other.ikey = self.ikey
+        other.okey = self.okey
+        other.inner = self.inner.copy()
+        return other
+
+    def digest(self):
+        outer = self.okey.copy()
+        outer.update(self.inner.digest())
+        return outer.digest()
+
+    def hexdigest(self):
+        return self.digest().hex()
+
+    def mac(self, data):
+        # one message from the keyed midstates, the context is unchanged
+        inner = self.ikey.copy()
+        _feed(inner, data)
+        outer = self.okey.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+
+def hmac_sha256(key, data):
+    return HMAC(key).mac(data)
+
+
+def hmac_file(key, path):
+    # the file is mapped instead of read into memory
+    mac = HMAC(key)
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        if size == 0:
+            return mac.digest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return mac.mac(m)
@@ -0,0 +1,57 @@
+from hmac.hmac_sha256 import HMAC
+
+
+def pbkdf2_sha256(password, salt, iterations, dklen=None):
+    # RFC 8018 5.2: T_i = U_1 ^ U_2 ^ ... ^ U_c,
+    # U_1 = PRF(P, S || INT(i)), U_j = PRF(P, U_{j-1})
+    if iterations < 1:
+        raise ValueError('The iterations must be positive.')
+    if dklen is None:
+        dklen = HMAC.digest_size
+    if not 0 < dklen <= 0xffffffff * HMAC.digest_size:
+        raise ValueError('The derived key length is out of range.')
+    prf = HMAC(password)
+    ikey = prf.ikey
+    okey = prf.okey
+    dk = b''
+    i = 1
+    while len(dk) < dklen:
+        u = prf.mac(salt + i.to_bytes(4, 'big'))
+        t = int.from_bytes(u, 'big')
+        for _ in range(iterations - 1):
+            inner = ikey.copy()
+            inner.update(u)
+            outer = okey.copy()
+            outer.update(inner.digest())
+            u = outer.digest()
+            t ^= int.from_bytes(u, 'big')
+        dk += t.to_bytes(HMAC.digest_size, 'big')
+        i += 1
+    return dk[:dklen]
+
+
+def hkdf_extract(salt, ikm):
+    # PRK = HMAC-Hash(salt, IKM), salt defaults to HashLen zeros
+    if not salt:
+        salt = bytes(HMAC.digest_size)
+    return HMAC(salt).mac(ikm)
+
+
+def hkdf_expand(prk, info, length):
+    # T(i) = HMAC-Hash(PRK, T(i-1) | info | i)
+    if not 0 <= length <= 255 * HMAC.digest_size:
+        raise ValueError('The output length is out of range.')
+    prf = HMAC(prk)
+    okm = b''
+    t = b''
+    i = 1
+    while len(okm) < length:
+        t = prf.mac(t + info + bytes([i]))
+        okm += t
+        i += 1
+    return okm[:length]
+
+
+def hkdf_sha256(ikm, salt=None, info=b'', length=32):
+    # RFC 5869
+    return hkdf_expand(hkdf_extract(salt, ikm), info, length)
@@ -1,7 +1,12 @@
-import copy
+import struct
+from ipynb.ff import _batch_inv
+from ipynb.ff import batch_div  # noqa: F401 re-exported
+from ipynb.ff import batch_inverse  # noqa: F401 re-exported
 
 
 class FiniteField:
+    __slots__ = ('num', 'prime')
+
     def __init__(self, num, prime):
         self.prime = prime
         self.num = num % prime
@@ -51,6 +56,82 @@ class FiniteField:
         return 'prime:{} , num:{}'.format(self.prime, self.num)
 
 
+class FieldElement:
+    # element of a prime field whose modulus P is fixed on the class
+    __slots__ = ('num',)
+    P = None
+
+    def __init__(self, num, p=None):
+        self.num = num % self.P
+
+    @classmethod
+    def _new(cls, num):
+        # num must already be reduced
+        e = object.__new__(cls)
+        e.num = num
+        return e
+
+    @property
+    def prime(self):
+        return self.P
+
+    def __add__(self, other):
+        return self._new((self.num + other.num) % self.P)
+
+    def __sub__(self, other):
+        return self._new((self.num - other.num) % self.P)
+
+    def __mul__(self, other):
+        return self._new((self.num * other.num) % self.P)
+
+    def __rmul__(self, coefficient):
+        return self._new((self.num * coefficient) % self.P)
+
+    def __neg__(self):
+        return self._new((-self.num) % self.P)
+
+    def __pow__(self, exponent):
+        return self._new(pow(self.num, exponent % (self.P - 1), self.P))
+
+    def __truediv__(self, other):
+        return self._new(
+            (self.num * pow(other.num, self.P - 2, self.P)) % self.P)
+
+    # in-place operations update self instead of allocating
+    def __iadd__(self, other):
+        self.num = (self.num + other.num) % self.P
+        return self
+
+    def __isub__(self, other):
+        self.num = (self.num - other.num) % self.P
+        return self
+
+    def __imul__(self, other):
+        self.num = (self.num * other.num) % self.P
+        return self
+
+    def square(self):
+        return self._new((self.num * self.num) % self.P)
+
+    def mul_add(self, other, addend):
+        # self * other + addend with a single reduction
+        return self._new((self.num * other.num + addend.num) % self.P)
+
+    def inverse(self):
+        return self._new(pow(self.num, self.P - 2, self.P))
+
+    def __eq__(self, other):
+        if other is None:
+            return False
+        return self.num == other.num and self.P == other.prime
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):
+        return 'prime:{} , num:{}'.format(self.P, self.num)
+
+
 class ECCPoint:
     def __init__(self, x, y, a, b):
         self.x = x
@@ -66,9 +147,9 @@ class ECCPoint:
     def __add__(self, other):
         if self.a != other.a or self.b != other.b:
             raise TypeError('They are not the same curve.')
-        if self.x == None:
+        if self.x is None:
             return other.__class__(other.x, other.y, other.a, other.b)
-        if other.x == None:
+        if other.x is None:
             return self.__class__(self.x, self.y, self.a, self.b)
         if self.x == other.x and self.y != other.y:
             return self.__class__(None, None, self.a, self.b)
@@ -77,13 +158,13 @@ class ECCPoint:
             x = s**2 - self.x - other.x
             y = s * (self.x - x) - self.y
             return self.__class__(x, y, self.a, self.b)
-        if self == other and self.y == 0 * self.x:
+        # self and other are the same point
+        if self.y.num == 0:
             return self.__class__(None, None, self.a, self.b)
-        if self == other:
-            s = (3 * self.x**2 + self.a) / (2 * self.y)
-            x = s**2 - 2 * self.x
-            y = s * (self.x - x) - self.y
-            return self.__class__(x, y, self.a, self.b)
+        s = (3 * self.x**2 + self.a) / (2 * self.y)
+        x = s**2 - 2 * self.x
+        y = s * (self.x - x) - self.y
+        return self.__class__(x, y, self.a, self.b)
 
     def __rmul__(self, coefficient):
         if self.x is None:
@@ -99,32 +180,381 @@ class ECCPoint:
         return result
 
 
-class S256FF(FiniteField):
+class S256FF(FieldElement):
+    __slots__ = ()
     P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
 
+
+class S256FFConst(S256FF):
+    # shared constants: num is read-only, in-place operators and
+    # arithmetic return new S256FF objects
+    __slots__ = ()
+
     def __init__(self, num, p=None):
-        super().__init__(num, self.P)
+        object.__setattr__(self, 'num', num % self.P)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('The constant is immutable.')
+
+    @classmethod
+    def _new(cls, num):
+        return S256FF._new(num)
+
+    def __iadd__(self, other):
+        return self + other
+
+    def __isub__(self, other):
+        return self - other
+
+    def __imul__(self, other):
+        return self * other
+
+
+def _jacobian_double(X, Y, Z):
+    # dbl-2009-l (a = 0)
+    P = S256FF.P
+    if Z == 0 or Y == 0:
+        return 1, 1, 0
+    A = (X * X) % P
+    B = (Y * Y) % P
+    C = (B * B) % P
+    D = (2 * ((X + B) * (X + B) - A - C)) % P
+    E = 3 * A
+    F = (E * E) % P
+    X3 = (F - 2 * D) % P
+    Y3 = (E * (D - X3) - 8 * C) % P
+    Z3 = (2 * Y * Z) % P
+    return X3, Y3, Z3
+
+
+def _jacobian_add(X1, Y1, Z1, X2, Y2, Z2):
+    # add-2007-bl
+    P = S256FF.P
+    if Z1 == 0:
+        return X2, Y2, Z2
+    if Z2 == 0:
+        return X1, Y1, Z1
+    Z1Z1 = (Z1 * Z1) % P
+    Z2Z2 = (Z2 * Z2) % P
+    U1 = (X1 * Z2Z2) % P
+    U2 = (X2 * Z1Z1) % P
+    S1 = (Y1 * Z2 * Z2Z2) % P
+    S2 = (Y2 * Z1 * Z1Z1) % P
+    H = (U2 - U1) % P
+    r = (S2 - S1) % P
+    if H == 0:
+        if r == 0:
+            return _jacobian_double(X1, Y1, Z1)
+        return 1, 1, 0
+    II = (4 * H * H) % P
+    J = (H * II) % P
+    r = 2 * r
+    V = (U1 * II) % P
+    X3 = (r * r - J - 2 * V) % P
+    Y3 = (r * (V - X3) - 2 * S1 * J) % P
+    Z3 = (((Z1 + Z2) * (Z1 + Z2) - Z1Z1 - Z2Z2) * H) % P
+    return X3, Y3, Z3
+
+
+def _jacobian_madd(X1, Y1, Z1, x2, y2):
+    # madd-2007-bl, the second point is affine (Z2 = 1)
+    P = S256FF.P
+    if Z1 == 0:
+        return x2, y2, 1
+    Z1Z1 = (Z1 * Z1) % P
+    U2 = (x2 * Z1Z1) % P
+    S2 = (y2 * Z1 * Z1Z1) % P
+    H = (U2 - X1) % P
+    r = (S2 - Y1) % P
+    if H == 0:
+        if r == 0:
+            return _jacobian_double(X1, Y1, Z1)
+        return 1, 1, 0
+    HH = (H * H) % P
+    II = 4 * HH
+    J = (H * II) % P
+    r = 2 * r
+    V = (X1 * II) % P
+    X3 = (r * r - J - 2 * V) % P
+    Y3 = (r * (V - X3) - 2 * Y1 * J) % P
+    Z3 = ((Z1 + H) * (Z1 + H) - Z1Z1 - HH) % P
+    return X3, Y3, Z3
+
+
+def _wnaf(k, w):
+    # width-w NAF, least significant digit first
+    naf = []
+    while k:
+        if k & 1:
+            d = k & ((1 << w) - 1)
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+            k -= d
+        else:
+            d = 0
+        naf.append(d)
+        k >>= 1
+    return naf
 
 
 class S256P(ECCPoint):
+    # kept in Jacobian coordinates (X:Y:Z), x = X/Z^2, y = Y/Z^3,
+    # Z = 0 is the point at infinity
     N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+    a = S256FFConst(0)
+    b = S256FFConst(7)
+    # GLV endomorphism: LAMBDA * (x, y) = (BETA * x, y)
+    BETA = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+    LAMBDA = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+    # short basis of {(i, j) : i + j * LAMBDA = 0 (mod N)}
+    A1 = 0x3086D221A7D46BCDE86C90E49284EB15
+    B1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+    A2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+    B2 = 0x3086D221A7D46BCDE86C90E49284EB15
+    W = 5
 
     def __init__(self, x, y, a=None, b=None):
-        if type(x) == int:
-            super().__init__(S256FF(x), S256FF(y), S256FF(0), S256FF(7))
-        else:
-            super().__init__(x, y, S256FF(0), S256FF(7))
+        if x is None and y is None:
+            self.X, self.Y, self.Z = 1, 1, 0
+            return
+        if type(x) != int:
+            x, y = x.num, y.num
+        P = S256FF.P
+        x, y = x % P, y % P
+        if (y * y - x * x * x - 7) % P != 0:
+            raise ValueError(
+                'The x and y are not on curve.{} {}'.format(x, y))
+        self.X, self.Y, self.Z = x, y, 1
+
+    @classmethod
+    def jacobian(cls, X, Y, Z):
+        point = cls.__new__(cls)
+        point.X, point.Y, point.Z = X, Y, Z
+        return point
+
+    def normalize(self):
+        if self.Z != 0 and self.Z != 1:
+            P = S256FF.P
+            zi = pow(self.Z, P - 2, P)
+            zi2 = (zi * zi) % P
+            self.X = (self.X * zi2) % P
+            self.Y = (self.Y * zi2 * zi) % P
+            self.Z = 1
+        return self
+
+    @classmethod
+    def normalize_many(cls, points):
+        # affine coordinates for all points with a single inversion, a
+        # point object listed twice must be rescaled only once
+        P = S256FF.P
+        todo = list({id(Q): Q for Q in points
+                     if Q.Z != 0 and Q.Z != 1}.values())
+        for Q, zi in zip(todo, _batch_inv([Q.Z for Q in todo], P)):
+            zi2 = (zi * zi) % P
+            Q.X = (Q.X * zi2) % P
+            Q.Y = (Q.Y * zi2 * zi) % P
+            Q.Z = 1
+        return points
+
+    def sec(self, compressed=True):
+        # SEC1 2.3.3
+        if self.Z == 0:
+            raise ValueError('The point at infinity has no encoding.')
+        self.normalize()
+        if compressed:
+            return bytes([2 + (self.Y & 1)]) + self.X.to_bytes(32, 'big')
+        return b'\x04' + self.X.to_bytes(32, 'big') + \
+            self.Y.to_bytes(32, 'big')
+
+    @classmethod
+    def parse(cls, sec):
+        # SEC1 2.3.4, the coordinates must be reduced and on the curve
+        P = S256FF.P
+        if len(sec) == 65 and sec[0] == 4:
+            x = int.from_bytes(sec[1:33], 'big')
+            y = int.from_bytes(sec[33:], 'big')
+            if x >= P or y >= P:
+                raise ValueError('invalid SEC encoding')
+            return cls(x, y)
+        if len(sec) != 33 or sec[0] not in (2, 3):
+            raise ValueError('invalid SEC encoding')
+        x = int.from_bytes(sec[1:], 'big')
+        if x >= P:
+            raise ValueError('invalid SEC encoding')
+        # P = 3 (mod 4)
+        y = pow((x * x * x + 7) % P, (P + 1) // 4, P)
+        if (y & 1) != (sec[0] & 1):
+            y = P - y
+        return cls(x, y)
+
+    @property
+    def x(self):
+        if self.Z == 0:
+            return None
+        return S256FF(self.normalize().X)
+
+    @property
+    def y(self):
+        if self.Z == 0:
+            return None
+        return S256FF(self.normalize().Y)
+
+    def __add__(self, other):
+        if other.Z == 1:
+            return self.jacobian(
+                *_jacobian_madd(self.X, self.Y, self.Z, other.X, other.Y))
+        if self.Z == 1:
+            return self.jacobian(
+                *_jacobian_madd(other.X, other.Y, other.Z, self.X, self.Y))
+        return self.jacobian(*_jacobian_add(self.X, self.Y, self.Z,
+                                            other.X, other.Y, other.Z))
+
+    def __neg__(self):
+        return self.jacobian(self.X, (-self.Y) % S256FF.P, self.Z)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def double(self):
+        return self.jacobian(*_jacobian_double(self.X, self.Y, self.Z))
+
+    @classmethod
+    def glv_split(cls, k):
+        # k = k1 + k2 * LAMBDA (mod N) with |k1|, |k2| ~ 2^128
+        N = cls.N
+        c1 = (cls.B2 * k + N // 2) // N
+        c2 = (-cls.B1 * k + N // 2) // N
+        k1 = k - c1 * cls.A1 - c2 * cls.A2
+        k2 = -c1 * cls.B1 - c2 * cls.B2
+        return k1, k2
+
+    @classmethod
+    def multi_mul(cls, coefficients, points):
+        # sum(k * Q) with GLV-split scalars sharing all doublings
+        P = S256FF.P
+        pairs = [(k % cls.N, Q) for k, Q in zip(coefficients, points)]
+        pairs = [(k, Q) for k, Q in pairs if k and Q.Z != 0]
+        # odd multiples Q, 3Q, ..., (2^(W-1)-1)Q of every point
+        odds = []
+        for _, Q in pairs:
+            double = _jacobian_double(Q.X, Q.Y, Q.Z)
+            odd = [(Q.X, Q.Y, Q.Z)]
+            for _ in range((1 << (cls.W - 2)) - 1):
+                odd.append(_jacobian_add(*odd[-1], *double))
+            odds += odd
+        zi = _batch_inv([Z for _, _, Z in odds], P)
+        affine = []
+        for (X, Y, _), z in zip(odds, zi):
+            z2 = (z * z) % P
+            affine.append(((X * z2) % P, (Y * z2 * z) % P))
+        size = 1 << (cls.W - 2)
+        nafs = []
+        for i, (k, _) in enumerate(pairs):
+            k1, k2 = cls.glv_split(k)
+            odd = affine[i*size:(i+1)*size]
+            table1 = [(x, y if k1 >= 0 else P - y) for x, y in odd]
+            table2 = [((cls.BETA * x) % P, y if k2 >= 0 else P - y)
+                      for x, y in odd]
+            nafs.append((_wnaf(abs(k1), cls.W), table1))
+            nafs.append((_wnaf(abs(k2), cls.W), table2))
+        X, Y, Z = 1, 1, 0
+        top = max([len(naf) for naf, _ in nafs] + [0])
+        for i in range(top - 1, -1, -1):
+            X, Y, Z = _jacobian_double(X, Y, Z)
+            for naf, table in nafs:
+                d = naf[i] if i < len(naf) else 0
+                if d > 0:
+                    x, y = table[d >> 1]
+                    X, Y, Z = _jacobian_madd(X, Y, Z, x, y)
+                elif d < 0:
+                    x, y = table[(-d) >> 1]
+                    X, Y, Z = _jacobian_madd(X, Y, Z, x, P - y)
+        return cls.jacobian(X, Y, Z)
 
     def __rmul__(self, coefficient):
-        coef = coefficient % self.N
-        return super().__rmul__(coef)
+        return self.multi_mul([coefficient], [self])
+
+    def __eq__(self, other):
+        if other is None:
+            return False
+        if self.Z == 0 or other.Z == 0:
+            return self.Z == other.Z
+        P = S256FF.P
+        Z1Z1 = (self.Z * self.Z) % P
+        Z2Z2 = (other.Z * other.Z) % P
+        return (self.X * Z2Z2 - other.X * Z1Z1) % P == 0 and \
+            (self.Y * Z2Z2 * other.Z - other.Y * Z1Z1 * self.Z) % P == 0
+
+    def __ne__(self, other):
+        return not (self == other)
 
 
 G = S256P(0x79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798,
           0x483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8)
 
 
-class sha256:
+class MDHash:
+    # Merkle-Damgard streaming interface: update() buffers at most
+    # one block, the padding is only built for the final block
+    block_size = 64
+    length_order = 'big'
+    H0 = []
+
+    def __init__(self, msg=None):
+        self.H = list(self.H0)
+        self.buffer = b''
+        self.length = 0
+        if msg is not None:
+            self.update(msg)
+
+    def block(self, H, msg, p):
+        raise NotImplementedError
+
+    def output(self, H):
+        raise NotImplementedError
+
+    def update(self, msg):
+        msg = memoryview(msg).cast('B')
+        self.length += len(msg)
+        p = 0
+        if self.buffer:
+            p = self.block_size - len(self.buffer)
+            if len(msg) < p:
+                self.buffer += bytes(msg)
+                return self
+            self.block(self.H, self.buffer + bytes(msg[:p]), 0)
+            self.buffer = b''
+        end = len(msg) - (len(msg) - p) % self.block_size
+        for q in range(p, end, self.block_size):
+            self.block(self.H, msg, q)
+        self.buffer = bytes(msg[end:])
+        return self
+
+    def copy(self):
+        other = self.__class__.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
+        other.H = list(self.H)
+        return other
+
+    def digest(self):
+        H = list(self.H)
+        tail = self.buffer + b'\x80'
+        tail += b'\x00' * ((self.block_size - 8 - len(tail)) %
+                           self.block_size)
+        tail += (self.length * 8).to_bytes(8, self.length_order)
+        for p in range(0, len(tail), self.block_size):
+            self.block(H, tail, p)
+        return self.output(H)
+
+    def hexdigest(self):
+        return self.digest().hex()
+
+    def Digest(self, msg):
+        return self.__class__(msg).digest()
+
+
+class sha256(MDHash):
+    digest_size = 32
     H0 = [0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a,
           0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19]
 
@@ -137,6 +567,10 @@ class sha256:
          0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
          0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2]
 
+    def __init__(self, msg=None, fast=True):
+        self.fast = fast
+        super().__init__(msg)
+
     def ROTR(self, x, n):
         return ((x >> n) | (x << (32 - n))) & 0xffffffff
 
@@ -172,42 +606,758 @@ class sha256:
         bs += l.to_bytes(8, 'big')
         return bs
 
-    def compute(self, msg):
-        N = int(len(msg) / 64)
+    def block(self, H, msg, p):
+        if self.fast:
+            self.block_fast(H, msg, p)
+        else:
+            self.block_reference(H, msg, p)
+
+    def block_reference(self, H, msg, p):
         W = [0]*64
-        H = copy.deepcopy(self.H0)
-        for i in range(N):
-            for t in range(64):
-                if t < 16:
-                    p = i*64 + t*4
-                    W[t] = int.from_bytes(msg[p: p+4], 'big')
-                else:
-                    W[t] = (self.sigma1(W[t-2]) + W[t-7] +
-                            self.sigma0(W[t-15]) + W[t-16]) & 0xffffffff
-            a, b, c, d, e, f, g, h = H[0], H[1], H[2], H[3], H[4], H[5], H[6], H[7]
-            for t in range(64):
-                T1 = h + self.SIGMA1(e) + self.Ch(e, f, g) + self.K[t] + W[t]
-                T2 = self.SIGMA0(a) + self.Maj(a, b, c)
-                h, g, f, e = g, f, e, (d + T1) & 0xffffffff
-                d, c, b, a = c, b, a, (T1 + T2) & 0xffffffff
-            H[0] = (a + H[0]) & 0xffffffff
-            H[1] = (b + H[1]) & 0xffffffff
-            H[2] = (c + H[2]) & 0xffffffff
-            H[3] = (d + H[3]) & 0xffffffff
-            H[4] = (e + H[4]) & 0xffffffff
-            H[5] = (f + H[5]) & 0xffffffff
-            H[6] = (g + H[6]) & 0xffffffff
-            H[7] = (h + H[7]) & 0xffffffff
+        for t in range(64):
+            if t < 16:
+                W[t] = int.from_bytes(msg[p + t*4: p + t*4 + 4], 'big')
+            else:
+                W[t] = (self.sigma1(W[t-2]) + W[t-7] +
+                        self.sigma0(W[t-15]) + W[t-16]) & 0xffffffff
+        a, b, c, d, e, f, g, h = H[0], H[1], H[2], H[3], H[4], H[5], H[6], H[7]
+        for t in range(64):
+            T1 = h + self.SIGMA1(e) + self.Ch(e, f, g) + self.K[t] + W[t]
+            T2 = self.SIGMA0(a) + self.Maj(a, b, c)
+            h, g, f, e = g, f, e, (d + T1) & 0xffffffff
+            d, c, b, a = c, b, a, (T1 + T2) & 0xffffffff
+        H[0] = (a + H[0]) & 0xffffffff
+        H[1] = (b + H[1]) & 0xffffffff
+        H[2] = (c + H[2]) & 0xffffffff
+        H[3] = (d + H[3]) & 0xffffffff
+        H[4] = (e + H[4]) & 0xffffffff
+        H[5] = (f + H[5]) & 0xffffffff
+        H[6] = (g + H[6]) & 0xffffffff
+        H[7] = (h + H[7]) & 0xffffffff
+
+    def block_fast(self, H, msg, p, unpack_from=struct.unpack_from):
+        # block_reference() with the helpers inlined, the message schedule
+        # and all 64 rounds unrolled into locals
+        (w0, w1, w2, w3, w4, w5, w6, w7,
+         w8, w9, w10, w11, w12, w13, w14, w15) = unpack_from('>16I', msg, p)
+        w16 = (w0 + w9 +
+               (((w1 >> 7) | (w1 << 25)) ^ ((w1 >> 18) | (w1 << 14)) ^
+                (w1 >> 3)) +
+               (((w14 >> 17) | (w14 << 15)) ^ ((w14 >> 19) | (w14 << 13)) ^
+                (w14 >> 10))) & 0xffffffff
+        w17 = (w1 + w10 +
+               (((w2 >> 7) | (w2 << 25)) ^ ((w2 >> 18) | (w2 << 14)) ^
+                (w2 >> 3)) +
+               (((w15 >> 17) | (w15 << 15)) ^ ((w15 >> 19) | (w15 << 13)) ^
+                (w15 >> 10))) & 0xffffffff
+        w18 = (w2 + w11 +
+               (((w3 >> 7) | (w3 << 25)) ^ ((w3 >> 18) | (w3 << 14)) ^
+                (w3 >> 3)) +
+               (((w16 >> 17) | (w16 << 15)) ^ ((w16 >> 19) | (w16 << 13)) ^
+                (w16 >> 10))) & 0xffffffff
+        w19 = (w3 + w12 +
+               (((w4 >> 7) | (w4 << 25)) ^ ((w4 >> 18) | (w4 << 14)) ^
+                (w4 >> 3)) +
+               (((w17 >> 17) | (w17 << 15)) ^ ((w17 >> 19) | (w17 << 13)) ^
+                (w17 >> 10))) & 0xffffffff
+        w20 = (w4 + w13 +
+               (((w5 >> 7) | (w5 << 25)) ^ ((w5 >> 18) | (w5 << 14)) ^
+                (w5 >> 3)) +
+               (((w18 >> 17) | (w18 << 15)) ^ ((w18 >> 19) | (w18 << 13)) ^
+                (w18 >> 10))) & 0xffffffff
+        w21 = (w5 + w14 +
+               (((w6 >> 7) | (w6 << 25)) ^ ((w6 >> 18) | (w6 << 14)) ^
+                (w6 >> 3)) +
+               (((w19 >> 17) | (w19 << 15)) ^ ((w19 >> 19) | (w19 << 13)) ^
+                (w19 >> 10))) & 0xffffffff
+        w22 = (w6 + w15 +
+               (((w7 >> 7) | (w7 << 25)) ^ ((w7 >> 18) | (w7 << 14)) ^
+                (w7 >> 3)) +
+               (((w20 >> 17) | (w20 << 15)) ^ ((w20 >> 19) | (w20 << 13)) ^
+                (w20 >> 10))) & 0xffffffff
+        w23 = (w7 + w16 +
+               (((w8 >> 7) | (w8 << 25)) ^ ((w8 >> 18) | (w8 << 14)) ^
+                (w8 >> 3)) +
+               (((w21 >> 17) | (w21 << 15)) ^ ((w21 >> 19) | (w21 << 13)) ^
+                (w21 >> 10))) & 0xffffffff
+        w24 = (w8 + w17 +
+               (((w9 >> 7) | (w9 << 25)) ^ ((w9 >> 18) | (w9 << 14)) ^
+                (w9 >> 3)) +
+               (((w22 >> 17) | (w22 << 15)) ^ ((w22 >> 19) | (w22 << 13)) ^
+                (w22 >> 10))) & 0xffffffff
+        w25 = (w9 + w18 +
+               (((w10 >> 7) | (w10 << 25)) ^ ((w10 >> 18) | (w10 << 14)) ^
+                (w10 >> 3)) +
+               (((w23 >> 17) | (w23 << 15)) ^ ((w23 >> 19) | (w23 << 13)) ^
+                (w23 >> 10))) & 0xffffffff
+        w26 = (w10 + w19 +
+               (((w11 >> 7) | (w11 << 25)) ^ ((w11 >> 18) | (w11 << 14)) ^
+                (w11 >> 3)) +
+               (((w24 >> 17) | (w24 << 15)) ^ ((w24 >> 19) | (w24 << 13)) ^
+                (w24 >> 10))) & 0xffffffff
+        w27 = (w11 + w20 +
+               (((w12 >> 7) | (w12 << 25)) ^ ((w12 >> 18) | (w12 << 14)) ^
+                (w12 >> 3)) +
+               (((w25 >> 17) | (w25 << 15)) ^ ((w25 >> 19) | (w25 << 13)) ^
+                (w25 >> 10))) & 0xffffffff
+        w28 = (w12 + w21 +
+               (((w13 >> 7) | (w13 << 25)) ^ ((w13 >> 18) | (w13 << 14)) ^
+                (w13 >> 3)) +
+               (((w26 >> 17) | (w26 << 15)) ^ ((w26 >> 19) | (w26 << 13)) ^
+                (w26 >> 10))) & 0xffffffff
+        w29 = (w13 + w22 +
+               (((w14 >> 7) | (w14 << 25)) ^ ((w14 >> 18) | (w14 << 14)) ^
+                (w14 >> 3)) +
+               (((w27 >> 17) | (w27 << 15)) ^ ((w27 >> 19) | (w27 << 13)) ^
+                (w27 >> 10))) & 0xffffffff
+        w30 = (w14 + w23 +
+               (((w15 >> 7) | (w15 << 25)) ^ ((w15 >> 18) | (w15 << 14)) ^
+                (w15 >> 3)) +
+               (((w28 >> 17) | (w28 << 15)) ^ ((w28 >> 19) | (w28 << 13)) ^
+                (w28 >> 10))) & 0xffffffff
+        w31 = (w15 + w24 +
+               (((w16 >> 7) | (w16 << 25)) ^ ((w16 >> 18) | (w16 << 14)) ^
+                (w16 >> 3)) +
+               (((w29 >> 17) | (w29 << 15)) ^ ((w29 >> 19) | (w29 << 13)) ^
+                (w29 >> 10))) & 0xffffffff
+        w32 = (w16 + w25 +
+               (((w17 >> 7) | (w17 << 25)) ^ ((w17 >> 18) | (w17 << 14)) ^
+                (w17 >> 3)) +
+               (((w30 >> 17) | (w30 << 15)) ^ ((w30 >> 19) | (w30 << 13)) ^
+                (w30 >> 10))) & 0xffffffff
+        w33 = (w17 + w26 +
+               (((w18 >> 7) | (w18 << 25)) ^ ((w18 >> 18) | (w18 << 14)) ^
+                (w18 >> 3)) +
+               (((w31 >> 17) | (w31 << 15)) ^ ((w31 >> 19) | (w31 << 13)) ^
+                (w31 >> 10))) & 0xffffffff
+        w34 = (w18 + w27 +
+               (((w19 >> 7) | (w19 << 25)) ^ ((w19 >> 18) | (w19 << 14)) ^
+                (w19 >> 3)) +
+               (((w32 >> 17) | (w32 << 15)) ^ ((w32 >> 19) | (w32 << 13)) ^
+                (w32 >> 10))) & 0xffffffff
+        w35 = (w19 + w28 +
+               (((w20 >> 7) | (w20 << 25)) ^ ((w20 >> 18) | (w20 << 14)) ^
+                (w20 >> 3)) +
+               (((w33 >> 17) | (w33 << 15)) ^ ((w33 >> 19) | (w33 << 13)) ^
+                (w33 >> 10))) & 0xffffffff
+        w36 = (w20 + w29 +
+               (((w21 >> 7) | (w21 << 25)) ^ ((w21 >> 18) | (w21 << 14)) ^
+                (w21 >> 3)) +
+               (((w34 >> 17) | (w34 << 15)) ^ ((w34 >> 19) | (w34 << 13)) ^
+                (w34 >> 10))) & 0xffffffff
+        w37 = (w21 + w30 +
+               (((w22 >> 7) | (w22 << 25)) ^ ((w22 >> 18) | (w22 << 14)) ^
+                (w22 >> 3)) +
+               (((w35 >> 17) | (w35 << 15)) ^ ((w35 >> 19) | (w35 << 13)) ^
+                (w35 >> 10))) & 0xffffffff
+        w38 = (w22 + w31 +
+               (((w23 >> 7) | (w23 << 25)) ^ ((w23 >> 18) | (w23 << 14)) ^
+                (w23 >> 3)) +
+               (((w36 >> 17) | (w36 << 15)) ^ ((w36 >> 19) | (w36 << 13)) ^
+                (w36 >> 10))) & 0xffffffff
+        w39 = (w23 + w32 +
+               (((w24 >> 7) | (w24 << 25)) ^ ((w24 >> 18) | (w24 << 14)) ^
+                (w24 >> 3)) +
+               (((w37 >> 17) | (w37 << 15)) ^ ((w37 >> 19) | (w37 << 13)) ^
+                (w37 >> 10))) & 0xffffffff
+        w40 = (w24 + w33 +
+               (((w25 >> 7) | (w25 << 25)) ^ ((w25 >> 18) | (w25 << 14)) ^
+                (w25 >> 3)) +
+               (((w38 >> 17) | (w38 << 15)) ^ ((w38 >> 19) | (w38 << 13)) ^
+                (w38 >> 10))) & 0xffffffff
+        w41 = (w25 + w34 +
+               (((w26 >> 7) | (w26 << 25)) ^ ((w26 >> 18) | (w26 << 14)) ^
+                (w26 >> 3)) +
+               (((w39 >> 17) | (w39 << 15)) ^ ((w39 >> 19) | (w39 << 13)) ^
+                (w39 >> 10))) & 0xffffffff
+        w42 = (w26 + w35 +
+               (((w27 >> 7) | (w27 << 25)) ^ ((w27 >> 18) | (w27 << 14)) ^
+                (w27 >> 3)) +
+               (((w40 >> 17) | (w40 << 15)) ^ ((w40 >> 19) | (w40 << 13)) ^
+                (w40 >> 10))) & 0xffffffff
+        w43 = (w27 + w36 +
+               (((w28 >> 7) | (w28 << 25)) ^ ((w28 >> 18) | (w28 << 14)) ^
+                (w28 >> 3)) +
+               (((w41 >> 17) | (w41 << 15)) ^ ((w41 >> 19) | (w41 << 13)) ^
+                (w41 >> 10))) & 0xffffffff
+        w44 = (w28 + w37 +
+               (((w29 >> 7) | (w29 << 25)) ^ ((w29 >> 18) | (w29 << 14)) ^
+                (w29 >> 3)) +
+               (((w42 >> 17) | (w42 << 15)) ^ ((w42 >> 19) | (w42 << 13)) ^
+                (w42 >> 10))) & 0xffffffff
+        w45 = (w29 + w38 +
+               (((w30 >> 7) | (w30 << 25)) ^ ((w30 >> 18) | (w30 << 14)) ^
+                (w30 >> 3)) +
+               (((w43 >> 17) | (w43 << 15)) ^ ((w43 >> 19) | (w43 << 13)) ^
+                (w43 >> 10))) & 0xffffffff
+        w46 = (w30 + w39 +
+               (((w31 >> 7) | (w31 << 25)) ^ ((w31 >> 18) | (w31 << 14)) ^
+                (w31 >> 3)) +
+               (((w44 >> 17) | (w44 << 15)) ^ ((w44 >> 19) | (w44 << 13)) ^
+                (w44 >> 10))) & 0xffffffff
+        w47 = (w31 + w40 +
+               (((w32 >> 7) | (w32 << 25)) ^ ((w32 >> 18) | (w32 << 14)) ^
+                (w32 >> 3)) +
+               (((w45 >> 17) | (w45 << 15)) ^ ((w45 >> 19) | (w45 << 13)) ^
+                (w45 >> 10))) & 0xffffffff
+        w48 = (w32 + w41 +
+               (((w33 >> 7) | (w33 << 25)) ^ ((w33 >> 18) | (w33 << 14)) ^
+                (w33 >> 3)) +
+               (((w46 >> 17) | (w46 << 15)) ^ ((w46 >> 19) | (w46 << 13)) ^
+                (w46 >> 10))) & 0xffffffff
+        w49 = (w33 + w42 +
+               (((w34 >> 7) | (w34 << 25)) ^ ((w34 >> 18) | (w34 << 14)) ^
+                (w34 >> 3)) +
+               (((w47 >> 17) | (w47 << 15)) ^ ((w47 >> 19) | (w47 << 13)) ^
+                (w47 >> 10))) & 0xffffffff
+        w50 = (w34 + w43 +
+               (((w35 >> 7) | (w35 << 25)) ^ ((w35 >> 18) | (w35 << 14)) ^
+                (w35 >> 3)) +
+               (((w48 >> 17) | (w48 << 15)) ^ ((w48 >> 19) | (w48 << 13)) ^
+                (w48 >> 10))) & 0xffffffff
+        w51 = (w35 + w44 +
+               (((w36 >> 7) | (w36 << 25)) ^ ((w36 >> 18) | (w36 << 14)) ^
+                (w36 >> 3)) +
+               (((w49 >> 17) | (w49 << 15)) ^ ((w49 >> 19) | (w49 << 13)) ^
+                (w49 >> 10))) & 0xffffffff
+        w52 = (w36 + w45 +
+               (((w37 >> 7) | (w37 << 25)) ^ ((w37 >> 18) | (w37 << 14)) ^
+                (w37 >> 3)) +
+               (((w50 >> 17) | (w50 << 15)) ^ ((w50 >> 19) | (w50 << 13)) ^
+                (w50 >> 10))) & 0xffffffff
+        w53 = (w37 + w46 +
+               (((w38 >> 7) | (w38 << 25)) ^ ((w38 >> 18) | (w38 << 14)) ^
+                (w38 >> 3)) +
+               (((w51 >> 17) | (w51 << 15)) ^ ((w51 >> 19) | (w51 << 13)) ^
+                (w51 >> 10))) & 0xffffffff
+        w54 = (w38 + w47 +
+               (((w39 >> 7) | (w39 << 25)) ^ ((w39 >> 18) | (w39 << 14)) ^
+                (w39 >> 3)) +
+               (((w52 >> 17) | (w52 << 15)) ^ ((w52 >> 19) | (w52 << 13)) ^
+                (w52 >> 10))) & 0xffffffff
+        w55 = (w39 + w48 +
+               (((w40 >> 7) | (w40 << 25)) ^ ((w40 >> 18) | (w40 << 14)) ^
+                (w40 >> 3)) +
+               (((w53 >> 17) | (w53 << 15)) ^ ((w53 >> 19) | (w53 << 13)) ^
+                (w53 >> 10))) & 0xffffffff
+        w56 = (w40 + w49 +
+               (((w41 >> 7) | (w41 << 25)) ^ ((w41 >> 18) | (w41 << 14)) ^
+                (w41 >> 3)) +
+               (((w54 >> 17) | (w54 << 15)) ^ ((w54 >> 19) | (w54 << 13)) ^
+                (w54 >> 10))) & 0xffffffff
+        w57 = (w41 + w50 +
+               (((w42 >> 7) | (w42 << 25)) ^ ((w42 >> 18) | (w42 << 14)) ^
+                (w42 >> 3)) +
+               (((w55 >> 17) | (w55 << 15)) ^ ((w55 >> 19) | (w55 << 13)) ^
+                (w55 >> 10))) & 0xffffffff
+        w58 = (w42 + w51 +
+               (((w43 >> 7) | (w43 << 25)) ^ ((w43 >> 18) | (w43 << 14)) ^
+                (w43 >> 3)) +
+               (((w56 >> 17) | (w56 << 15)) ^ ((w56 >> 19) | (w56 << 13)) ^
+                (w56 >> 10))) & 0xffffffff
+        w59 = (w43 + w52 +
+               (((w44 >> 7) | (w44 << 25)) ^ ((w44 >> 18) | (w44 << 14)) ^
+                (w44 >> 3)) +
+               (((w57 >> 17) | (w57 << 15)) ^ ((w57 >> 19) | (w57 << 13)) ^
+                (w57 >> 10))) & 0xffffffff
+        w60 = (w44 + w53 +
+               (((w45 >> 7) | (w45 << 25)) ^ ((w45 >> 18) | (w45 << 14)) ^
+                (w45 >> 3)) +
+               (((w58 >> 17) | (w58 << 15)) ^ ((w58 >> 19) | (w58 << 13)) ^
+                (w58 >> 10))) & 0xffffffff
+        w61 = (w45 + w54 +
+               (((w46 >> 7) | (w46 << 25)) ^ ((w46 >> 18) | (w46 << 14)) ^
+                (w46 >> 3)) +
+               (((w59 >> 17) | (w59 << 15)) ^ ((w59 >> 19) | (w59 << 13)) ^
+                (w59 >> 10))) & 0xffffffff
+        w62 = (w46 + w55 +
+               (((w47 >> 7) | (w47 << 25)) ^ ((w47 >> 18) | (w47 << 14)) ^
+                (w47 >> 3)) +
+               (((w60 >> 17) | (w60 << 15)) ^ ((w60 >> 19) | (w60 << 13)) ^
+                (w60 >> 10))) & 0xffffffff
+        w63 = (w47 + w56 +
+               (((w48 >> 7) | (w48 << 25)) ^ ((w48 >> 18) | (w48 << 14)) ^
+                (w48 >> 3)) +
+               (((w61 >> 17) | (w61 << 15)) ^ ((w61 >> 19) | (w61 << 13)) ^
+                (w61 >> 10))) & 0xffffffff
+        a, b, c, d, e, f, g, h = H
+        t1 = (h + ((((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^
+                    ((e >> 25) | (e << 7))) & 0xffffffff) +
+              (g ^ (e & (f ^ g))) + 0x428a2f98 + w0)
+        d = (d + t1) & 0xffffffff
+        h = (t1 + ((((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^
+                    ((a >> 22) | (a << 10))) & 0xffffffff) +
+             ((a & b) | (c & (a | b)))) & 0xffffffff
+        t1 = (g + ((((d >> 6) | (d << 26)) ^ ((d >> 11) | (d << 21)) ^
+                    ((d >> 25) | (d << 7))) & 0xffffffff) +
+              (f ^ (d & (e ^ f))) + 0x71374491 + w1)
+        c = (c + t1) & 0xffffffff
+        g = (t1 + ((((h >> 2) | (h << 30)) ^ ((h >> 13) | (h << 19)) ^
+                    ((h >> 22) | (h << 10))) & 0xffffffff) +
+             ((h & a) | (b & (h | a)))) & 0xffffffff
+        t1 = (f + ((((c >> 6) | (c << 26)) ^ ((c >> 11) | (c << 21)) ^
+                    ((c >> 25) | (c << 7))) & 0xffffffff) +
+              (e ^ (c & (d ^ e))) + 0xb5c0fbcf + w2)
+        b = (b + t1) & 0xffffffff
+        f = (t1 + ((((g >> 2) | (g << 30)) ^ ((g >> 13) | (g << 19)) ^
+                    ((g >> 22) | (g << 10))) & 0xffffffff) +
+             ((g & h) | (a & (g | h)))) & 0xffffffff
+        t1 = (e + ((((b >> 6) | (b << 26)) ^ ((b >> 11) | (b << 21)) ^
+                    ((b >> 25) | (b << 7))) & 0xffffffff) +
+              (d ^ (b & (c ^ d))) + 0xe9b5dba5 + w3)
+        a = (a + t1) & 0xffffffff
+        e = (t1 + ((((f >> 2) | (f << 30)) ^ ((f >> 13) | (f << 19)) ^
+                    ((f >> 22) | (f << 10))) & 0xffffffff) +
+             ((f & g) | (h & (f | g)))) & 0xffffffff
+        t1 = (d + ((((a >> 6) | (a << 26)) ^ ((a >> 11) | (a << 21)) ^
+                    ((a >> 25) | (a << 7))) & 0xffffffff) +
+              (c ^ (a & (b ^ c))) + 0x3956c25b + w4)
+        h = (h + t1) & 0xffffffff
+        d = (t1 + ((((e >> 2) | (e << 30)) ^ ((e >> 13) | (e << 19)) ^
+                    ((e >> 22) | (e << 10))) & 0xffffffff) +
+             ((e & f) | (g & (e | f)))) & 0xffffffff
+        t1 = (c + ((((h >> 6) | (h << 26)) ^ ((h >> 11) | (h << 21)) ^
+                    ((h >> 25) | (h << 7))) & 0xffffffff) +
+              (b ^ (h & (a ^ b))) + 0x59f111f1 + w5)
+        g = (g + t1) & 0xffffffff
+        c = (t1 + ((((d >> 2) | (d << 30)) ^ ((d >> 13) | (d << 19)) ^
+                    ((d >> 22) | (d << 10))) & 0xffffffff) +
+             ((d & e) | (f & (d | e)))) & 0xffffffff
+        t1 = (b + ((((g >> 6) | (g << 26)) ^ ((g >> 11) | (g << 21)) ^
+                    ((g >> 25) | (g << 7))) & 0xffffffff) +
+              (a ^ (g & (h ^ a))) + 0x923f82a4 + w6)
+        f = (f + t1) & 0xffffffff
+        b = (t1 + ((((c >> 2) | (c << 30)) ^ ((c >> 13) | (c << 19)) ^
+                    ((c >> 22) | (c << 10))) & 0xffffffff) +
+             ((c & d) | (e & (c | d)))) & 0xffffffff
+        t1 = (a + ((((f >> 6) | (f << 26)) ^ ((f >> 11) | (f << 21)) ^
+                    ((f >> 25) | (f << 7))) & 0xffffffff) +
+              (h ^ (f & (g ^ h))) + 0xab1c5ed5 + w7)
+        e = (e + t1) & 0xffffffff
+        a = (t1 + ((((b >> 2) | (b << 30)) ^ ((b >> 13) | (b << 19)) ^
+                    ((b >> 22) | (b << 10))) & 0xffffffff) +
+             ((b & c) | (d & (b | c)))) & 0xffffffff
+        t1 = (h + ((((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^
+                    ((e >> 25) | (e << 7))) & 0xffffffff) +
+              (g ^ (e & (f ^ g))) + 0xd807aa98 + w8)
+        d = (d + t1) & 0xffffffff
+        h = (t1 + ((((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^
+                    ((a >> 22) | (a << 10))) & 0xffffffff) +
+             ((a & b) | (c & (a | b)))) & 0xffffffff
+        t1 = (g + ((((d >> 6) | (d << 26)) ^ ((d >> 11) | (d << 21)) ^
+                    ((d >> 25) | (d << 7))) & 0xffffffff) +
+              (f ^ (d & (e ^ f))) + 0x12835b01 + w9)
+        c = (c + t1) & 0xffffffff
+        g = (t1 + ((((h >> 2) | (h << 30)) ^ ((h >> 13) | (h << 19)) ^
+                    ((h >> 22) | (h << 10))) & 0xffffffff) +
+             ((h & a) | (b & (h | a)))) & 0xffffffff
+        t1 = (f + ((((c >> 6) | (c << 26)) ^ ((c >> 11) | (c << 21)) ^
+                    ((c >> 25) | (c << 7))) & 0xffffffff) +
+              (e ^ (c & (d ^ e))) + 0x243185be + w10)
+        b = (b + t1) & 0xffffffff
+        f = (t1 + ((((g >> 2) | (g << 30)) ^ ((g >> 13) | (g << 19)) ^
+                    ((g >> 22) | (g << 10))) & 0xffffffff) +
+             ((g & h) | (a & (g | h)))) & 0xffffffff
+        t1 = (e + ((((b >> 6) | (b << 26)) ^ ((b >> 11) | (b << 21)) ^
+                    ((b >> 25) | (b << 7))) & 0xffffffff) +
+              (d ^ (b & (c ^ d))) + 0x550c7dc3 + w11)
+        a = (a + t1) & 0xffffffff
+        e = (t1 + ((((f >> 2) | (f << 30)) ^ ((f >> 13) | (f << 19)) ^
+                    ((f >> 22) | (f << 10))) & 0xffffffff) +
+             ((f & g) | (h & (f | g)))) & 0xffffffff
+        t1 = (d + ((((a >> 6) | (a << 26)) ^ ((a >> 11) | (a << 21)) ^
+                    ((a >> 25) | (a << 7))) & 0xffffffff) +
+              (c ^ (a & (b ^ c))) + 0x72be5d74 + w12)
+        h = (h + t1) & 0xffffffff
+        d = (t1 + ((((e >> 2) | (e << 30)) ^ ((e >> 13) | (e << 19)) ^
+                    ((e >> 22) | (e << 10))) & 0xffffffff) +
+             ((e & f) | (g & (e | f)))) & 0xffffffff
+        t1 = (c + ((((h >> 6) | (h << 26)) ^ ((h >> 11) | (h << 21)) ^
+                    ((h >> 25) | (h << 7))) & 0xffffffff) +
+              (b ^ (h & (a ^ b))) + 0x80deb1fe + w13)
+        g = (g + t1) & 0xffffffff
+        c = (t1 + ((((d >> 2) | (d << 30)) ^ ((d >> 13) | (d << 19)) ^
+                    ((d >> 22) | (d << 10))) & 0xffffffff) +
+             ((d & e) | (f & (d | e)))) & 0xffffffff
+        t1 = (b + ((((g >> 6) | (g << 26)) ^ ((g >> 11) | (g << 21)) ^
+                    ((g >> 25) | (g << 7))) & 0xffffffff) +
+              (a ^ (g & (h ^ a))) + 0x9bdc06a7 + w14)
+        f = (f + t1) & 0xffffffff
+        b = (t1 + ((((c >> 2) | (c << 30)) ^ ((c >> 13) | (c << 19)) ^
+                    ((c >> 22) | (c << 10))) & 0xffffffff) +
+             ((c & d) | (e & (c | d)))) & 0xffffffff
+        t1 = (a + ((((f >> 6) | (f << 26)) ^ ((f >> 11) | (f << 21)) ^
+                    ((f >> 25) | (f << 7))) & 0xffffffff) +
+              (h ^ (f & (g ^ h))) + 0xc19bf174 + w15)
+        e = (e + t1) & 0xffffffff
+        a = (t1 + ((((b >> 2) | (b << 30)) ^ ((b >> 13) | (b << 19)) ^
+                    ((b >> 22) | (b << 10))) & 0xffffffff) +
+             ((b & c) | (d & (b | c)))) & 0xffffffff
+        t1 = (h + ((((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^
+                    ((e >> 25) | (e << 7))) & 0xffffffff) +
+              (g ^ (e & (f ^ g))) + 0xe49b69c1 + w16)
+        d = (d + t1) & 0xffffffff
+        h = (t1 + ((((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^
+                    ((a >> 22) | (a << 10))) & 0xffffffff) +
+             ((a & b) | (c & (a | b)))) & 0xffffffff
+        t1 = (g + ((((d >> 6) | (d << 26)) ^ ((d >> 11) | (d << 21)) ^
+                    ((d >> 25) | (d << 7))) & 0xffffffff) +
+              (f ^ (d & (e ^ f))) + 0xefbe4786 + w17)
+        c = (c + t1) & 0xffffffff
+        g = (t1 + ((((h >> 2) | (h << 30)) ^ ((h >> 13) | (h << 19)) ^
+                    ((h >> 22) | (h << 10))) & 0xffffffff) +
+             ((h & a) | (b & (h | a)))) & 0xffffffff
+        t1 = (f + ((((c >> 6) | (c << 26)) ^ ((c >> 11) | (c << 21)) ^
+                    ((c >> 25) | (c << 7))) & 0xffffffff) +
+              (e ^ (c & (d ^ e))) + 0x0fc19dc6 + w18)
+        b = (b + t1) & 0xffffffff
+        f = (t1 + ((((g >> 2) | (g << 30)) ^ ((g >> 13) | (g << 19)) ^
+                    ((g >> 22) | (g << 10))) & 0xffffffff) +
+             ((g & h) | (a & (g | h)))) & 0xffffffff
+        t1 = (e + ((((b >> 6) | (b << 26)) ^ ((b >> 11) | (b << 21)) ^
+                    ((b >> 25) | (b << 7))) & 0xffffffff) +
+              (d ^ (b & (c ^ d))) + 0x240ca1cc + w19)
+        a = (a + t1) & 0xffffffff
+        e = (t1 + ((((f >> 2) | (f << 30)) ^ ((f >> 13) | (f << 19)) ^
+                    ((f >> 22) | (f << 10))) & 0xffffffff) +
+             ((f & g) | (h & (f | g)))) & 0xffffffff
+        t1 = (d + ((((a >> 6) | (a << 26)) ^ ((a >> 11) | (a << 21)) ^
+                    ((a >> 25) | (a << 7))) & 0xffffffff) +
+              (c ^ (a & (b ^ c))) + 0x2de92c6f + w20)
+        h = (h + t1) & 0xffffffff
+        d = (t1 + ((((e >> 2) | (e << 30)) ^ ((e >> 13) | (e << 19)) ^
+                    ((e >> 22) | (e << 10))) & 0xffffffff) +
+             ((e & f) | (g & (e | f)))) & 0xffffffff
+        t1 = (c + ((((h >> 6) | (h << 26)) ^ ((h >> 11) | (h << 21)) ^
+                    ((h >> 25) | (h << 7))) & 0xffffffff) +
+              (b ^ (h & (a ^ b))) + 0x4a7484aa + w21)
+        g = (g + t1) & 0xffffffff
+        c = (t1 + ((((d >> 2) | (d << 30)) ^ ((d >> 13) | (d << 19)) ^
+                    ((d >> 22) | (d << 10))) & 0xffffffff) +
+             ((d & e) | (f & (d | e)))) & 0xffffffff
+        t1 = (b + ((((g >> 6) | (g << 26)) ^ ((g >> 11) | (g << 21)) ^
+                    ((g >> 25) | (g << 7))) & 0xffffffff) +
+              (a ^ (g & (h ^ a))) + 0x5cb0a9dc + w22)
+        f = (f + t1) & 0xffffffff
+        b = (t1 + ((((c >> 2) | (c << 30)) ^ ((c >> 13) | (c << 19)) ^
+                    ((c >> 22) | (c << 10))) & 0xffffffff) +
+             ((c & d) | (e & (c | d)))) & 0xffffffff
+        t1 = (a + ((((f >> 6) | (f << 26)) ^ ((f >> 11) | (f << 21)) ^
+                    ((f >> 25) | (f << 7))) & 0xffffffff) +
+              (h ^ (f & (g ^ h))) + 0x76f988da + w23)
+        e = (e + t1) & 0xffffffff
+        a = (t1 + ((((b >> 2) | (b << 30)) ^ ((b >> 13) | (b << 19)) ^
+                    ((b >> 22) | (b << 10))) & 0xffffffff) +
+             ((b & c) | (d & (b | c)))) & 0xffffffff
+        t1 = (h + ((((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^
+                    ((e >> 25) | (e << 7))) & 0xffffffff) +
+              (g ^ (e & (f ^ g))) + 0x983e5152 + w24)
+        d = (d + t1) & 0xffffffff
+        h = (t1 + ((((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^
+                    ((a >> 22) | (a << 10))) & 0xffffffff) +
+             ((a & b) | (c & (a | b)))) & 0xffffffff
+        t1 = (g + ((((d >> 6) | (d << 26)) ^ ((d >> 11) | (d << 21)) ^
+                    ((d >> 25) | (d << 7))) & 0xffffffff) +
+              (f ^ (d & (e ^ f))) + 0xa831c66d + w25)
+        c = (c + t1) & 0xffffffff
+        g = (t1 + ((((h >> 2) | (h << 30)) ^ ((h >> 13) | (h << 19)) ^
+                    ((h >> 22) | (h << 10))) & 0xffffffff) +
+             ((h & a) | (b & (h | a)))) & 0xffffffff
+        t1 = (f + ((((c >> 6) | (c << 26)) ^ ((c >> 11) | (c << 21)) ^
+                    ((c >> 25) | (c << 7))) & 0xffffffff) +
+              (e ^ (c & (d ^ e))) + 0xb00327c8 + w26)
+        b = (b + t1) & 0xffffffff
+        f = (t1 + ((((g >> 2) | (g << 30)) ^ ((g >> 13) | (g << 19)) ^
+                    ((g >> 22) | (g << 10))) & 0xffffffff) +
+             ((g & h) | (a & (g | h)))) & 0xffffffff
+        t1 = (e + ((((b >> 6) | (b << 26)) ^ ((b >> 11) | (b << 21)) ^
+                    ((b >> 25) | (b << 7))) & 0xffffffff) +
+              (d ^ (b & (c ^ d))) + 0xbf597fc7 + w27)
+        a = (a + t1) & 0xffffffff
+        e = (t1 + ((((f >> 2) | (f << 30)) ^ ((f >> 13) | (f << 19)) ^
+                    ((f >> 22) | (f << 10))) & 0xffffffff) +
+             ((f & g) | (h & (f | g)))) & 0xffffffff
+        t1 = (d + ((((a >> 6) | (a << 26)) ^ ((a >> 11) | (a << 21)) ^
+                    ((a >> 25) | (a << 7))) & 0xffffffff) +
+              (c ^ (a & (b ^ c))) + 0xc6e00bf3 + w28)
+        h = (h + t1) & 0xffffffff
+        d = (t1 + ((((e >> 2) | (e << 30)) ^ ((e >> 13) | (e << 19)) ^
+                    ((e >> 22) | (e << 10))) & 0xffffffff) +
+             ((e & f) | (g & (e | f)))) & 0xffffffff
+        t1 = (c + ((((h >> 6) | (h << 26)) ^ ((h >> 11) | (h << 21)) ^
+                    ((h >> 25) | (h << 7))) & 0xffffffff) +
+              (b ^ (h & (a ^ b))) + 0xd5a79147 + w29)
+        g = (g + t1) & 0xffffffff
+        c = (t1 + ((((d >> 2) | (d << 30)) ^ ((d >> 13) | (d << 19)) ^
+                    ((d >> 22) | (d << 10))) & 0xffffffff) +
+             ((d & e) | (f & (d | e)))) & 0xffffffff
+        t1 = (b + ((((g >> 6) | (g << 26)) ^ ((g >> 11) | (g << 21)) ^
+                    ((g >> 25) | (g << 7))) & 0xffffffff) +
+              (a ^ (g & (h ^ a))) + 0x06ca6351 + w30)
+        f = (f + t1) & 0xffffffff
+        b = (t1 + ((((c >> 2) | (c << 30)) ^ ((c >> 13) | (c << 19)) ^
+                    ((c >> 22) | (c << 10))) & 0xffffffff) +
+             ((c & d) | (e & (c | d)))) & 0xffffffff
+        t1 = (a + ((((f >> 6) | (f << 26)) ^ ((f >> 11) | (f << 21)) ^
+                    ((f >> 25) | (f << 7))) & 0xffffffff) +
+              (h ^ (f & (g ^ h))) + 0x14292967 + w31)
+        e = (e + t1) & 0xffffffff
+        a = (t1 + ((((b >> 2) | (b << 30)) ^ ((b >> 13) | (b << 19)) ^
+                    ((b >> 22) | (b << 10))) & 0xffffffff) +
+             ((b & c) | (d & (b | c)))) & 0xffffffff
+        t1 = (h + ((((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^
+                    ((e >> 25) | (e << 7))) & 0xffffffff) +
+              (g ^ (e & (f ^ g))) + 0x27b70a85 + w32)
+        d = (d + t1) & 0xffffffff
+        h = (t1 + ((((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^
+                    ((a >> 22) | (a << 10))) & 0xffffffff) +
+             ((a & b) | (c & (a | b)))) & 0xffffffff
+        t1 = (g + ((((d >> 6) | (d << 26)) ^ ((d >> 11) | (d << 21)) ^
+                    ((d >> 25) | (d << 7))) & 0xffffffff) +
+              (f ^ (d & (e ^ f))) + 0x2e1b2138 + w33)
+        c = (c + t1) & 0xffffffff
+        g = (t1 + ((((h >> 2) | (h << 30)) ^ ((h >> 13) | (h << 19)) ^
+                    ((h >> 22) | (h << 10))) & 0xffffffff) +
+             ((h & a) | (b & (h | a)))) & 0xffffffff
+        t1 = (f + ((((c >> 6) | (c << 26)) ^ ((c >> 11) | (c << 21)) ^
+                    ((c >> 25) | (c << 7))) & 0xffffffff) +
+              (e ^ (c & (d ^ e))) + 0x4d2c6dfc + w34)
+        b = (b + t1) & 0xffffffff
+        f = (t1 + ((((g >> 2) | (g << 30)) ^ ((g >> 13) | (g << 19)) ^
+                    ((g >> 22) | (g << 10))) & 0xffffffff) +
+             ((g & h) | (a & (g | h)))) & 0xffffffff
+        t1 = (e + ((((b >> 6) | (b << 26)) ^ ((b >> 11) | (b << 21)) ^
+                    ((b >> 25) | (b << 7))) & 0xffffffff) +
+              (d ^ (b & (c ^ d))) + 0x53380d13 + w35)
+        a = (a + t1) & 0xffffffff
+        e = (t1 + ((((f >> 2) | (f << 30)) ^ ((f >> 13) | (f << 19)) ^
+                    ((f >> 22) | (f << 10))) & 0xffffffff) +
+             ((f & g) | (h & (f | g)))) & 0xffffffff
+        t1 = (d + ((((a >> 6) | (a << 26)) ^ ((a >> 11) | (a << 21)) ^
+                    ((a >> 25) | (a << 7))) & 0xffffffff) +
+              (c ^ (a & (b ^ c))) + 0x650a7354 + w36)
+        h = (h + t1) & 0xffffffff
+        d = (t1 + ((((e >> 2) | (e << 30)) ^ ((e >> 13) | (e << 19)) ^
+                    ((e >> 22) | (e << 10))) & 0xffffffff) +
+             ((e & f) | (g & (e | f)))) & 0xffffffff
+        t1 = (c + ((((h >> 6) | (h << 26)) ^ ((h >> 11) | (h << 21)) ^
+                    ((h >> 25) | (h << 7))) & 0xffffffff) +
+              (b ^ (h & (a ^ b))) + 0x766a0abb + w37)
+        g = (g + t1) & 0xffffffff
+        c = (t1 + ((((d >> 2) | (d << 30)) ^ ((d >> 13) | (d << 19)) ^
+                    ((d >> 22) | (d << 10))) & 0xffffffff) +
+             ((d & e) | (f & (d | e)))) & 0xffffffff
+        t1 = (b + ((((g >> 6) | (g << 26)) ^ ((g >> 11) | (g << 21)) ^
+                    ((g >> 25) | (g << 7))) & 0xffffffff) +
+              (a ^ (g & (h ^ a))) + 0x81c2c92e + w38)
+        f = (f + t1) & 0xffffffff
+        b = (t1 + ((((c >> 2) | (c << 30)) ^ ((c >> 13) | (c << 19)) ^
+                    ((c >> 22) | (c << 10))) & 0xffffffff) +
+             ((c & d) | (e & (c | d)))) & 0xffffffff
+        t1 = (a + ((((f >> 6) | (f << 26)) ^ ((f >> 11) | (f << 21)) ^
+                    ((f >> 25) | (f << 7))) & 0xffffffff) +
+              (h ^ (f & (g ^ h))) + 0x92722c85 + w39)
+        e = (e + t1) & 0xffffffff
+        a = (t1 + ((((b >> 2) | (b << 30)) ^ ((b >> 13) | (b << 19)) ^
+                    ((b >> 22) | (b << 10))) & 0xffffffff) +
+             ((b & c) | (d & (b | c)))) & 0xffffffff
+        t1 = (h + ((((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^
+                    ((e >> 25) | (e << 7))) & 0xffffffff) +
+              (g ^ (e & (f ^ g))) + 0xa2bfe8a1 + w40)
+        d = (d + t1) & 0xffffffff
+        h = (t1 + ((((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^
+                    ((a >> 22) | (a << 10))) & 0xffffffff) +
+             ((a & b) | (c & (a | b)))) & 0xffffffff
+        t1 = (g + ((((d >> 6) | (d << 26)) ^ ((d >> 11) | (d << 21)) ^
+                    ((d >> 25) | (d << 7))) & 0xffffffff) +
+              (f ^ (d & (e ^ f))) + 0xa81a664b + w41)
+        c = (c + t1) & 0xffffffff
+        g = (t1 + ((((h >> 2) | (h << 30)) ^ ((h >> 13) | (h << 19)) ^
+                    ((h >> 22) | (h << 10))) & 0xffffffff) +
+             ((h & a) | (b & (h | a)))) & 0xffffffff
+        t1 = (f + ((((c >> 6) | (c << 26)) ^ ((c >> 11) | (c << 21)) ^
+                    ((c >> 25) | (c << 7))) & 0xffffffff) +
+              (e ^ (c & (d ^ e))) + 0xc24b8b70 + w42)
+        b = (b + t1) & 0xffffffff
+        f = (t1 + ((((g >> 2) | (g << 30)) ^ ((g >> 13) | (g << 19)) ^
+                    ((g >> 22) | (g << 10))) & 0xffffffff) +
+             ((g & h) | (a & (g | h)))) & 0xffffffff
+        t1 = (e + ((((b >> 6) | (b << 26)) ^ ((b >> 11) | (b << 21)) ^
+                    ((b >> 25) | (b << 7))) & 0xffffffff) +
+              (d ^ (b & (c ^ d))) + 0xc76c51a3 + w43)
+        a = (a + t1) & 0xffffffff
+        e = (t1 + ((((f >> 2) | (f << 30)) ^ ((f >> 13) | (f << 19)) ^
+                    ((f >> 22) | (f << 10))) & 0xffffffff) +
+             ((f & g) | (h & (f | g)))) & 0xffffffff
+        t1 = (d + ((((a >> 6) | (a << 26)) ^ ((a >> 11) | (a << 21)) ^
+                    ((a >> 25) | (a << 7))) & 0xffffffff) +
+              (c ^ (a & (b ^ c))) + 0xd192e819 + w44)
+        h = (h + t1) & 0xffffffff
+        d = (t1 + ((((e >> 2) | (e << 30)) ^ ((e >> 13) | (e << 19)) ^
+                    ((e >> 22) | (e << 10))) & 0xffffffff) +
+             ((e & f) | (g & (e | f)))) & 0xffffffff
+        t1 = (c + ((((h >> 6) | (h << 26)) ^ ((h >> 11) | (h << 21)) ^
+                    ((h >> 25) | (h << 7))) & 0xffffffff) +
+              (b ^ (h & (a ^ b))) + 0xd6990624 + w45)
+        g = (g + t1) & 0xffffffff
+        c = (t1 + ((((d >> 2) | (d << 30)) ^ ((d >> 13) | (d << 19)) ^
+                    ((d >> 22) | (d << 10))) & 0xffffffff) +
+             ((d & e) | (f & (d | e)))) & 0xffffffff
+        t1 = (b + ((((g >> 6) | (g << 26)) ^ ((g >> 11) | (g << 21)) ^
+                    ((g >> 25) | (g << 7))) & 0xffffffff) +
+              (a ^ (g & (h ^ a))) + 0xf40e3585 + w46)
+        f = (f + t1) & 0xffffffff
+        b = (t1 + ((((c >> 2) | (c << 30)) ^ ((c >> 13) | (c << 19)) ^
+                    ((c >> 22) | (c << 10))) & 0xffffffff) +
+             ((c & d) | (e & (c | d)))) & 0xffffffff
+        t1 = (a + ((((f >> 6) | (f << 26)) ^ ((f >> 11) | (f << 21)) ^
+                    ((f >> 25) | (f << 7))) & 0xffffffff) +
+              (h ^ (f & (g ^ h))) + 0x106aa070 + w47)
+        e = (e + t1) & 0xffffffff
+        a = (t1 + ((((b >> 2) | (b << 30)) ^ ((b >> 13) | (b << 19)) ^
+                    ((b >> 22) | (b << 10))) & 0xffffffff) +
+             ((b & c) | (d & (b | c)))) & 0xffffffff
+        t1 = (h + ((((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^
+                    ((e >> 25) | (e << 7))) & 0xffffffff) +
+              (g ^ (e & (f ^ g))) + 0x19a4c116 + w48)
+        d = (d + t1) & 0xffffffff
+        h = (t1 + ((((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^
+                    ((a >> 22) | (a << 10))) & 0xffffffff) +
+             ((a & b) | (c & (a | b)))) & 0xffffffff
+        t1 = (g + ((((d >> 6) | (d << 26)) ^ ((d >> 11) | (d << 21)) ^
+                    ((d >> 25) | (d << 7))) & 0xffffffff) +
+              (f ^ (d & (e ^ f))) + 0x1e376c08 + w49)
+        c = (c + t1) & 0xffffffff
+        g = (t1 + ((((h >> 2) | (h << 30)) ^ ((h >> 13) | (h << 19)) ^
+                    ((h >> 22) | (h << 10))) & 0xffffffff) +
+             ((h & a) | (b & (h | a)))) & 0xffffffff
+        t1 = (f + ((((c >> 6) | (c << 26)) ^ ((c >> 11) | (c << 21)) ^
+                    ((c >> 25) | (c << 7))) & 0xffffffff) +
+              (e ^ (c & (d ^ e))) + 0x2748774c + w50)
+        b = (b + t1) & 0xffffffff
+        f = (t1 + ((((g >> 2) | (g << 30)) ^ ((g >> 13) | (g << 19)) ^
+                    ((g >> 22) | (g << 10))) & 0xffffffff) +
+             ((g & h) | (a & (g | h)))) & 0xffffffff
+        t1 = (e + ((((b >> 6) | (b << 26)) ^ ((b >> 11) | (b << 21)) ^
+                    ((b >> 25) | (b << 7))) & 0xffffffff) +
+              (d ^ (b & (c ^ d))) + 0x34b0bcb5 + w51)
+        a = (a + t1) & 0xffffffff
+        e = (t1 + ((((f >> 2) | (f << 30)) ^ ((f >> 13) | (f << 19)) ^
+                    ((f >> 22) | (f << 10))) & 0xffffffff) +
+             ((f & g) | (h & (f | g)))) & 0xffffffff
+        t1 = (d + ((((a >> 6) | (a << 26)) ^ ((a >> 11) | (a << 21)) ^
+                    ((a >> 25) | (a << 7))) & 0xffffffff) +
+              (c ^ (a & (b ^ c))) + 0x391c0cb3 + w52)
+        h = (h + t1) & 0xffffffff
+        d = (t1 + ((((e >> 2) | (e << 30)) ^ ((e >> 13) | (e << 19)) ^
+                    ((e >> 22) | (e << 10))) & 0xffffffff) +
+             ((e & f) | (g & (e | f)))) & 0xffffffff
+        t1 = (c + ((((h >> 6) | (h << 26)) ^ ((h >> 11) | (h << 21)) ^
+                    ((h >> 25) | (h << 7))) & 0xffffffff) +
+              (b ^ (h & (a ^ b))) + 0x4ed8aa4a + w53)
+        g = (g + t1) & 0xffffffff
+        c = (t1 + ((((d >> 2) | (d << 30)) ^ ((d >> 13) | (d << 19)) ^
+                    ((d >> 22) | (d << 10))) & 0xffffffff) +
+             ((d & e) | (f & (d | e)))) & 0xffffffff
+        t1 = (b + ((((g >> 6) | (g << 26)) ^ ((g >> 11) | (g << 21)) ^
+                    ((g >> 25) | (g << 7))) & 0xffffffff) +
+              (a ^ (g & (h ^ a))) + 0x5b9cca4f + w54)
+        f = (f + t1) & 0xffffffff
+        b = (t1 + ((((c >> 2) | (c << 30)) ^ ((c >> 13) | (c << 19)) ^
+                    ((c >> 22) | (c << 10))) & 0xffffffff) +
+             ((c & d) | (e & (c | d)))) & 0xffffffff
+        t1 = (a + ((((f >> 6) | (f << 26)) ^ ((f >> 11) | (f << 21)) ^
+                    ((f >> 25) | (f << 7))) & 0xffffffff) +
+              (h ^ (f & (g ^ h))) + 0x682e6ff3 + w55)
+        e = (e + t1) & 0xffffffff
+        a = (t1 + ((((b >> 2) | (b << 30)) ^ ((b >> 13) | (b << 19)) ^
+                    ((b >> 22) | (b << 10))) & 0xffffffff) +
+             ((b & c) | (d & (b | c)))) & 0xffffffff
+        t1 = (h + ((((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^
+                    ((e >> 25) | (e << 7))) & 0xffffffff) +
+              (g ^ (e & (f ^ g))) + 0x748f82ee + w56)
+        d = (d + t1) & 0xffffffff
+        h = (t1 + ((((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^
+                    ((a >> 22) | (a << 10))) & 0xffffffff) +
+             ((a & b) | (c & (a | b)))) & 0xffffffff
+        t1 = (g + ((((d >> 6) | (d << 26)) ^ ((d >> 11) | (d << 21)) ^
+                    ((d >> 25) | (d << 7))) & 0xffffffff) +
+              (f ^ (d & (e ^ f))) + 0x78a5636f + w57)
+        c = (c + t1) & 0xffffffff
+        g = (t1 + ((((h >> 2) | (h << 30)) ^ ((h >> 13) | (h << 19)) ^
+                    ((h >> 22) | (h << 10))) & 0xffffffff) +
+             ((h & a) | (b & (h | a)))) & 0xffffffff
+        t1 = (f + ((((c >> 6) | (c << 26)) ^ ((c >> 11) | (c << 21)) ^
+                    ((c >> 25) | (c << 7))) & 0xffffffff) +
+              (e ^ (c & (d ^ e))) + 0x84c87814 + w58)
+        b = (b + t1) & 0xffffffff
+        f = (t1 + ((((g >> 2) | (g << 30)) ^ ((g >> 13) | (g << 19)) ^
+                    ((g >> 22) | (g << 10))) & 0xffffffff) +
+             ((g & h) | (a & (g | h)))) & 0xffffffff
+        t1 = (e + ((((b >> 6) | (b << 26)) ^ ((b >> 11) | (b << 21)) ^
+                    ((b >> 25) | (b << 7))) & 0xffffffff) +
+              (d ^ (b & (c ^ d))) + 0x8cc70208 + w59)
+        a = (a + t1) & 0xffffffff
+        e = (t1 + ((((f >> 2) | (f << 30)) ^ ((f >> 13) | (f << 19)) ^
+                    ((f >> 22) | (f << 10))) & 0xffffffff) +
+             ((f & g) | (h & (f | g)))) & 0xffffffff
+        t1 = (d + ((((a >> 6) | (a << 26)) ^ ((a >> 11) | (a << 21)) ^
+                    ((a >> 25) | (a << 7))) & 0xffffffff) +
+              (c ^ (a & (b ^ c))) + 0x90befffa + w60)
+        h = (h + t1) & 0xffffffff
+        d = (t1 + ((((e >> 2) | (e << 30)) ^ ((e >> 13) | (e << 19)) ^
+                    ((e >> 22) | (e << 10))) & 0xffffffff) +
+             ((e & f) | (g & (e | f)))) & 0xffffffff
+        t1 = (c + ((((h >> 6) | (h << 26)) ^ ((h >> 11) | (h << 21)) ^
+                    ((h >> 25) | (h << 7))) & 0xffffffff) +
+              (b ^ (h & (a ^ b))) + 0xa4506ceb + w61)
+        g = (g + t1) & 0xffffffff
+        c = (t1 + ((((d >> 2) | (d << 30)) ^ ((d >> 13) | (d << 19)) ^
+                    ((d >> 22) | (d << 10))) & 0xffffffff) +
+             ((d & e) | (f & (d | e)))) & 0xffffffff
+        t1 = (b + ((((g >> 6) | (g << 26)) ^ ((g >> 11) | (g << 21)) ^
+                    ((g >> 25) | (g << 7))) & 0xffffffff) +
+              (a ^ (g & (h ^ a))) + 0xbef9a3f7 + w62)
+        f = (f + t1) & 0xffffffff
+        b = (t1 + ((((c >> 2) | (c << 30)) ^ ((c >> 13) | (c << 19)) ^
+                    ((c >> 22) | (c << 10))) & 0xffffffff) +
+             ((c & d) | (e & (c | d)))) & 0xffffffff
+        t1 = (a + ((((f >> 6) | (f << 26)) ^ ((f >> 11) | (f << 21)) ^
+                    ((f >> 25) | (f << 7))) & 0xffffffff) +
+              (h ^ (f & (g ^ h))) + 0xc67178f2 + w63)
+        e = (e + t1) & 0xffffffff
+        a = (t1 + ((((b >> 2) | (b << 30)) ^ ((b >> 13) | (b << 19)) ^
+                    ((b >> 22) | (b << 10))) & 0xffffffff) +
+             ((b & c) | (d & (b | c)))) & 0xffffffff
+        H[0] = (a + H[0]) & 0xffffffff
+        H[1] = (b + H[1]) & 0xffffffff
+        H[2] = (c + H[2]) & 0xffffffff
+        H[3] = (d + H[3]) & 0xffffffff
+        H[4] = (e + H[4]) & 0xffffffff
+        H[5] = (f + H[5]) & 0xffffffff
+        H[6] = (g + H[6]) & 0xffffffff
+        H[7] = (h + H[7]) & 0xffffffff
+
+    def output(self, H):
         hash = bytes()
         for i in range(8):
             hash += H[i].to_bytes(4, 'big')
         return hash
 
     def Digest(self, msg):
-        return self.compute(self.padding(msg))
+        return self.__class__(msg, self.fast).digest()
+
+    def compute(self, msg):
+        H = list(self.H0)
+        for p in range(0, len(msg) - len(msg) % 64, 64):
+            self.block(H, msg, p)
+        return self.output(H)
 
 
-class ripemd160:
+class ripemd160(MDHash):
+    digest_size = 20
+    length_order = 'little'
+    H0 = [0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0]
     r1 = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
           7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
           3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12,
@@ -232,48 +1382,6 @@ class ripemd160:
           15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
           8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11, ]
 
-    def f(self, j, x, y, z):
-        if 0 <= j and j <= 15:
-            return x ^ y ^ z
-        if 16 <= j and j <= 31:
-            return (x & y) | ((~x) & z)
-        if 32 <= j and j <= 47:
-            return (x | (~y)) ^ z
-        if 48 <= j and j <= 63:
-            return (x & z) | (y & (~z))
-        if 64 <= j and j <= 79:
-            return x ^ (y | (~z))
-        return 0
-
-    def K1(self, j):
-        if 0 <= j and j <= 15:
-            return 0x00000000
-        if 16 <= j and j <= 31:
-            return 0x5A827999
-        if 32 <= j and j <= 47:
-            return 0x6ED9EBA1
-        if 48 <= j and j <= 63:
-            return 0x8F1BBCDC
-        if 64 <= j and j <= 79:
-            return 0xA953FD4E
-        return 0
-
-    def K2(self, j):
-        if 0 <= j and j <= 15:
-            return 0x50A28BE6
-        if 16 <= j and j <= 31:
-            return 0x5C4DD124
-        if 32 <= j and j <= 47:
-            return 0x6D703EF3
-        if 48 <= j and j <= 63:
-            return 0x7A6D76E9
-        if 64 <= j and j <= 79:
-            return 0x00000000
-        return 0
-
-    def rol(self, s, x):
-        return (x << s) | (x >> (32 - s))
-
     def padding(self, msg):
         l = len(msg)
         bs = bytes(msg) + b'\x80'
@@ -285,40 +1393,97 @@ class ripemd160:
         bs += l.to_bytes(8, 'little')
         return bs
 
-    def ta(self, x, y):
-        return (x + y) & 0xFFFFFFFF
+    # (r1, s1, r2, s2) of the 16 steps of each round
+    rounds = [list(zip(r1[0:16], s1[0:16], r2[0:16], s2[0:16])),
+              list(zip(r1[16:32], s1[16:32], r2[16:32], s2[16:32])),
+              list(zip(r1[32:48], s1[32:48], r2[32:48], s2[32:48])),
+              list(zip(r1[48:64], s1[48:64], r2[48:64], s2[48:64])),
+              list(zip(r1[64:80], s1[64:80], r2[64:80], s2[64:80]))]
 
-    def compute(self, msg):
-        t = int(len(msg) / 64)
-        h0, h1, h2, h3, h4 = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0
-        for i in range(t):
-            X = [0]*16
-            for t in range(16):
-                p = i*64 + t*4
-                X[t] = int.from_bytes(msg[p: p+4], 'little')
-            A1, B1, C1, D1, E1 = h0, h1, h2, h3, h4
-            A2, B2, C2, D2, E2 = h0, h1, h2, h3, h4
-            T = 0
-            for j in range(80):
-                T = self.ta(
-                    self.rol(self.s1[j], self.ta(self.ta(self.ta(A1, self.f(j, B1, C1, D1)), X[self.r1[j]]), self.K1(j))), E1)
-                A1, E1, D1, C1, B1 = E1, D1, self.rol(10, C1), B1, T
-                T = self.ta(
-                    self.rol(self.s2[j], self.ta(self.ta(self.ta(A2, self.f(79-j, B2, C2, D2)), X[self.r2[j]]), self.K2(j))), E2)
-                A2, E2, D2, C2, B2 = E2, D2, self.rol(10, C2), B2, T
-            T = self.ta(self.ta(h1, C1), D2)
-            h1 = self.ta(self.ta(h2, D1), E2)
-            h2 = self.ta(self.ta(h3, E1), A2)
-            h3 = self.ta(self.ta(h4, A1), B2)
-            h4 = self.ta(self.ta(h0, B1), C2)
-            h0 = T
+    def block(self, H, msg, p, unpack_from=struct.unpack_from):
+        X = unpack_from('<16I', msg, p)
+        h0, h1, h2, h3, h4 = H
+        A1, B1, C1, D1, E1 = h0, h1, h2, h3, h4
+        A2, B2, C2, D2, E2 = h0, h1, h2, h3, h4
+        M = 0xFFFFFFFF
+        # round 1: f1 / K = 0x00000000 and f5 / K' = 0x50A28BE6
+        for i, s, j, t in self.rounds[0]:
+            T = (A1 + (B1 ^ C1 ^ D1) + X[i]) & M
+            A1, E1, D1, C1, B1 = E1, D1, ((C1 << 10) | (C1 >> 22)) & M, B1, \
+                (((T << s) | (T >> (32 - s))) + E1) & M
+            T = (A2 + (B2 ^ (C2 | ~D2)) + X[j] + 0x50A28BE6) & M
+            A2, E2, D2, C2, B2 = E2, D2, ((C2 << 10) | (C2 >> 22)) & M, B2, \
+                (((T << t) | (T >> (32 - t))) + E2) & M
+        # round 2: f2 / K = 0x5A827999 and f4 / K' = 0x5C4DD124
+        for i, s, j, t in self.rounds[1]:
+            T = (A1 + ((B1 & C1) | (~B1 & D1)) + X[i] + 0x5A827999) & M
+            A1, E1, D1, C1, B1 = E1, D1, ((C1 << 10) | (C1 >> 22)) & M, B1, \
+                (((T << s) | (T >> (32 - s))) + E1) & M
+            T = (A2 + ((B2 & D2) | (C2 & ~D2)) + X[j] + 0x5C4DD124) & M
+            A2, E2, D2, C2, B2 = E2, D2, ((C2 << 10) | (C2 >> 22)) & M, B2, \
+                (((T << t) | (T >> (32 - t))) + E2) & M
+        # round 3: f3 / K = 0x6ED9EBA1 and f3 / K' = 0x6D703EF3
+        for i, s, j, t in self.rounds[2]:
+            T = (A1 + ((B1 | ~C1) ^ D1) + X[i] + 0x6ED9EBA1) & M
+            A1, E1, D1, C1, B1 = E1, D1, ((C1 << 10) | (C1 >> 22)) & M, B1, \
+                (((T << s) | (T >> (32 - s))) + E1) & M
+            T = (A2 + ((B2 | ~C2) ^ D2) + X[j] + 0x6D703EF3) & M
+            A2, E2, D2, C2, B2 = E2, D2, ((C2 << 10) | (C2 >> 22)) & M, B2, \
+                (((T << t) | (T >> (32 - t))) + E2) & M
+        # round 4: f4 / K = 0x8F1BBCDC and f2 / K' = 0x7A6D76E9
+        for i, s, j, t in self.rounds[3]:
+            T = (A1 + ((B1 & D1) | (C1 & ~D1)) + X[i] + 0x8F1BBCDC) & M
+            A1, E1, D1, C1, B1 = E1, D1, ((C1 << 10) | (C1 >> 22)) & M, B1, \
+                (((T << s) | (T >> (32 - s))) + E1) & M
+            T = (A2 + ((B2 & C2) | (~B2 & D2)) + X[j] + 0x7A6D76E9) & M
+            A2, E2, D2, C2, B2 = E2, D2, ((C2 << 10) | (C2 >> 22)) & M, B2, \
+                (((T << t) | (T >> (32 - t))) + E2) & M
+        # round 5: f5 / K = 0xA953FD4E and f1 / K' = 0x00000000
+        for i, s, j, t in self.rounds[4]:
+            T = (A1 + (B1 ^ (C1 | ~D1)) + X[i] + 0xA953FD4E) & M
+            A1, E1, D1, C1, B1 = E1, D1, ((C1 << 10) | (C1 >> 22)) & M, B1, \
+                (((T << s) | (T >> (32 - s))) + E1) & M
+            T = (A2 + (B2 ^ C2 ^ D2) + X[j]) & M
+            A2, E2, D2, C2, B2 = E2, D2, ((C2 << 10) | (C2 >> 22)) & M, B2, \
+                (((T << t) | (T >> (32 - t))) + E2) & M
+        H[:] = [(h1 + C1 + D2) & M, (h2 + D1 + E2) & M, (h3 + E1 + A2) & M,
+                (h4 + A1 + B2) & M, (h0 + B1 + C2) & M]
+
+    def output(self, H):
         hash = bytes()
-        hash += h0.to_bytes(4, 'little')
-        hash += h1.to_bytes(4, 'little')
-        hash += h2.to_bytes(4, 'little')
-        hash += h3.to_bytes(4, 'little')
-        hash += h4.to_bytes(4, 'little')
+        for h in H:
+            hash += h.to_bytes(4, 'little')
         return hash
 
-    def Digest(self, msg):
-        return self.compute(self.padding(msg))
+    def compute(self, msg):
+        H = list(self.H0)
+        for p in range(0, len(msg) - len(msg) % 64, 64):
+            self.block(H, msg, p)
+        return self.output(H)
+
+
+# padding of a single 32-byte message
+_SHA256_PAD32 = b'\x80' + b'\x00' * 23 + (256).to_bytes(8, 'big')
+_RIPEMD160_PAD32 = b'\x80' + b'\x00' * 23 + (256).to_bytes(8, 'little')
+
+
+def hash256(msg):
+    # sha256(sha256(msg)), the outer hash is a single block
+    h = sha256()
+    H = list(sha256.H0)
+    h.block(H, h.update(msg).digest() + _SHA256_PAD32, 0)
+    return h.output(H)
+
+
+def hash160(msg):
+    # ripemd160(sha256(msg)), the outer hash is a single block
+    h = ripemd160()
+    H = list(ripemd160.H0)
+    h.block(H, sha256(msg).digest() + _RIPEMD160_PAD32, 0)
+    return h.output(H)
+
+
+def derive_many(points, compressed=True):
+    # hash160 of the SEC encoding of every point
+    S256P.normalize_many(points)
+    return [hash160(Q.sec(compressed)) for Q in points]
@@ -0,0 +1,78 @@
+from hmac.drbg import HmacDRBG
+from ipynb.ecc import FiniteField
+from ipynb.ecc import G
+from ipynb.ecc import S256FF
+from ipynb.ecc import S256P
+from ipynb.ecc import batch_inverse
+
+N = S256P.N
+
+
+def deterministic_k(privkey, z):
+    # RFC 6979 3.2 with HMAC-SHA256, qlen = hlen = 256:
+    # steps b-f instantiate HMAC_DRBG with x || h1, every candidate of
+    # step h is one generate call
+    x = privkey.to_bytes(32, 'big')
+    h = (z % N).to_bytes(32, 'big')
+    return HmacDRBG(x + h).generate_scalars(1, N)[0]
+
+
+def sign(privkey, z):
+    if not 1 <= privkey < N:
+        raise ValueError('The private key is out of range.')
+    k = deterministic_k(privkey, z)
+    r = (k * G).x.num % N
+    s = ((z + r * privkey) * pow(k, N - 2, N)) % N
+    # low-s form
+    if s > N // 2:
+        s = N - s
+    return r, s
+
+
+def _valid_pubkey(pubkey):
+    # SEC1 3.2.2.1: not infinity, coordinates in [0, P) and on the curve
+    # Y^2 = X^3 + 7Z^6 (Jacobian); the cofactor is 1, so n*Q = O holds
+    if not isinstance(pubkey, S256P):
+        return False
+    P = S256FF.P
+    X, Y, Z = pubkey.X, pubkey.Y, pubkey.Z
+    if Z == 0 or not (0 <= X < P and 0 <= Y < P and 0 < Z < P):
+        return False
+    Z2 = (Z * Z) % P
+    return (Y * Y - X * X * X - 7 * Z2 * Z2 * Z2) % P == 0
+
+
+def _check(pubkey, z, r, s_inv):
+    if not _valid_pubkey(pubkey):
+        return False
+    R = S256P.multi_mul([z * s_inv, r * s_inv], [G, pubkey])
+    if R.Z == 0:
+        return False
+    # R.x == r (mod N) without normalizing R: X == x * Z^2 (mod P)
+    P = S256FF.P
+    Z2 = (R.Z * R.Z) % P
+    for x in (r, r + N):
+        if x < P and (R.X - x * Z2) % P == 0:
+            return True
+    return False
+
+
+def verify(pubkey, z, sig):
+    r, s = sig
+    if not (1 <= r < N and 1 <= s < N):
+        return False
+    return _check(pubkey, z, r, pow(s, N - 2, N))
+
+
+def verify_batch(entries):
+    # entries: [(pubkey, z, sig), ...] -> [bool, ...]
+    # all s^-1 come from a single inversion
+    results = [False] * len(entries)
+    items = []
+    for i, (pubkey, z, (r, s)) in enumerate(entries):
+        if 1 <= r < N and 1 <= s < N:
+            items.append((i, pubkey, z, r, s))
+    s_inv = batch_inverse([FiniteField(s, N) for _, _, _, _, s in items])
+    for (i, pubkey, z, r, _), w in zip(items, s_inv):
+        results[i] = _check(pubkey, z, r, w.num)
+    return results
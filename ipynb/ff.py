@@ -1,4 +1,6 @@
 class FiniteField:
+    __slots__ = ('num', 'prime')
+
     def __init__(self, num, prime):
         if num < 0:
             raise ValueError('The number is minus.')
@@ -48,3 +50,37 @@ class FiniteField:
 
     def __repr__(self):
         return 'prime:{} , num:{}'.format(self.prime, self.num)
+
+
+def _batch_inv(nums, prime):
+    # Montgomery's trick: 1 inversion and 3(n-1) multiplications
+    prefix = []
+    acc = 1
+    for n in nums:
+        prefix.append(acc)
+        acc = (acc * n) % prime
+    inv = pow(acc, prime - 2, prime)
+    result = [0] * len(nums)
+    for i in range(len(nums) - 1, -1, -1):
+        result[i] = (inv * prefix[i]) % prime
+        inv = (inv * nums[i]) % prime
+    return result
+
+
+def batch_inverse(elements):
+    if len(elements) == 0:
+        return []
+    prime = elements[0].prime
+    for e in elements:
+        if e.prime != prime:
+            raise TypeError('No match prime.')
+        if e.num == 0:
+            raise ZeroDivisionError('The number is zero.')
+    nums = _batch_inv([e.num for e in elements], prime)
+    return [e.__class__(n, prime) for e, n in zip(elements, nums)]
+
+
+def batch_div(numerators, denominators):
+    if len(numerators) != len(denominators):
+        raise ValueError('The number of numerators and denominators differ.')
+    return [a * b for a, b in zip(numerators, batch_inverse(denominators))]
@@ -0,0 +1,173 @@
+import numpy as np
+from ipynb.ff import FiniteField
+
+# products of two residues must fit in a uint64 lane
+MAX_PRIME = 1 << 32
+
+
+def _to_nums(nums, prime):
+    a = np.array(nums)
+    if a.size == 0:
+        return np.zeros(a.shape, dtype=np.uint64)
+    if a.dtype == object:
+        a = np.frompyfunc(lambda v: v.num if isinstance(v, FiniteField) else v,
+                          1, 1)(a)
+        if (a < 0).any():
+            raise ValueError('The number is minus.')
+        return (a % prime).astype(np.uint64)
+    if a.dtype.kind not in 'iu':
+        raise TypeError('The numbers are not integers.')
+    if a.dtype.kind == 'i' and (a < 0).any():
+        raise ValueError('The number is minus.')
+    return a.astype(np.uint64) % np.uint64(prime)
+
+
+class FieldArray:
+    # elements of GF(prime) in a uint64 array, prime < 2^32
+    __slots__ = ('nums', 'prime')
+
+    def __init__(self, nums, prime):
+        if not 2 <= prime < MAX_PRIME:
+            raise ValueError('The prime is out of range.')
+        self.prime = prime
+        self.nums = _to_nums(nums, prime)
+
+    @classmethod
+    def _new(cls, nums, prime):
+        # nums already reduced and of dtype uint64
+        obj = cls.__new__(cls)
+        obj.prime = prime
+        obj.nums = nums
+        return obj
+
+    def _operand(self, other):
+        if isinstance(other, FieldArray):
+            if self.prime != other.prime:
+                raise TypeError('No match prime.')
+            return other.nums
+        if isinstance(other, FiniteField):
+            if self.prime != other.prime:
+                raise TypeError('No match prime.')
+            return np.uint64(other.num)
+        return np.uint64(other % self.prime)
+
+    def _wrap(self, nums):
+        if nums.ndim == 0:
+            return FiniteField(int(nums), self.prime)
+        return self._new(nums, self.prime)
+
+    @property
+    def shape(self):
+        return self.nums.shape
+
+    def __len__(self):
+        return len(self.nums)
+
+    def __getitem__(self, index):
+        return self._wrap(self.nums[index])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def tolist(self):
+        return self.nums.tolist()
+
+    def __add__(self, other):
+        p = np.uint64(self.prime)
+        return self._new((self.nums + self._operand(other)) % p, self.prime)
+
+    def __radd__(self, other):
+        return self + other
+
+    def __sub__(self, other):
+        p = np.uint64(self.prime)
+        return self._new((self.nums + (p - self._operand(other))) % p,
+                         self.prime)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __neg__(self):
+        p = np.uint64(self.prime)
+        return self._new((p - self.nums) % p, self.prime)
+
+    def __mul__(self, other):
+        p = np.uint64(self.prime)
+        return self._new((self.nums * self._operand(other)) % p, self.prime)
+
+    def __rmul__(self, coefficient):
+        return self * coefficient
+
+    def __pow__(self, exponent):
+        # square and multiply on every lane
+        p = np.uint64(self.prime)
+        n = exponent % (self.prime - 1)
+        result = np.ones(self.nums.shape, dtype=np.uint64)
+        base = self.nums
+        while n:
+            if n & 1:
+                result = (result * base) % p
+            n >>= 1
+            if n:
+                base = (base * base) % p
+        return self._new(result, self.prime)
+
+    def inverse(self):
+        # a^(p-2) = a^-1 by Fermat's little theorem
+        if (self.nums == 0).any():
+            raise ZeroDivisionError('The number is zero.')
+        return self ** (self.prime - 2)
+
+    def __truediv__(self, other):
+        if not isinstance(other, FieldArray):
+            other = self._new(np.asarray(self._operand(other)), self.prime)
+        return self * other.inverse()
+
+    def sum(self, axis=None):
+        # residues < 2^32, so 2^32 of them add up without overflow
+        p = np.uint64(self.prime)
+        return self._wrap(self.nums.sum(axis=axis, dtype=np.uint64) % p)
+
+    def prod(self, axis=None):
+        # pairwise products, log2(n) vector multiplications
+        p = np.uint64(self.prime)
+        a = self.nums.ravel() if axis is None else np.moveaxis(self.nums,
+                                                               axis, 0)
+        if len(a) == 0:
+            return self._wrap(np.ones(a.shape[1:], dtype=np.uint64))
+        while len(a) > 1:
+            h = len(a) // 2
+            b = (a[:h] * a[h:2 * h]) % p
+            a = np.concatenate((b, a[2 * h:])) if len(a) & 1 else b
+        return self._wrap(a[0])
+
+    def __matmul__(self, other):
+        # sum(a[i, k] * b[k]) mod p, reduced every `chunk` terms so that
+        # the uint64 accumulator never wraps
+        b = self._operand(other)
+        p = np.uint64(self.prime)
+        n = self.nums.shape[-1]
+        chunk = max(1, ((1 << 64) - 1) // ((self.prime - 1) ** 2))
+        if n <= chunk:
+            return self._wrap(np.dot(self.nums, b) % p)
+        result = None
+        for k in range(0, n, chunk):
+            r = np.dot(self.nums[..., k:k + chunk], b[k:k + chunk]) % p
+            result = r if result is None else (result + r) % p
+        return self._wrap(result)
+
+    def matvec(self, other):
+        return self @ other
+
+    def __eq__(self, other):
+        if not isinstance(other, FieldArray):
+            return False
+        return self.prime == other.prime and \
+            np.array_equal(self.nums, other.nums)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):
+        return 'prime:{} , nums:{}'.format(self.prime, self.nums)
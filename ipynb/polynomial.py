@@ -0,0 +1,351 @@
+from ipynb.ff import FiniteField
+from ipynb.ff import batch_inverse
+
+KARATSUBA_THRESHOLD = 32
+NTT_THRESHOLD = 128
+NEWTON_THRESHOLD = 64
+HORNER_THRESHOLD = 32
+TREE_THRESHOLD = 8192
+
+
+def _num(v):
+    if isinstance(v, FiniteField):
+        return v.num
+    return v
+
+
+def _trim(a):
+    while a and a[-1] == 0:
+        a.pop()
+    return a
+
+
+def _add(a, b, p):
+    if len(a) < len(b):
+        a, b = b, a
+    r = list(a)
+    for i, c in enumerate(b):
+        r[i] = (r[i] + c) % p
+    return r
+
+
+def _sub(a, b, p):
+    r = list(a) + [0] * (len(b) - len(a))
+    for i, c in enumerate(b):
+        r[i] = (r[i] - c) % p
+    return r
+
+
+def _schoolbook(a, b, p):
+    if not a or not b:
+        return []
+    r = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                r[i + j] += x * y
+    return [c % p for c in r]
+
+
+def _karatsuba(a, b, p):
+    if min(len(a), len(b)) <= KARATSUBA_THRESHOLD:
+        return _schoolbook(a, b, p)
+    h = max(len(a), len(b)) // 2
+    a0, a1 = a[:h], a[h:]
+    b0, b1 = b[:h], b[h:]
+    z0 = _karatsuba(a0, b0, p)
+    z2 = _karatsuba(a1, b1, p)
+    z1 = _sub(_sub(_karatsuba(_add(a0, a1, p), _add(b0, b1, p), p),
+                   z0, p), z2, p)
+    r = [0] * (len(a) + len(b) - 1)
+    for shift, z in ((0, z0), (h, z1), (2 * h, z2)):
+        for i, c in enumerate(z):
+            if c:
+                r[shift + i] += c
+    return [c % p for c in r]
+
+
+_roots = {}
+
+
+def _two_adic_root(p):
+    # (v, w) with p - 1 = 2^v * odd and w of order 2^v
+    if p not in _roots:
+        v = 0
+        while (p - 1) >> v & 1 == 0:
+            v += 1
+        g = 2
+        while pow(g, (p - 1) // 2, p) != p - 1:
+            g += 1
+        _roots[p] = (v, pow(g, (p - 1) >> v, p))
+    return _roots[p]
+
+
+def _ntt(a, w, p):
+    # in-place iterative radix-2 transform, w has order len(a)
+    n = len(a)
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            a[i], a[j] = a[j], a[i]
+    size = 2
+    while size <= n:
+        half = size >> 1
+        step = pow(w, n // size, p)
+        ws = [1] * half
+        for k in range(1, half):
+            ws[k] = (ws[k - 1] * step) % p
+        for start in range(0, n, size):
+            for k in range(half):
+                u = a[start + k]
+                v = (a[start + k + half] * ws[k]) % p
+                a[start + k] = (u + v) % p
+                a[start + k + half] = (u - v) % p
+        size <<= 1
+    return a
+
+
+def _ntt_mul(a, b, p):
+    length = len(a) + len(b) - 1
+    n = 1
+    while n < length:
+        n <<= 1
+    v, w = _two_adic_root(p)
+    w = pow(w, (1 << v) // n, p)
+    fa = _ntt(a + [0] * (n - len(a)), w, p)
+    fb = _ntt(b + [0] * (n - len(b)), w, p)
+    fc = _ntt([(x * y) % p for x, y in zip(fa, fb)], pow(w, p - 2, p), p)
+    n_inv = pow(n, p - 2, p)
+    return [(c * n_inv) % p for c in fc[:length]]
+
+
+def _mul(a, b, p):
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) >= NTT_THRESHOLD:
+        v, _ = _two_adic_root(p)
+        if (1 << v) >= len(a) + len(b) - 1:
+            return _ntt_mul(a, b, p)
+    return _karatsuba(a, b, p)
+
+
+def _series_inverse(f, n, p):
+    # g with f * g = 1 (mod x^n), Newton iteration
+    g = [pow(f[0], p - 2, p)]
+    k = 1
+    while k < n:
+        k = min(2 * k, n)
+        e = _mul(f[:k], g, p)[:k]
+        e = [(-c) % p for c in e]
+        e[0] = (e[0] + 2) % p
+        g = _mul(g, e, p)[:k]
+    return g
+
+
+def _divmod(a, b, p):
+    if len(a) < len(b):
+        return [], list(a)
+    m = len(a) - len(b) + 1
+    if len(b) < NEWTON_THRESHOLD or m < NEWTON_THRESHOLD:
+        inv = pow(b[-1], p - 2, p)
+        r = list(a)
+        q = [0] * m
+        for i in range(m - 1, -1, -1):
+            c = (r[i + len(b) - 1] * inv) % p
+            q[i] = c
+            if c:
+                for j, y in enumerate(b):
+                    r[i + j] = (r[i + j] - c * y) % p
+        return _trim(q), _trim(r[:len(b) - 1])
+    # rev(q) = rev(a) / rev(b) (mod x^m)
+    q = _mul(a[::-1][:m], _series_inverse(b[::-1], m, p), p)[:m][::-1]
+    r = _sub(a, _mul(q, b, p), p)[:len(b) - 1]
+    return _trim(q), _trim(r)
+
+
+def _use_tree(n, m, p):
+    # the subproduct tree only beats n Horner evaluations of degree m
+    # for large n and m with NTT multiplication
+    if min(n, m) < TREE_THRESHOLD:
+        return False
+    v, _ = _two_adic_root(p)
+    return (1 << v) >= 2 * max(n, m)
+
+
+def _horner(a, x, p):
+    y = 0
+    for c in reversed(a):
+        y = (y * x + c) % p
+    return y
+
+
+class _Tree:
+    # subproduct tree, poly = prod(x - xs[i]) over xs[lo:hi],
+    # leaves hold up to HORNER_THRESHOLD points
+    def __init__(self, xs, lo, hi, p):
+        self.lo = lo
+        self.hi = hi
+        if hi - lo <= HORNER_THRESHOLD:
+            self.left = self.right = None
+            poly = [1]
+            for x in xs[lo:hi]:
+                poly = _schoolbook(poly, [(-x) % p, 1], p)
+            self.poly = poly
+        else:
+            mid = (lo + hi) // 2
+            self.left = _Tree(xs, lo, mid, p)
+            self.right = _Tree(xs, mid, hi, p)
+            self.poly = _mul(self.left.poly, self.right.poly, p)
+
+    def evaluate(self, a, xs, p, ys):
+        # remainder tree down to the leaves, then Horner
+        if len(a) > len(self.poly) - 1:
+            _, a = _divmod(a, self.poly, p)
+        if self.left is None:
+            for i in range(self.lo, self.hi):
+                ys[i] = _horner(a, xs[i], p)
+            return
+        self.left.evaluate(a, xs, p, ys)
+        self.right.evaluate(a, xs, p, ys)
+
+    def combine(self, xs, c, p):
+        # sum(c[i] * poly / (x - xs[i]))
+        if self.left is None:
+            r = [0] * (len(self.poly) - 1)
+            for i in range(self.lo, self.hi):
+                # synthetic division of poly by (x - xs[i])
+                q = 0
+                x = xs[i]
+                for k in range(len(self.poly) - 1, 0, -1):
+                    q = (q * x + self.poly[k]) % p
+                    r[k - 1] += c[i] * q
+            return _trim([v % p for v in r])
+        return _add(_mul(self.left.combine(xs, c, p), self.right.poly, p),
+                    _mul(self.right.combine(xs, c, p), self.left.poly, p), p)
+
+
+class Polynomial:
+    # coeffs[i] is the coefficient of x^i over the prime field
+    def __init__(self, coeffs, prime):
+        self.prime = prime
+        self.coeffs = _trim([_num(c) % prime for c in coeffs])
+
+    @classmethod
+    def from_roots(cls, xs, prime):
+        if len(xs) == 0:
+            return cls([1], prime)
+        xs = [_num(x) % prime for x in xs]
+        return cls(_Tree(xs, 0, len(xs), prime).poly, prime)
+
+    @classmethod
+    def interpolate(cls, xs, ys, prime):
+        # the polynomial of degree < n through n points (xs[i], ys[i])
+        if len(xs) != len(ys):
+            raise ValueError('The number of x and y differ.')
+        if len(xs) == 0:
+            return cls([], prime)
+        xs = [_num(x) % prime for x in xs]
+        if len(set(xs)) != len(xs):
+            raise ValueError('The x must be distinct.')
+        tree = _Tree(xs, 0, len(xs), prime)
+        # c[i] = y[i] / M'(x[i])
+        d = cls(tree.poly, prime).derivative().evaluate_many(xs)
+        c = [(_num(y) * w.num) % prime
+             for y, w in zip(ys, batch_inverse(d))]
+        return cls(tree.combine(xs, c, prime), prime)
+
+    @classmethod
+    def root_derivatives(cls, xs, prime):
+        # M'(xs[i]) = prod(xs[i] - xs[j] for j != i) with M = prod(x - xs[j])
+        xs = [_num(x) % prime for x in xs]
+        if _use_tree(len(xs), len(xs), prime):
+            return cls.from_roots(xs, prime).derivative().evaluate_many(xs)
+        d = []
+        for i, xi in enumerate(xs):
+            v = 1
+            for j, xj in enumerate(xs):
+                if i != j:
+                    v = (v * (xi - xj)) % prime
+            d.append(FiniteField(v, prime))
+        return d
+
+    def _check(self, other):
+        if not isinstance(other, Polynomial):
+            return Polynomial([other], self.prime)
+        if self.prime != other.prime:
+            raise TypeError('No match prime.')
+        return other
+
+    def degree(self):
+        return len(self.coeffs) - 1
+
+    def __add__(self, other):
+        other = self._check(other)
+        return self.__class__(_add(self.coeffs, other.coeffs, self.prime),
+                              self.prime)
+
+    def __sub__(self, other):
+        other = self._check(other)
+        return self.__class__(_sub(self.coeffs, other.coeffs, self.prime),
+                              self.prime)
+
+    def __neg__(self):
+        return self.__class__([-c for c in self.coeffs], self.prime)
+
+    def __mul__(self, other):
+        other = self._check(other)
+        return self.__class__(_mul(self.coeffs, other.coeffs, self.prime),
+                              self.prime)
+
+    def __rmul__(self, coefficient):
+        return self * coefficient
+
+    def __divmod__(self, other):
+        other = self._check(other)
+        if not other.coeffs:
+            raise ZeroDivisionError('The polynomial is zero.')
+        q, r = _divmod(self.coeffs, other.coeffs, self.prime)
+        return self.__class__(q, self.prime), self.__class__(r, self.prime)
+
+    def __floordiv__(self, other):
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        return divmod(self, other)[1]
+
+    def derivative(self):
+        return self.__class__([i * c for i, c in enumerate(self.coeffs)][1:],
+                              self.prime)
+
+    def __call__(self, x):
+        return FiniteField(_horner(self.coeffs, _num(x) % self.prime,
+                                   self.prime), self.prime)
+
+    def evaluate(self, x):
+        return self(x)
+
+    def evaluate_many(self, xs):
+        # subproduct tree for many points, Horner otherwise
+        p = self.prime
+        xs = [_num(x) % p for x in xs]
+        if not _use_tree(len(xs), len(self.coeffs), p):
+            return [FiniteField(_horner(self.coeffs, x, p), p) for x in xs]
+        ys = [0] * len(xs)
+        _Tree(xs, 0, len(xs), p).evaluate(self.coeffs, xs, p, ys)
+        return [FiniteField(y, p) for y in ys]
+
+    def __eq__(self, other):
+        if not isinstance(other, Polynomial):
+            return False
+        return self.prime == other.prime and self.coeffs == other.coeffs
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):
+        return 'prime:{} , coeffs:{}'.format(self.prime, self.coeffs)
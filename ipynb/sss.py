@@ -0,0 +1,53 @@
+import random
+from ipynb.ff import FiniteField
+from ipynb.ff import batch_inverse
+from ipynb.polynomial import Polynomial
+
+_random = random.SystemRandom()
+
+
+def polynomial(secret, m, p):
+    # f(x) = a[0] + a[1]x + ... + a[m-1]x^(m-1) with f(0) = secret
+    a = [secret] + [_random.randrange(p) for _ in range(m - 2)]
+    if m > 1:
+        a.append(_random.randrange(1, p))
+    return a
+
+
+def evaluate(a, xs, p):
+    return [y.num for y in Polynomial(a, p).evaluate_many(xs)]
+
+
+def share(secret, n, m, p):
+    # n shares (x, f(x)) for x = 1..n, any m of them recover the secret
+    if not 1 <= m <= n < p:
+        raise ValueError('1 <= m <= n < p is required.')
+    if not 0 <= secret < p:
+        raise ValueError('The secret is out of range.')
+    xs = list(range(1, n + 1))
+    return list(zip(xs, evaluate(polynomial(secret, m, p), xs, p)))
+
+
+def lagrange_weights(xs, p):
+    # w[i] = prod(x[j] / (x[j] - x[i]) for j != i), so f(0) = sum(w[i]y[i])
+    xs = [x % p for x in xs]
+    if len(set(xs)) != len(xs) or 0 in xs:
+        raise ValueError('The x must be distinct and not zero.')
+    numerator = 1
+    for x in xs:
+        numerator = (numerator * x) % p
+    # x[i] * prod(x[j] - x[i] for j != i) = x[i] * (-1)^(k-1) * M'(x[i])
+    sign = -1 if len(xs) % 2 == 0 else 1
+    denominators = [FiniteField((sign * x * d.num) % p, p) for x, d in
+                    zip(xs, Polynomial.root_derivatives(xs, p))]
+    return [(numerator * w.num) % p for w in batch_inverse(denominators)]
+
+
+def recover(shares, p, weights=None):
+    # f(0) from m shares, weights can be reused for the same x
+    if weights is None:
+        weights = lagrange_weights([x for x, _ in shares], p)
+    s = 0
+    for (_, y), w in zip(shares, weights):
+        s += y * w
+    return s % p
@@ -0,0 +1,122 @@
+PIPPENGER_THRESHOLD = 64
+
+
+def _double(P):
+    if hasattr(P, 'double'):
+        return P.double()
+    return P + P
+
+
+def _add(P, Q):
+    # None stands for the identity element
+    if P is None:
+        return Q
+    if Q is None:
+        return P
+    return P + Q
+
+
+def shamir(scalars, points, w=2):
+    # Shamir's trick: one shared double-and-add over all i*P + j*Q
+    a, b = scalars
+    P, Q = points
+    size = 1 << w
+    multiples = [None, P]
+    for _ in range(size - 2):
+        multiples.append(multiples[-1] + P)
+    table = list(multiples)
+    for j in range(1, size):
+        Qj = Q if j == 1 else table[(j-1) * size] + Q
+        table.append(Qj)
+        for i in range(1, size):
+            table.append(multiples[i] + Qj)
+    mask = size - 1
+    top = max(a.bit_length(), b.bit_length())
+    result = None
+    for i in range((top + w - 1) // w - 1, -1, -1):
+        if result is not None:
+            for _ in range(w):
+                result = _double(result)
+        digit = ((a >> (w*i)) & mask) | (((b >> (w*i)) & mask) << w)
+        result = _add(result, table[digit])
+    return result
+
+
+def straus(scalars, points, w=4):
+    # Straus: shared doublings, one w-bit window table per point
+    tables = []
+    for P in points:
+        table = [P]
+        for _ in range((1 << w) - 2):
+            table.append(table[-1] + P)
+        tables.append(table)
+    mask = (1 << w) - 1
+    top = max(s.bit_length() for s in scalars)
+    result = None
+    for i in range((top + w - 1) // w - 1, -1, -1):
+        if result is not None:
+            for _ in range(w):
+                result = _double(result)
+        for s, table in zip(scalars, tables):
+            digit = (s >> (w*i)) & mask
+            if digit:
+                result = _add(result, table[digit-1])
+    return result
+
+
+def pippenger(scalars, points, c=None):
+    # Pippenger: per c-bit window, sort points into 2^c - 1 buckets
+    if c is None:
+        c = max(2, len(points).bit_length() - 2)
+    mask = (1 << c) - 1
+    top = max(s.bit_length() for s in scalars)
+    result = None
+    for i in range((top + c - 1) // c - 1, -1, -1):
+        if result is not None:
+            for _ in range(c):
+                result = _double(result)
+        buckets = [None] * mask
+        for s, P in zip(scalars, points):
+            digit = (s >> (c*i)) & mask
+            if digit:
+                buckets[digit-1] = _add(buckets[digit-1], P)
+        # sum(j * buckets[j-1]) with running sums
+        running = None
+        total = None
+        for bucket in reversed(buckets):
+            running = _add(running, bucket)
+            total = _add(total, running)
+        result = _add(result, total)
+    return result
+
+
+def multi_scalar_mul(scalars, points):
+    # sum(scalars[i] * points[i]) for any group whose elements support
+    # +, coefficient * P and optionally P.double(); a point class with its
+    # own multi_mul (S256P: GLV with shared doublings) is dispatched to it
+    if len(scalars) != len(points):
+        raise ValueError('The number of scalars and points differ.')
+    if len(points) == 0:
+        raise ValueError('No points.')
+    if min(scalars) < 0:
+        raise ValueError('The scalar is minus.')
+    cls = type(points[0])
+    if hasattr(cls, 'multi_mul') and \
+            all(type(P) is cls for P in points):
+        return cls.multi_mul(scalars, points)
+    pairs = [(s, P) for s, P in zip(scalars, points) if s]
+    if len(pairs) == 0:
+        return 0 * points[0]
+    scalars = [s for s, _ in pairs]
+    points = [P for _, P in pairs]
+    if len(points) == 1:
+        return scalars[0] * points[0]
+    if len(points) == 2:
+        result = shamir(scalars, points)
+    elif len(points) < PIPPENGER_THRESHOLD:
+        result = straus(scalars, points)
+    else:
+        result = pippenger(scalars, points)
+    if result is None:
+        return 0 * points[0]
+    return result
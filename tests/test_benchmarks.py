@@ -0,0 +1,49 @@
+import io
+import unittest
+from benchmarks.bench import compare
+from benchmarks.bench import measure
+from benchmarks.bench import percentile
+from benchmarks.bench import run
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_percentile(self):
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self.assertEqual(percentile(values, 0), 1.0)
+        self.assertEqual(percentile(values, 50), 3.0)
+        self.assertEqual(percentile(values, 90), 4.6)
+        self.assertEqual(percentile(values, 100), 5.0)
+        self.assertEqual(percentile([7.0], 99), 7.0)
+
+    def test_measure(self):
+        stats = measure(lambda: sum(range(100)), 0.01, 3)
+        self.assertEqual(stats['samples'], 3)
+        self.assertGreater(stats['ops_per_sec'], 0)
+        self.assertTrue(stats['min'] <= stats['p50'] <= stats['p90'] <=
+                        stats['p99'] <= stats['max'])
+
+    def test_run_compare(self):
+        cases = [('a', lambda: (lambda: None)),
+                 ('b', lambda: (lambda: sum(range(10))))]
+        out = io.StringIO()
+        results = run('a', 0.01, 3, cases=cases, out=out)
+        self.assertEqual(list(results['results']), ['a'])
+        self.assertIn('ops/s', out.getvalue())
+        baseline = {'results': {'a': {'ops_per_sec': 100.0},
+                                'c': {'ops_per_sec': 1.0}}}
+        current = {'results': {'a': {'ops_per_sec': 80.0},
+                               'b': {'ops_per_sec': 1.0}}}
+        self.assertEqual(compare(current, baseline, 0.3, 'ops_per_sec'),
+                         [('b', None, 1.0), ('c', 1.0, None)])
+        self.assertEqual(compare(current, baseline, 0.1, 'ops_per_sec'),
+                         [('a', 100.0, 80.0), ('b', None, 1.0),
+                          ('c', 1.0, None)])
+        # baseline cases not selected by the pattern were not run
+        self.assertEqual(
+            compare(current, baseline, 0.3, 'ops_per_sec', pattern='a|b'),
+            [('b', None, 1.0)])
+        self.assertIn('best_ops_per_sec', results['results']['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
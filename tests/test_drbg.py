@@ -0,0 +1,79 @@
+import unittest
+from hmac.drbg import HmacDRBG
+from hmac.hmac_sha256 import hmac_sha256
+
+# NIST CAVP HMAC_DRBG.rsp, SHA-256, no prediction resistance, COUNT = 0
+ENTROPY = bytes.fromhex('ca851911349384bffe89de1cbdc46e68'
+                        '31e44d34a4fb935ee285dd14b71a7488')
+NONCE = bytes.fromhex('659ba96c601dc69fc902940805ec0ca8')
+RETURNED = bytes.fromhex('e528e9abf2dece54d47c7e75e5fe3021'
+                         '49f817ea9fb4bee6f4199697d04d5b89'
+                         'd54fbb978a15b5c443c9ec21036d2460'
+                         'b6f73ebad0dc2aba6e624abf07745bc1'
+                         '07694bb7547bb0995f70de25d6b29e2d'
+                         '3011bb19d27676c07162c8b5ccde0668'
+                         '961df86803482cb37ed6d5c0bb8d50cf'
+                         '1f50d476aa0458bdaba806f48be9dcb8')
+
+N = 0xfffffffffffffffffffffffffffffffebaaedce6af48a03bbfd25e8cd0364141
+L = 2**252 + 27742317777372353535851937790883648493
+
+
+class TestHmacDRBG(unittest.TestCase):
+    def test_cavp(self):
+        drbg = HmacDRBG(ENTROPY, NONCE)
+        drbg.generate(128)
+        self.assertEqual(drbg.generate(128), RETURNED)
+        self.assertEqual(drbg.reseed_counter, 3)
+
+    def test_update(self):
+        # K = HMAC(K, V || 0x00 || seed), V = HMAC(K, V), then with 0x01
+        seed = b'seed'
+        K = hmac_sha256(b'\x00' * 32, b'\x01' * 32 + b'\x00' + seed)
+        V = hmac_sha256(K, b'\x01' * 32)
+        K = hmac_sha256(K, V + b'\x01' + seed)
+        V = hmac_sha256(K, V)
+        drbg = HmacDRBG(seed)
+        self.assertEqual(drbg.V, V)
+        self.assertEqual(drbg.generate(32), hmac_sha256(K, V))
+
+    def test_deterministic(self):
+        a = HmacDRBG(b'entropy', b'nonce')
+        b = HmacDRBG(b'entropy', b'nonce')
+        self.assertEqual(a.generate(100), b.generate(100))
+        self.assertNotEqual(a.generate(32, b'x'), b.generate(32, b'y'))
+        a.reseed(b'new')
+        self.assertEqual(a.reseed_counter, 1)
+        self.assertEqual(len(a.generate(33)), 33)
+
+    def test_generate_scalars(self):
+        for order in [N, L, 1000, 2]:
+            scalars = HmacDRBG(b'seed').generate_scalars(200, order)
+            self.assertEqual(len(scalars), 200)
+            for k in scalars:
+                self.assertTrue(1 <= k < order)
+            self.assertEqual(HmacDRBG(b'seed').generate_scalars(200, order),
+                             scalars)
+        self.assertEqual(HmacDRBG(b'seed').generate_scalars(0, N), [])
+        with self.assertRaises(ValueError):
+            HmacDRBG(b'seed').generate_scalars(1, 1)
+        # more candidates than fit in a single request
+        scalars = HmacDRBG(b'seed').generate_scalars(5000, N)
+        self.assertEqual(len(scalars), 5000)
+        self.assertEqual(len(set(scalars)), 5000)
+
+    def test_max_request(self):
+        drbg = HmacDRBG(b'seed')
+        self.assertEqual(len(drbg.generate(1 << 16)), 1 << 16)
+        with self.assertRaises(ValueError):
+            drbg.generate((1 << 16) + 1)
+
+    def test_reseed_interval(self):
+        drbg = HmacDRBG(b'seed')
+        drbg.reseed_counter = drbg.reseed_interval + 1
+        with self.assertRaises(RuntimeError):
+            drbg.generate(32)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,12 @@ from ipynb.ecc import ECCPoint
 from ipynb.ecc import sha256
 from ipynb.ecc import ripemd160
 from ipynb.ecc import G
+from ipynb.ecc import S256FF
+from ipynb.ecc import S256P
+from ipynb.ecc import hash160
+from ipynb.ecc import hash256
+from ipynb.ecc import derive_many
+from ipynb.ecc import batch_inverse
 
 SECP256K1_TEST_VECTOR = [
     [
@@ -555,11 +561,103 @@ class TestECCPoint(unittest.TestCase):
             self.assertEqual(P.y.num, test[2])
         return
 
+    def test_add_equal_points(self):
+        P = 3 * G
+        Q = 3 * G
+        self.assertEqual((P + Q).x.num, (6 * G).x.num)
+        return
+
+    def test_S256_jacobian(self):
+        P = 5 * G
+        Q = 9 * G
+        self.assertNotEqual(P.double().Z, 1)
+        self.assertEqual(P + Q, 14 * G)
+        self.assertEqual(Q - P, 4 * G)
+        self.assertEqual(P + P, P.double())
+        self.assertEqual(P.double(), 10 * G)
+        self.assertEqual(P + (-P), S256P(None, None))
+        self.assertEqual(P + S256P(None, None), P)
+        self.assertEqual(S256P(P.x, P.y), P)
+        self.assertEqual(P.Z, 1)
+        self.assertEqual((S256P.N - 1) * G, -G)
+        self.assertIsNone((S256P.N * G).x)
+        self.assertIsNone((0 * G).y)
+        with self.assertRaises(ValueError):
+            S256P(G.x.num, G.y.num + 1)
+        return
+
+    def test_S256_glv(self):
+        P = S256P.LAMBDA * G
+        self.assertEqual(P.x.num, (S256P.BETA * G.x.num) % S256FF.P)
+        self.assertEqual(P.y.num, G.y.num)
+        for k in [1, 2**128 - 1, 2**255 + 3, S256P.N - 2, S256P.LAMBDA]:
+            k1, k2 = S256P.glv_split(k)
+            self.assertLess(max(abs(k1), abs(k2)).bit_length(), 130)
+            self.assertEqual((k1 + k2 * S256P.LAMBDA - k) % S256P.N, 0)
+        Q = 0x1234567 * G
+        R = G
+        for k in range(1, 40):
+            self.assertEqual(k * Q, 0x1234567 * R)
+            R = R + G
+        return
+
+    def test_sec(self):
+        self.assertEqual(
+            G.sec().hex(),
+            '0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798')
+        for k in [1, 2, 3, 0xdeadbeef, S256P.N - 1]:
+            P = k * G
+            self.assertEqual(S256P.parse(P.sec()), P)
+            self.assertEqual(S256P.parse(P.sec(False)), P)
+            self.assertEqual(len(P.sec(False)), 65)
+        with self.assertRaises(ValueError):
+            S256P.parse(b'\x05' + bytes(32))
+        # a point with a small x, so that x + P still fits in 32 bytes
+        P = S256FF.P
+        x = next(x for x in range(1, 100)
+                 if pow(x ** 3 + 7, (P - 1) // 2, P) == 1)
+        y = pow(x ** 3 + 7, (P + 1) // 4, P)
+        self.assertEqual(S256P.parse(S256P(x, y).sec(False)), S256P(x, y))
+        for x, y in [(x + P, y), (x, y + 1)]:
+            with self.assertRaises(ValueError):
+                S256P.parse(b'\x04' + x.to_bytes(32, 'big') +
+                            y.to_bytes(32, 'big'))
+        with self.assertRaises(ValueError):
+            (0 * G).sec()
+        return
+
+    def test_hash160(self):
+        self.assertEqual(hash160(G.sec()).hex(),
+                         '751e76e8199196d454941c45d1b3a323f1433bd6')
+        self.assertEqual(hash160(G.sec(False)).hex(),
+                         '91b24bf9f5288532960ac687abb035127b1d28a5')
+        msg = b'hello'
+        self.assertEqual(hash256(msg), sha256().Digest(sha256().Digest(msg)))
+        self.assertEqual(hash160(msg),
+                         ripemd160().Digest(sha256().Digest(msg)))
+        return
+
+    def test_derive_many(self):
+        points = [k * G for k in range(1, 20)]
+        expect = [hash160(P.sec(False)) for P in points]
+        points = [k * G for k in range(1, 20)]
+        self.assertEqual(derive_many(points, False), expect)
+        for P in points:
+            self.assertEqual(P.Z, 1)
+        # the same object twice
+        Q = 7 * G + G
+        self.assertNotEqual(Q.Z, 1)
+        self.assertEqual(derive_many([Q, Q], False), [expect[7]] * 2)
+        self.assertEqual(Q, 8 * G)
+        return
+
     def test_sha256(self):
         for test in SHA256_TEST_VECTOR:
             msg = bytes.fromhex(test[0])
             hash = sha256().Digest(msg)
             self.assertEqual(hash.hex(), test[1])
+            hash = sha256(fast=False).Digest(msg)
+            self.assertEqual(hash.hex(), test[1])
         return
 
     def test_ripemd160(self):
@@ -567,10 +665,87 @@ class TestECCPoint(unittest.TestCase):
             msg = test[0].encode('utf-8')
             hash = ripemd160().Digest(msg)
             self.assertEqual(hash.hex(), test[1])
-        # msg = bytes()
-        # for _ in range(1000000):
-        #     msg += 'a'.encode('utf-8')
-        # hash = ripemd160().Digest(msg)
-        # self.assertEqual(
-        #     '52783243c1697bdbe16d37f97f68f08325dc1528', hash.hex())
+        h = ripemd160()
+        for _ in range(1000):
+            h.update(b'a' * 1000)
+        self.assertEqual(
+            '52783243c1697bdbe16d37f97f68f08325dc1528', h.hexdigest())
+        return
+
+    def test_streaming(self):
+        msg = bytes(range(256)) * 3
+        for hash in [sha256, ripemd160]:
+            expect = hash().Digest(msg)
+            for size in [1, 7, 55, 56, 63, 64, 65, 128, 200]:
+                h = hash()
+                for p in range(0, len(msg), size):
+                    h.update(msg[p:p+size])
+                self.assertEqual(h.digest(), expect)
+                self.assertEqual(h.digest(), expect)
+            h = hash(memoryview(msg)[:100])
+            c = h.copy()
+            h.update(bytearray(msg[100:]))
+            self.assertEqual(h.hexdigest(), expect.hex())
+            self.assertEqual(c.digest(), hash().Digest(msg[:100]))
+            self.assertEqual(hash().digest(), hash().Digest(b''))
+        return
+
+
+class TestFieldElement(unittest.TestCase):
+    def test_ops(self):
+        p = S256FF.P
+        a = S256FF(p - 5)
+        b = S256FF(12345)
+        c = S256FF(7)
+        self.assertEqual((a + b).num, 12340)
+        self.assertEqual((b - a).num, 12350)
+        self.assertEqual((a * b).num, (-5 * 12345) % p)
+        self.assertEqual((3 * b).num, 37035)
+        self.assertEqual((-b).num, p - 12345)
+        self.assertEqual((a / b) * b, a)
+        self.assertEqual(b**-1, b.inverse())
+        self.assertEqual(a.square(), a * a)
+        self.assertEqual(a.mul_add(b, c), a * b + c)
+        self.assertEqual(a, FiniteField(p - 5, p))
+        self.assertNotEqual(a, FiniteField(p - 5, 31))
+        self.assertEqual(a.prime, p)
+        self.assertFalse(hasattr(a, '__dict__'))
+        return
+
+    def test_batch_inverse(self):
+        elements = [S256FF(3**i) for i in range(20)]
+        for a, b in zip(elements, batch_inverse(elements)):
+            self.assertIsInstance(b, S256FF)
+            self.assertEqual(b, a.inverse())
+        return
+
+    def test_inplace(self):
+        a = S256FF(10)
+        b = a
+        a += S256FF(5)
+        self.assertIs(a, b)
+        self.assertEqual(a.num, 15)
+        a -= S256FF(20)
+        self.assertEqual(a.num, S256FF.P - 5)
+        a *= S256FF(2)
+        self.assertEqual(a.num, S256FF.P - 10)
+        return
+
+    def test_inplace_constant(self):
+        # the curve constants are shared by every S256P
+        b = G.b
+        self.assertIs(b, S256P.b)
+        b += S256FF(1)
+        b *= S256FF(3)
+        self.assertEqual(b.num, 24)
+        self.assertIsNot(b, S256P.b)
+        self.assertEqual(S256P.b.num, 7)
+        a = S256P.a
+        a -= S256FF(1)
+        self.assertEqual(S256P.a.num, 0)
+        with self.assertRaises(AttributeError):
+            S256P.b.num = 8
+        self.assertEqual(S256P.b.num, 7)
+        self.assertEqual(type(S256P.b + S256FF(1)), S256FF)
+        self.assertEqual(2 * G, G + G)
         return
@@ -0,0 +1,108 @@
+import hashlib
+import unittest
+from ipynb.ecc import G
+from ipynb.ecc import S256P
+from ipynb.ecdsa import N
+from ipynb.ecdsa import deterministic_k
+from ipynb.ecdsa import sign
+from ipynb.ecdsa import verify
+from ipynb.ecdsa import verify_batch
+
+# private key, message, k, r, s
+ECDSA_TEST_VECTOR = [
+    [
+        1,
+        'Satoshi Nakamoto',
+        0x8F8A276C19F4149656B280621E358CCE24F5F52542772691EE69063B74F15D15,
+        0x934B1EA10A4B3C1757E2B0C017D0B6143CE3C9A7E6A4A49860D7A6AB210EE3D8,
+        0x2442CE9D2B916064108014783E923EC36B49743E2FFA1C4496F01A512AAFD9E5,
+    ],
+    [
+        N - 1,
+        'Satoshi Nakamoto',
+        0x33A19B60E25FB6F4435AF53A3D42D493644827367E6453928554F43E49AA6F90,
+        None,
+        None,
+    ],
+    [
+        1,
+        'All those moments will be lost in time, like tears in rain. '
+        'Time to die...',
+        0x38AA22D72376B4DBC472E06C3BA403EE0A394DA63FC58D88686C611ABA98D6B3,
+        None,
+        None,
+    ],
+]
+
+
+def digest(msg):
+    return int.from_bytes(hashlib.sha256(msg.encode('utf-8')).digest(), 'big')
+
+
+class TestECDSA(unittest.TestCase):
+    def test_rfc6979(self):
+        for test in ECDSA_TEST_VECTOR:
+            z = digest(test[1])
+            self.assertEqual(deterministic_k(test[0], z), test[2])
+            r, s = sign(test[0], z)
+            if test[3] is not None:
+                self.assertEqual(r, test[3])
+                self.assertEqual(s, test[4])
+            self.assertLessEqual(s, N // 2)
+            self.assertTrue(verify(test[0] * G, z, (r, s)))
+        return
+
+    def test_verify(self):
+        d = 0xC0FFEE
+        P = d * G
+        z = digest('pyref')
+        r, s = sign(d, z)
+        self.assertTrue(verify(P, z, (r, s)))
+        self.assertTrue(verify(P, z, (r, N - s)))
+        self.assertFalse(verify(P, z + 1, (r, s)))
+        self.assertFalse(verify(G, z, (r, s)))
+        self.assertFalse(verify(P, z, (0, s)))
+        self.assertFalse(verify(P, z, (r, N)))
+        with self.assertRaises(ValueError):
+            sign(0, z)
+        return
+
+    def test_invalid_pubkey(self):
+        # with Q = inf, u1*G + u2*Q = kG for r = x(kG), s = z/k
+        z = digest('forged')
+        k = 12345
+        r = (k * G).x.num % N
+        s = (z * pow(k, N - 2, N)) % N
+        inf = S256P(None, None)
+        self.assertFalse(verify(inf, z, (r, s)))
+        self.assertEqual(verify_batch([(inf, z, (r, s))]), [False])
+        # off the curve and out of range coordinates
+        P = 5 * G
+        self.assertFalse(verify(S256P.jacobian(P.X, P.Y + 1, P.Z), z, (r, s)))
+        Q = (7 * G).normalize()
+        d = 7
+        z = digest('pyref')
+        sig = sign(d, z)
+        self.assertTrue(verify(Q, z, sig))
+        self.assertFalse(verify(S256P.jacobian(Q.X + S256P.a.P, Q.Y, 1),
+                                z, sig))
+        self.assertFalse(verify(None, z, sig))
+        return
+
+    def test_verify_batch(self):
+        entries = []
+        for d in range(1, 9):
+            z = digest(str(d))
+            entries.append((d * G, z, sign(d, z)))
+        self.assertEqual(verify_batch(entries), [True] * 8)
+        entries[2] = (entries[2][0], entries[2][1] + 1, entries[2][2])
+        entries[5] = (entries[5][0], entries[5][1], (0, 1))
+        expect = [True] * 8
+        expect[2] = expect[5] = False
+        self.assertEqual(verify_batch(entries), expect)
+        self.assertEqual(verify_batch([]), [])
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
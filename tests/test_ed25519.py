@@ -0,0 +1,213 @@
+import unittest
+from ed25519.ed25519 import Ed25519P
+from ed25519.ed25519 import B
+from ed25519.ed25519 import DecodePoint
+from ed25519.ed25519 import _decode_point
+from ed25519.ed25519 import Sign
+from ed25519.ed25519 import SigningKey
+from ed25519.ed25519 import Verify
+from ed25519.ed25519 import VerifyingKey
+from ed25519.ed25519 import verifying_key
+from ed25519.ed25519 import verify_batch
+from ed25519.ed25519 import Ed25519BaseTable
+from ed25519.ed25519 import base_table
+from ed25519.ed25519 import load_base_table
+from ed25519.ed25519 import Ed25519_TEST_VECTOR
+from ed25519.ed25519 import selftest
+
+
+def affine_add(P, Q):
+    p = Ed25519P.p
+    d = Ed25519P.d
+    t = d * P.x * Q.x * P.y * Q.y
+    x3 = ((P.x*Q.y + Q.x*P.y) * pow((1 + t) % p, p-2, p)) % p
+    y3 = ((P.y*Q.y + P.x*Q.x) * pow((1 - t) % p, p-2, p)) % p
+    return Ed25519P(x3, y3)
+
+
+class TestEd25519(unittest.TestCase):
+    def test_constants(self):
+        p = Ed25519P.p
+        self.assertEqual(Ed25519P.d, (-121665 * pow(121666, p-2, p)) % p)
+        self.assertEqual(B, DecodePoint(
+            ((4 * pow(5, p-2, p)) % p).to_bytes(32, 'little')))
+
+    def test_selftest(self):
+        self.assertTrue(selftest(verbose=False))
+
+    def test_decode(self):
+        P = B.extended()
+        for _ in range(16):
+            Q = P.affine()
+            self.assertEqual(DecodePoint(Q.encode()), Q)
+            self.assertEqual(DecodePoint(bytearray(Q.encode())), Q)
+            P = P.double() + B.extended()
+        # y = 2 gives x^2 = 3/(4d+1), a non-square
+        with self.assertRaises(ValueError):
+            DecodePoint((2).to_bytes(32, 'little'))
+        # y = 1 gives x = 0, which has no negative
+        with self.assertRaises(ValueError):
+            DecodePoint((1 | (1 << 255)).to_bytes(32, 'little'))
+        with self.assertRaises(ValueError):
+            DecodePoint(b'\x01' * 31)
+        # y = p + 1 is a non-canonical encoding of y = 1
+        with self.assertRaises(ValueError):
+            DecodePoint((Ed25519P.p + 1).to_bytes(32, 'little'))
+        with self.assertRaises(ValueError):
+            Ed25519P(B.x + 1, B.y)
+        _decode_point.cache_clear()
+        DecodePoint(B.encode())
+        DecodePoint(B.encode())
+        self.assertEqual(_decode_point.cache_info().hits, 1)
+
+    def test_add(self):
+        P = B
+        Q = B
+        for _ in range(10):
+            self.assertEqual(P + Q, affine_add(P, Q))
+            P, Q = Q, affine_add(P, Q)
+        return
+
+    def test_sub(self):
+        P = 5 * B
+        Q = 3 * B
+        self.assertEqual(P - Q, 2 * B)
+        self.assertEqual(Q - Q, Ed25519P(0, 1))
+        return
+
+    def test_rmul(self):
+        P = Ed25519P(0, 1)
+        for i in range(20):
+            self.assertEqual(i * B, P)
+            P = affine_add(P, B)
+        self.assertEqual(Ed25519P.L * B, Ed25519P(0, 1))
+        return
+
+    def test_extended(self):
+        self.assertEqual((7 * B.extended()).affine(), 7 * B)
+        self.assertTrue(3 * B.extended() + 4 * B.extended()
+                        == 7 * B.extended())
+        self.assertFalse(3 * B.extended() == 4 * B.extended())
+        return
+
+    def test_base_table(self):
+        table = base_table()
+        for k in [0, 1, 8, 9, 0x88888888, 2**252 - 1, Ed25519P.L - 1,
+                  Ed25519P.L, 2**256 - 1]:
+            self.assertTrue(table.mul(k) == k * B.extended())
+        self.assertEqual(3 * B, (3 * B.extended()).affine())
+        return
+
+    def test_base_table_bytes(self):
+        blob = base_table().to_bytes()
+        table = Ed25519BaseTable.from_bytes(blob)
+        self.assertEqual(table.to_bytes(), blob)
+        self.assertIs(load_base_table(blob), base_table())
+        with self.assertRaises(ValueError):
+            Ed25519BaseTable.from_bytes(blob[:-64])
+        with self.assertRaises(ValueError):
+            Ed25519BaseTable.from_bytes(blob[64:] + blob[:64])
+        # one middle entry replaced by another valid point
+        i = (Ed25519BaseTable.ROWS // 2 * Ed25519BaseTable.COLS + 3) * 64
+        P = Ed25519P(int.from_bytes(blob[i:i+32], 'little'),
+                     int.from_bytes(blob[i+32:i+64], 'little')) + B
+        tampered = blob[:i] + P.x.to_bytes(32, 'little') + \
+            P.y.to_bytes(32, 'little') + blob[i+64:]
+        with self.assertRaises(ValueError):
+            load_base_table(tampered)
+        self.assertIs(load_base_table(blob), base_table())
+        self.assertEqual(base_table().to_bytes(), blob)
+        return
+
+    def test_sign_verify(self):
+        for test in Ed25519_TEST_VECTOR:
+            secret = bytes.fromhex(test[1])
+            public = bytes.fromhex(test[2])
+            message = bytes.fromhex(test[3])
+            signature = bytes.fromhex(test[4])
+            A = DecodePoint(public)
+            self.assertEqual(A.encode(), public)
+            self.assertEqual(Sign(secret, message), signature)
+            self.assertTrue(Verify(A, signature, message))
+            self.assertFalse(Verify(A, signature, message + b'\x00'))
+        return
+
+    def test_signing_key(self):
+        for test in Ed25519_TEST_VECTOR:
+            key = SigningKey(bytes.fromhex(test[1]))
+            self.assertEqual(key.public.hex(), test[2])
+            self.assertEqual(key.A, DecodePoint(key.public))
+            self.assertEqual(key.sign(bytes.fromhex(test[3])).hex(), test[4])
+            self.assertEqual(key.sign(b'abc'),
+                             Sign(bytes.fromhex(test[1]), b'abc'))
+        with self.assertRaises(ValueError):
+            SigningKey(b'\x00' * 31)
+        return
+
+    def test_verifying_key(self):
+        for test in Ed25519_TEST_VECTOR:
+            public = bytes.fromhex(test[2])
+            message = bytes.fromhex(test[3])
+            signature = bytes.fromhex(test[4])
+            for key in [VerifyingKey(public), VerifyingKey(public, table=True),
+                        VerifyingKey(DecodePoint(public), table=False)]:
+                self.assertEqual(key.public, public)
+                for _ in range(VerifyingKey.TABLE_THRESHOLD + 1):
+                    self.assertTrue(key.verify(signature, message))
+                    self.assertFalse(key.verify(signature, message + b'1'))
+            self.assertIsNone(key.table)
+        self.assertIsNone(VerifyingKey(public).table)
+        table = VerifyingKey(public, table=True).table
+        self.assertIsNotNone(table)
+        # only the table of B keeps its points for to_bytes()
+        self.assertIsNone(table.points)
+        with self.assertRaises(ValueError):
+            table.to_bytes()
+        return
+
+    def test_verifying_key_cache(self):
+        verifying_key.cache_clear()
+        test = Ed25519_TEST_VECTOR[1]
+        A = DecodePoint(bytes.fromhex(test[2]))
+        for _ in range(3):
+            self.assertTrue(Verify(A, bytes.fromhex(test[4]),
+                                   bytes.fromhex(test[3])))
+        info = verifying_key.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+        self.assertIs(verifying_key(A.encode()),
+                      verifying_key(bytes.fromhex(test[2])))
+        return
+
+    def test_verify_batch(self):
+        entries = []
+        for test in Ed25519_TEST_VECTOR:
+            A = DecodePoint(bytes.fromhex(test[2]))
+            entries.append((A, bytes.fromhex(test[4]), bytes.fromhex(test[3])))
+        self.assertEqual(verify_batch([]), [])
+        self.assertEqual(verify_batch(entries), [True] * len(entries))
+        bad = list(entries)
+        bad[1] = (bad[1][0], bad[1][1], bad[1][2] + b'\x00')
+        bad[3] = (bad[3][0], bad[3][1][:32] + bytes(32), bad[3][2])
+        bad[4] = (bad[4][0], bad[4][1][:63], bad[4][2])
+        self.assertEqual(verify_batch(bad), [True, False, True, False, False])
+        return
+
+    def test_non_canonical_R(self):
+        # the identity as A, and as R encoded with y = p + 1, S = 0: only
+        # the rejection of the non-canonical R tells this apart from a
+        # valid signature, for the single and the batch verification alike
+        A = (1).to_bytes(32, 'little')
+        signature = (Ed25519P.p + 1).to_bytes(32, 'little') + bytes(32)
+        with self.assertRaises(ValueError):
+            VerifyingKey(A).verify(signature, b'')
+        self.assertEqual(verify_batch([(DecodePoint(A), signature, b'')]),
+                         [False])
+        canonical = (1).to_bytes(32, 'little') + bytes(32)
+        self.assertTrue(VerifyingKey(A).verify(canonical, b''))
+        self.assertEqual(verify_batch([(DecodePoint(A), canonical, b'')]),
+                         [True])
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 from ipynb.ff import FiniteField
+from ipynb.ff import batch_inverse
+from ipynb.ff import batch_div
 
 
 class TestFiniteField(unittest.TestCase):
@@ -53,3 +55,22 @@ class TestFiniteField(unittest.TestCase):
         a = FiniteField(4, 31)
         b = FiniteField(11, 31)
         self.assertEqual(a**-4 * b, FiniteField(13, 31))
+
+    def test_batch_inverse(self):
+        elements = [FiniteField(i, 31) for i in range(1, 31)]
+        inverses = batch_inverse(elements)
+        for a, b in zip(elements, inverses):
+            self.assertEqual(a * b, FiniteField(1, 31))
+            self.assertEqual(b, a**-1)
+        self.assertEqual(batch_inverse([]), [])
+        with self.assertRaises(ZeroDivisionError):
+            batch_inverse([FiniteField(3, 31), FiniteField(0, 31)])
+        with self.assertRaises(TypeError):
+            batch_inverse([FiniteField(3, 31), FiniteField(3, 37)])
+
+    def test_batch_div(self):
+        a = [FiniteField(3, 31), FiniteField(17, 31)]
+        b = [FiniteField(24, 31), FiniteField(5, 31)]
+        self.assertEqual(batch_div(a, b), [a[0] / b[0], a[1] / b[1]])
+        with self.assertRaises(ValueError):
+            batch_div(a, b[:1])
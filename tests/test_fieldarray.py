@@ -0,0 +1,112 @@
+import random
+import unittest
+from ipynb.ff import FiniteField
+
+try:
+    import numpy as np
+    from ipynb.fieldarray import FieldArray
+except ImportError:
+    np = None
+
+PRIME = 9999991
+
+
+@unittest.skipIf(np is None, 'numpy is not installed.')
+class TestFieldArray(unittest.TestCase):
+    def setUp(self):
+        self.a = [random.randrange(PRIME) for _ in range(100)] + [0, 1]
+        self.b = [random.randrange(1, PRIME) for _ in range(102)]
+        self.A = FieldArray(self.a, PRIME)
+        self.B = FieldArray(self.b, PRIME)
+        self.fa = [FiniteField(v, PRIME) for v in self.a]
+        self.fb = [FiniteField(v, PRIME) for v in self.b]
+
+    def test_init(self):
+        self.assertEqual(FieldArray([PRIME + 3, 2], PRIME).tolist(), [3, 2])
+        self.assertEqual(FieldArray(self.fa, PRIME), self.A)
+        self.assertEqual(FieldArray([2 ** 70], 31).tolist(), [2 ** 70 % 31])
+        self.assertEqual(FieldArray([], 31).shape, (0,))
+        with self.assertRaises(ValueError):
+            FieldArray([-1], 31)
+        with self.assertRaises(ValueError):
+            FieldArray([1], 2 ** 61 - 1)
+        self.assertEqual(self.A[3], self.fa[3])
+
+    def test_ops(self):
+        self.assertEqual(list(self.A + self.B),
+                         [x + y for x, y in zip(self.fa, self.fb)])
+        self.assertEqual(list(self.A - self.B),
+                         [x - y for x, y in zip(self.fa, self.fb)])
+        self.assertEqual(list(self.A * self.B),
+                         [x * y for x, y in zip(self.fa, self.fb)])
+        self.assertEqual(list(self.A / self.B),
+                         [x / y for x, y in zip(self.fa, self.fb)])
+        self.assertEqual(list(5 * self.A), [5 * x for x in self.fa])
+        self.assertEqual(list(self.A * self.fb[0]),
+                         [x * self.fb[0] for x in self.fa])
+        self.assertEqual(list(-self.A + self.A), [FiniteField(0, PRIME)] * 102)
+        with self.assertRaises(TypeError):
+            self.A + FieldArray([1], 31)
+
+    def test_pow(self):
+        for e in [0, 1, 2, 65537, PRIME - 1, -3]:
+            self.assertEqual(list(self.A ** e), [x ** e for x in self.fa])
+
+    def test_inverse(self):
+        inv = self.B.inverse()
+        self.assertEqual(list(inv * self.B), [FiniteField(1, PRIME)] * 102)
+        with self.assertRaises(ZeroDivisionError):
+            self.A.inverse()
+        with self.assertRaises(ZeroDivisionError):
+            self.B / 0
+
+    def test_reductions(self):
+        s = FiniteField(0, PRIME)
+        m = FiniteField(1, PRIME)
+        for x in self.fb:
+            s = s + x
+            m = m * x
+        self.assertEqual(self.B.sum(), s)
+        self.assertEqual(self.B.prod(), m)
+        M = FieldArray([self.a[:51], self.b[:51]], PRIME)
+        self.assertEqual(M.sum(axis=1)[1].num, sum(self.b[:51]) % PRIME)
+        self.assertEqual(M.prod(axis=0)[7],
+                         FiniteField(self.a[7] * self.b[7] % PRIME, PRIME))
+
+    def test_matvec(self):
+        rows = [[random.randrange(PRIME) for _ in range(20)] for _ in range(5)]
+        v = [random.randrange(PRIME) for _ in range(20)]
+        expected = [sum(x * y for x, y in zip(r, v)) % PRIME for r in rows]
+        M = FieldArray(rows, PRIME)
+        self.assertEqual((M @ FieldArray(v, PRIME)).tolist(), expected)
+        # 2^32 - 5 forces reductions after every term
+        p = 2 ** 32 - 5
+        rows = [[p - 1] * 10] * 3
+        v = [p - 2] * 10
+        self.assertEqual(FieldArray(rows, p).matvec(FieldArray(v, p)).tolist(),
+                         [(10 * (p - 1) * (p - 2)) % p] * 3)
+
+    def test_share(self):
+        # n shares of many secrets at once, evaluated by a Vandermonde matrix
+        n, m = 5, 3
+        xs = list(range(1, n + 1))
+        V = FieldArray([[pow(x, j, PRIME) for j in range(m)] for x in xs],
+                       PRIME)
+        C = FieldArray([[random.randrange(PRIME) for _ in range(1000)]
+                        for _ in range(m)], PRIME)
+        Y = V @ C
+        # Lagrange weights at 0 for the first m shares
+        w = []
+        for i in range(m):
+            v = FiniteField(1, PRIME)
+            for j in range(m):
+                if i != j:
+                    v = v * FiniteField(xs[j], PRIME) / FiniteField(
+                        (xs[j] - xs[i]) % PRIME, PRIME)
+            w.append(v.num)
+        secrets = FieldArray(w, PRIME) @ Y[:m]
+        self.assertEqual(secrets, C[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,13 @@
+import hashlib
+import io
+import mmap
+import os
+import tempfile
 import unittest
+import hmac.hmac_sha256 as hmac_sha256_module
+from hmac.hmac_sha256 import HMAC
 from hmac.hmac_sha256 import hmac_sha256
+from hmac.hmac_sha256 import hmac_file
 
 testvectors = [
     {
@@ -89,6 +97,70 @@ class TestHmacSha256(unittest.TestCase):
             print(h.hex())
             self.assertEqual(h, test['sha256'])
 
+    def test_hmac(self):
+        for test in testvectors:
+            mac = HMAC(test['key'])
+            self.assertEqual(mac.mac(test['data']), test['sha256'])
+            self.assertEqual(mac.mac(test['data']), test['sha256'])
+            c = mac.copy()
+            for i in range(0, len(test['data']), 7):
+                c.update(test['data'][i:i+7])
+            self.assertEqual(c.digest(), test['sha256'])
+            self.assertEqual(c.hexdigest(), test['sha256'].hex())
+            self.assertEqual(mac.digest(), hmac_sha256(test['key'], b''))
+            self.assertEqual(HMAC(test['key'], test['data']).digest(),
+                             test['sha256'])
+
+    def test_stream(self):
+        key = b'key'
+        data = bytes(range(256)) * 1000
+        expected = hmac_sha256(key, data)
+        chunk_size = hmac_sha256_module.CHUNK_SIZE
+        hmac_sha256_module.CHUNK_SIZE = 1000
+        try:
+            sources = [lambda: bytearray(data), lambda: memoryview(data),
+                       lambda: io.BytesIO(data),
+                       lambda: io.BufferedReader(io.BytesIO(data)),
+                       lambda: [data[i:i+999]
+                                for i in range(0, len(data), 999)],
+                       lambda: (data[i:i+10]
+                                for i in range(0, len(data), 10))]
+            for source in sources:
+                self.assertEqual(hmac_sha256(key, source()), expected)
+                self.assertEqual(HMAC(key).update(source()).digest(),
+                                 expected)
+        finally:
+            hmac_sha256_module.CHUNK_SIZE = chunk_size
+        m = mmap.mmap(-1, len(data))
+        m.write(data)
+        self.assertEqual(hmac_sha256(key, m), expected)
+        m.close()
+
+    def test_hmac_file(self):
+        key = b'key'
+        data = os.urandom(100000)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data')
+            for content in [data, b'']:
+                with open(path, 'wb') as f:
+                    f.write(content)
+                self.assertEqual(hmac_file(key, path),
+                                 hmac_sha256(key, content))
+                with open(path, 'rb') as f:
+                    self.assertEqual(hmac_sha256(key, f),
+                                     hmac_sha256(key, content))
+
+    def test_key_length(self):
+        # only keys longer than the 64 byte block are hashed
+        for n in [32, 33, 63, 64, 65, 100]:
+            key = bytes(range(n))
+            k = key if n <= 64 else hashlib.sha256(key).digest()
+            k = k.ljust(64, b'\x00')
+            inner = hashlib.sha256(bytes(b ^ 0x36 for b in k) + b'data')
+            expected = hashlib.sha256(bytes(b ^ 0x5c for b in k) +
+                                      inner.digest()).digest()
+            self.assertEqual(hmac_sha256(key, b'data'), expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,69 @@
+import hashlib
+import unittest
+from hmac.kdf import pbkdf2_sha256
+from hmac.kdf import hkdf_extract
+from hmac.kdf import hkdf_sha256
+
+# PBKDF2-HMAC-SHA256 with the RFC 6070 inputs
+pbkdf2_vectors = [
+    (b'password', b'salt', 1, 32,
+     '120fb6cffcf8b32c43e7225256c4f837a86548c92ccc35480805987cb70be17b'),
+    (b'password', b'salt', 2, 32,
+     'ae4d0c95af6b46d32d0adff928f06dd02a303f8ef3c251dfd6e2d85a95474c43'),
+    (b'password', b'salt', 4096, 32,
+     'c5e478d59288c841aa530db6845c4c8d962893a001ce4e11a4963873aa98134a'),
+    (b'passwordPASSWORDpassword',
+     b'saltSALTsaltSALTsaltSALTsaltSALTsalt', 4096, 40,
+     '348c89dbcbd32b2f32d814b8116e84cf2b17347ebc1800181c4e2a1fb8dd53e1'
+     'c635518c7dac47e9'),
+    (b'pass\x00word', b'sa\x00lt', 4096, 16,
+     '89b69d0516f829893c696226650a8687'),
+]
+
+# RFC 5869 A.1 - A.3
+hkdf_vectors = [
+    (bytes.fromhex('0b' * 22), bytes.fromhex('000102030405060708090a0b0c'),
+     bytes.fromhex('f0f1f2f3f4f5f6f7f8f9'), 42,
+     '077709362c2e32df0ddc3f0dc47bba6390b6c73bb50f9c3122ec844ad7c2b3e5',
+     '3cb25f25faacd57a90434f64d0362f2a2d2d0a90cf1a5a4c5db02d56ecc4c5bf'
+     '34007208d5b887185865'),
+    (bytes(range(0x00, 0x50)), bytes(range(0x60, 0xb0)),
+     bytes(range(0xb0, 0x100)), 82,
+     '06a6b88c5853361a06104c9ceb35b45cef760014904671014a193f40c15fc244',
+     'b11e398dc80327a1c8e7f78c596a49344f012eda2d4efad8a050cc4c19afa97c'
+     '59045a99cac7827271cb41c65e590e09da3275600c2f09b8367793a9aca3db71'
+     'cc30c58179ec3e87c14c01d5c1f3434f1d87'),
+    (bytes.fromhex('0b' * 22), b'', b'', 42,
+     '19ef24a32c717b167f33a91d6f648bdf96596776afdb6377ac434c1c293ccb04',
+     '8da4e775a563c18f715f802a063c5a31b8a11f5c5ee1879ec3454e5f3c738d2d'
+     '9d201395faa4b61a96c8'),
+]
+
+
+class TestKdf(unittest.TestCase):
+    def test_pbkdf2(self):
+        for password, salt, c, dklen, dk in pbkdf2_vectors:
+            self.assertEqual(pbkdf2_sha256(password, salt, c, dklen).hex(),
+                             dk)
+        for n in [1, 31, 32, 33, 100]:
+            self.assertEqual(pbkdf2_sha256(b'p' * 70, b'salt', 3, n),
+                             hashlib.pbkdf2_hmac('sha256', b'p' * 70,
+                                                 b'salt', 3, n))
+        self.assertEqual(len(pbkdf2_sha256(b'p', b's', 1)), 32)
+        with self.assertRaises(ValueError):
+            pbkdf2_sha256(b'p', b's', 0)
+        with self.assertRaises(ValueError):
+            pbkdf2_sha256(b'p', b's', 1, 0)
+
+    def test_hkdf(self):
+        for ikm, salt, info, length, prk, okm in hkdf_vectors:
+            self.assertEqual(hkdf_extract(salt, ikm).hex(), prk)
+            self.assertEqual(hkdf_sha256(ikm, salt, info, length).hex(), okm)
+        self.assertEqual(hkdf_sha256(b'k', length=0), b'')
+        self.assertEqual(len(hkdf_sha256(b'k', length=255 * 32)), 255 * 32)
+        with self.assertRaises(ValueError):
+            hkdf_sha256(b'k', length=255 * 32 + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from msm.msm import multi_scalar_mul
+from msm.msm import shamir
+from msm.msm import straus
+from msm.msm import pippenger
+from ed25519.ed25519 import Ed25519P
+from ed25519.ed25519 import B
+from ipynb.ecc import G
+from ipynb.ecc import S256P
+
+
+class TestMultiScalarMul(unittest.TestCase):
+    def test_ed25519(self):
+        L = Ed25519P.L
+        points = [(7**i) * B.extended() for i in range(1, 80)]
+        scalars = [(13**(i*7)) % L for i in range(1, 80)]
+        expect = None
+        for s, P in zip(scalars, points):
+            expect = s*P if expect is None else expect + s*P
+        self.assertTrue(pippenger(scalars, points) == expect)
+        self.assertTrue(straus(scalars, points) == expect)
+        self.assertTrue(multi_scalar_mul(scalars, points) == expect)
+        self.assertTrue(multi_scalar_mul(scalars[:5], points[:5]) ==
+                        straus(scalars[:5], points[:5]))
+        self.assertTrue(shamir(scalars[:2], points[:2]) ==
+                        straus(scalars[:2], points[:2]))
+        return
+
+    def test_ed25519_affine(self):
+        self.assertEqual(multi_scalar_mul([3, 4], [B, 2 * B]), 11 * B)
+        self.assertEqual(multi_scalar_mul([0, 0], [B, B]), Ed25519P(0, 1))
+        return
+
+    def test_s256(self):
+        P = 5 * G
+        Q = 11 * G
+        R = multi_scalar_mul([3, 7], [P, Q])
+        self.assertEqual(R.x.num, (92 * G).x.num)
+        R = multi_scalar_mul([2, 1, 9], [G, P, Q])
+        self.assertEqual(R.x.num, (106 * G).x.num)
+        R = multi_scalar_mul([S256P.N - 1, 1], [G, G])
+        self.assertIsNone(R.x)
+        return
+
+    def test_s256_dispatch(self):
+        calls = []
+
+        class CountingP(S256P):
+            @classmethod
+            def multi_mul(cls, coefficients, points):
+                calls.append(len(points))
+                return S256P.multi_mul(coefficients, points)
+
+        P = CountingP.jacobian(G.X, G.Y, G.Z)
+        Q = CountingP.jacobian((7 * G).X, (7 * G).Y, (7 * G).Z)
+        self.assertEqual(multi_scalar_mul([3, 2], [P, Q]), 17 * G)
+        self.assertEqual(calls, [2])
+        return
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            multi_scalar_mul([], [])
+        with self.assertRaises(ValueError):
+            multi_scalar_mul([1], [B, B])
+        with self.assertRaises(ValueError):
+            multi_scalar_mul([-1, 1], [B, B])
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
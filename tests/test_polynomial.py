@@ -0,0 +1,104 @@
+import random
+import unittest
+import ipynb.polynomial as polynomial
+from ipynb.ff import FiniteField
+from ipynb.polynomial import Polynomial
+
+# 998244353 = 119 * 2^23 + 1 supports the number-theoretic transform
+NTT_PRIME = 998244353
+PRIME = 9999991
+
+
+def schoolbook(a, b, p):
+    r = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            r[i + j] = (r[i + j] + x * y) % p
+    return Polynomial(r, p)
+
+
+class TestPolynomial(unittest.TestCase):
+    def test_add_sub(self):
+        a = Polynomial([1, 2, 3], 31)
+        b = Polynomial([30, 29, 28, 5], 31)
+        self.assertEqual(a + b, Polynomial([0, 0, 0, 5], 31))
+        self.assertEqual(a - a, Polynomial([], 31))
+        self.assertEqual((a - a).degree(), -1)
+        self.assertEqual(-a + a, Polynomial([0], 31))
+        self.assertEqual(a + 5, Polynomial([6, 2, 3], 31))
+        with self.assertRaises(TypeError):
+            a + Polynomial([1], 37)
+
+    def test_mul(self):
+        for p in [PRIME, NTT_PRIME]:
+            for la, lb in [(1, 1), (3, 7), (40, 35), (150, 140), (300, 20)]:
+                a = [random.randrange(p) for _ in range(la)]
+                b = [random.randrange(p) for _ in range(lb)]
+                self.assertEqual(Polynomial(a, p) * Polynomial(b, p),
+                                 schoolbook(a, b, p))
+        a = Polynomial([1, 2], 31)
+        self.assertEqual(3 * a, Polynomial([3, 6], 31))
+        self.assertEqual(a * FiniteField(2, 31), Polynomial([2, 4], 31))
+
+    def test_ntt(self):
+        p = NTT_PRIME
+        a = [random.randrange(p) for _ in range(200)]
+        b = [random.randrange(p) for _ in range(300)]
+        self.assertEqual(Polynomial(polynomial._ntt_mul(a, b, p), p),
+                         schoolbook(a, b, p))
+
+    def test_divmod(self):
+        for p in [31, PRIME, NTT_PRIME]:
+            for la, lb in [(5, 7), (10, 3), (200, 100), (300, 150)]:
+                a = Polynomial([random.randrange(p) for _ in range(la)], p)
+                b = Polynomial([random.randrange(p) for _ in range(lb - 1)]
+                               + [random.randrange(1, p)], p)
+                q, r = divmod(a, b)
+                self.assertEqual(q * b + r, a)
+                self.assertLess(r.degree(), b.degree())
+                self.assertEqual(a // b, q)
+                self.assertEqual(a % b, r)
+        with self.assertRaises(ZeroDivisionError):
+            divmod(Polynomial([1], 31), Polynomial([0], 31))
+
+    def test_evaluate(self):
+        f = Polynomial([3, 0, 5, 1], 31)
+        self.assertEqual(f(2), FiniteField(0, 31))
+        self.assertEqual(f.evaluate(FiniteField(30, 31)), FiniteField(7, 31))
+        self.assertEqual(f.derivative(), Polynomial([0, 10, 3], 31))
+
+    def test_evaluate_many(self):
+        threshold = polynomial.TREE_THRESHOLD
+        try:
+            for t in [threshold, 40]:
+                polynomial.TREE_THRESHOLD = t
+                for p in [PRIME, NTT_PRIME]:
+                    f = Polynomial([random.randrange(p) for _ in range(150)],
+                                   p)
+                    xs = random.sample(range(p), 200)
+                    self.assertEqual(f.evaluate_many(xs), [f(x) for x in xs])
+        finally:
+            polynomial.TREE_THRESHOLD = threshold
+
+    def test_interpolate(self):
+        for p in [PRIME, NTT_PRIME]:
+            for n in [1, 2, 10, 100]:
+                xs = random.sample(range(p), n)
+                ys = [random.randrange(p) for _ in range(n)]
+                f = Polynomial.interpolate(xs, ys, p)
+                self.assertLess(f.degree(), n)
+                self.assertEqual([y.num for y in f.evaluate_many(xs)], ys)
+        with self.assertRaises(ValueError):
+            Polynomial.interpolate([1, 1], [2, 3], 31)
+
+    def test_roots(self):
+        xs = [3, 7, 11, 20]
+        m = Polynomial.from_roots(xs, 31)
+        self.assertEqual(m.degree(), 4)
+        self.assertEqual([v.num for v in m.evaluate_many(xs)], [0] * 4)
+        d = Polynomial.root_derivatives(xs, 31)
+        self.assertEqual(d, m.derivative().evaluate_many(xs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import random
+import unittest
+from ipynb.sss import share
+from ipynb.sss import recover
+from ipynb.sss import evaluate
+from ipynb.sss import lagrange_weights
+
+
+def lagrange(p, u):
+    # SecretSharingDemo.ipynb
+    s = 0
+    for i in range(len(u)):
+        t = u[i][1]
+        for j in range(len(u)):
+            if i != j:
+                t *= u[j][0]*pow(u[j][0]-u[i][0], p-2, p)
+        s += t % p
+        s = s % p
+    return s
+
+
+class TestSecretSharing(unittest.TestCase):
+    def test_evaluate(self):
+        p = 31
+        a = [3, 0, 5, 1]
+        self.assertEqual(evaluate(a, [0, 1, 2, 30], p), [3, 9, 0, 7])
+        return
+
+    def test_share_recover(self):
+        p = 9999991
+        for n, m in [(10, 5), (10, 10), (10, 1), (50, 17)]:
+            secret = random.randrange(p)
+            shares = share(secret, n, m, p)
+            self.assertEqual(len(shares), n)
+            u = random.sample(shares, m)
+            self.assertEqual(recover(u, p), secret)
+            self.assertEqual(lagrange(p, u), secret)
+            if m > 1:
+                self.assertNotEqual(recover(u[1:], p), secret)
+        return
+
+    def test_weights(self):
+        p = 9999991
+        secret = 1234567
+        shares = share(secret, 20, 5, p)
+        weights = lagrange_weights([1, 4, 9, 16, 20], p)
+        u = [shares[x - 1] for x in [1, 4, 9, 16, 20]]
+        self.assertEqual(recover(u, p, weights), secret)
+        return
+
+    def test_invalid(self):
+        p = 31
+        with self.assertRaises(ValueError):
+            share(1, 3, 4, p)
+        with self.assertRaises(ValueError):
+            share(1, 31, 4, p)
+        with self.assertRaises(ValueError):
+            share(31, 5, 4, p)
+        with self.assertRaises(ValueError):
+            recover([(1, 2), (1, 3)], p)
+        with self.assertRaises(ValueError):
+            recover([(31, 2), (1, 3)], p)
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()